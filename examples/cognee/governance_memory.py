@@ -295,6 +295,7 @@ async def example_4_review_precedent():
         decision="approved",
         rationale="Direct integration approved due to critical priority and existing security framework",
     )
+    await client.flush_pending()
     print("\n✓ Learned from new review decision")
 
 
@@ -5,6 +5,7 @@ as defined in the PIPE AgenticAI Governance Architecture.
 """
 
 import logging
+from collections import Counter
 from typing import Dict, Any, List, Optional, Set
 from datetime import datetime
 from enum import Enum
@@ -56,6 +57,12 @@ class DomainRegistry:
         self.integrations: Dict[str, Dict[str, Any]] = {}
         self.connection_matrix: Dict[str, Set[str]] = {}
 
+        # Integration status index, kept in sync on every status transition
+        self._status_counts: Counter = Counter()
+        self._by_status: Dict[IntegrationStatus, Dict[str, None]] = {
+            status: {} for status in IntegrationStatus
+        }
+
         # Initialize registry with supported domains
         self._initialize_domains()
 
@@ -132,6 +139,10 @@ class DomainRegistry:
 
         integration_id = f"{source_domain}-{target_domain}-{integration_type}"
 
+        existing = self.integrations.get(integration_id)
+        if existing:
+            self._unindex_status(integration_id, existing["status"])
+
         self.integrations[integration_id] = {
             "id": integration_id,
             "source": source_domain,
@@ -143,6 +154,7 @@ class DomainRegistry:
             "config": config or {},
             "metrics": {"message_count": 0, "error_count": 0, "last_success": None},
         }
+        self._index_status(integration_id, IntegrationStatus.INITIALIZING)
 
         # Update connection matrix
         self.connection_matrix[source_domain].add(target_domain)
@@ -170,7 +182,11 @@ class DomainRegistry:
             self.logger.error(f"Integration not found: {integration_id}")
             return False
 
+        self._unindex_status(
+            integration_id, self.integrations[integration_id]["status"]
+        )
         self.integrations[integration_id]["status"] = status
+        self._index_status(integration_id, status)
         self.integrations[integration_id][
             "last_health_check"
         ] = datetime.now().isoformat()
@@ -180,6 +196,20 @@ class DomainRegistry:
         )
         return True
 
+    def _index_status(self, integration_id: str, status: IntegrationStatus) -> None:
+        """Add an integration to the status index."""
+        self._status_counts[status.value] += 1
+        self._by_status[status][integration_id] = None
+
+    def _unindex_status(self, integration_id: str, status: IntegrationStatus) -> None:
+        """Remove an integration from the status index."""
+        self._status_counts[status.value] -= 1
+        self._by_status[status].pop(integration_id, None)
+
+    def get_integration_status_counts(self) -> Dict[str, int]:
+        """Get the number of integrations per status value."""
+        return {status: count for status, count in self._status_counts.items() if count}
+
     def get_domain_info(self, domain_code: str) -> Optional[Dict[str, Any]]:
         """Get information about a specific domain."""
         return self.domains.get(domain_code)
@@ -200,6 +230,14 @@ class DomainRegistry:
             if domain["status"] == DomainStatus.ACTIVE
         ]
 
+    def list_active_domain_infos(self) -> List[Dict[str, Any]]:
+        """Get info records for all active domains, tagged with their code."""
+        return [
+            {"domain_code": code, **domain}
+            for code, domain in self.domains.items()
+            if domain["status"] == DomainStatus.ACTIVE
+        ]
+
     def list_integrations(
         self, domain_code: str = None, status: IntegrationStatus = None
     ) -> List[Dict[str, Any]]:
@@ -213,6 +251,9 @@ class DomainRegistry:
         Returns:
             List of integration records
         """
+        if status and not domain_code:
+            return [self.integrations[i] for i in self._by_status[status]]
+
         integrations = list(self.integrations.values())
 
         if domain_code:
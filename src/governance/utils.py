@@ -7,19 +7,60 @@ batch operations, data export/import, validation, and report generation.
 
 import json
 import logging
-from typing import Dict, Any, List, Optional
+from collections.abc import ValuesView
+from typing import Dict, Any, Final, Mapping, Optional, Sequence, Tuple
 from datetime import datetime
+from enum import Enum
 from pathlib import Path
+from types import MappingProxyType
 
 from .governance_manager import GovernanceManager
+from .domain_registry import IntegrationStatus
 from .review_pipeline import ReviewStatus
 
+try:
+    import msgpack
+
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
 
 logger = logging.getLogger("pipe.governance.utils")
 
+# Canonical demo environment used by quick_setup_demo_environment
+DEMO_DOMAINS: Final[Mapping[str, Tuple[str, ...]]] = MappingProxyType(
+    {
+        "BNI": ("authentication", "user_management", "access_control"),
+        "BNP": ("business_services", "data_processing", "api_gateway"),
+        "AXIS": ("architecture_governance", "integration_patterns", "service_mesh"),
+    }
+)
+
+DEMO_INTEGRATIONS: Final[Tuple[Mapping[str, str], ...]] = (
+    MappingProxyType(
+        {
+            "source": "BNI",
+            "target": "BNP",
+            "type": "api",
+            "description": "Connect BNI authentication to BNP services",
+            "priority": "high",
+        }
+    ),
+    MappingProxyType(
+        {
+            "source": "BNP",
+            "target": "AXIS",
+            "type": "event",
+            "description": "Event-driven architecture sync",
+            "priority": "medium",
+        }
+    ),
+)
+
 
 async def batch_register_domains(
-    governance: GovernanceManager, domains_config: Dict[str, List[str]]
+    governance: GovernanceManager, domains_config: Mapping[str, Sequence[str]]
 ) -> Dict[str, Any]:
     """
     Register multiple domains at once.
@@ -62,7 +103,7 @@ async def batch_register_domains(
 
 
 async def batch_request_integrations(
-    governance: GovernanceManager, integrations: List[Dict[str, Any]]
+    governance: GovernanceManager, integrations: Sequence[Mapping[str, Any]]
 ) -> Dict[str, Any]:
     """
     Request multiple integrations at once.
@@ -104,40 +145,34 @@ async def batch_request_integrations(
                 description=integration.get("description", ""),
                 priority=integration.get("priority", "medium"),
             )
-
-            if result["success"]:
-                results["successful"].append(
-                    {
-                        "source": integration["source"],
-                        "target": integration["target"],
-                        "integration_id": result["integration_id"],
-                        "review_id": result["review_id"],
-                    }
-                )
-                logger.info(
-                    f"Integration requested: {integration['source']} → {integration['target']}"
-                )
-            else:
-                results["failed"].append(
-                    {
-                        "source": integration["source"],
-                        "target": integration["target"],
-                        "error": result.get("error"),
-                    }
-                )
-                logger.error(
-                    f"Failed integration: {integration['source']} → {integration['target']}"
-                )
-
         except Exception as e:
+            logger.error(f"Exception requesting integration: {str(e)}")
+            result = {"success": False, "error": str(e)}
+
+        if result["success"]:
+            results["successful"].append(
+                {
+                    "source": integration["source"],
+                    "target": integration["target"],
+                    "integration_id": result["integration_id"],
+                    "review_id": result["review_id"],
+                }
+            )
+            logger.info(
+                f"Integration requested: {integration['source']} → {integration['target']}"
+            )
+        else:
             results["failed"].append(
                 {
                     "source": integration.get("source"),
                     "target": integration.get("target"),
-                    "error": str(e),
+                    "error": result.get("error"),
                 }
             )
-            logger.error(f"Exception requesting integration: {str(e)}")
+            logger.error(
+                f"Failed integration: {integration.get('source')} → "
+                f"{integration.get('target')}"
+            )
 
     results["success_count"] = len(results["successful"])
     results["failure_count"] = len(results["failed"])
@@ -146,31 +181,39 @@ async def batch_request_integrations(
 
 
 def export_governance_state(
-    governance: GovernanceManager, output_path: Path
+    governance: GovernanceManager, output_path: Path, format: str = "json"
 ) -> Dict[str, Any]:
     """
-    Export complete governance state to JSON file.
+    Export complete governance state to JSON or msgpack file.
+
+    JSON is the default and is meant for human-readable dumps. Use
+    ``format="msgpack"`` for machine-consumed backups; the file is written
+    with a ``.msgpack`` suffix and is considerably smaller and faster to load.
 
     Args:
         governance: GovernanceManager instance
-        output_path: Path to output JSON file
+        output_path: Path to output file
+        format: Output format ("json" or "msgpack")
 
     Returns:
         Export summary
 
     Example:
         export_governance_state(governance, Path("governance_backup.json"))
+        export_governance_state(
+            governance, Path("governance_backup"), format="msgpack"
+        )
     """
     try:
+        if format not in ("json", "msgpack"):
+            raise ValueError(f"Unsupported export format: {format}")
+        if format == "msgpack" and not MSGPACK_AVAILABLE:
+            raise ImportError(
+                "msgpack is not installed. Install with: pip install msgpack"
+            )
+
         # Collect all governance data
-        active_domains = governance.domain_registry.list_active_domains()
-        domain_details = [
-            {
-                "domain_code": code,
-                **governance.domain_registry.get_domain_info(code),
-            }
-            for code in active_domains
-        ]
+        domain_details = governance.domain_registry.list_active_domain_infos()
 
         state = {
             "exported_at": datetime.now().isoformat(),
@@ -185,7 +228,7 @@ def export_governance_state(
                 }
                 for rid, review in governance.review_pipeline.reviews.items()
             ],
-            "compliance_records": list(
+            "compliance_records": (
                 governance.compliance_tracker.compliance_records.values()
             ),
             "dashboard": governance.get_governance_dashboard(),
@@ -196,8 +239,13 @@ def export_governance_state(
 
         # Write to file
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w") as f:
-            json.dump(state, f, indent=2)
+        if format == "msgpack":
+            output_path = output_path.with_suffix(".msgpack")
+            with open(output_path, "wb") as f:
+                f.write(msgpack.packb(state, use_bin_type=True))
+        else:
+            with open(output_path, "w") as f:
+                json.dump(state, f, indent=2)
 
         logger.info(f"Exported governance state to {output_path}")
 
@@ -461,29 +509,24 @@ def get_integration_health_status(governance: GovernanceManager) -> Dict[str, An
         health = get_integration_health_status(governance)
         print(f"Health Score: {health['health_score']}/100")
     """
-    integrations = governance.domain_registry.list_integrations()
+    registry = governance.domain_registry
     reviews = list(governance.review_pipeline.reviews.values())
 
     status_counts = {"connected": 0, "pending": 0, "degraded": 0, "disconnected": 0}
+    status_counts.update(registry.get_integration_status_counts())
 
-    degraded_integrations = []
-
-    for integration in integrations:
-        status = integration["status"].value
-        status_counts[status] = status_counts.get(status, 0) + 1
-
-        if status == "degraded":
-            degraded_integrations.append(
-                {
-                    "id": integration["id"],
-                    "source": integration["source"],
-                    "target": integration["target"],
-                    "type": integration["type"],
-                }
-            )
+    degraded_integrations = [
+        {
+            "id": integration["id"],
+            "source": integration["source"],
+            "target": integration["target"],
+            "type": integration["type"],
+        }
+        for integration in registry.list_integrations(status=IntegrationStatus.DEGRADED)
+    ]
 
     # Calculate health score (0-100)
-    total = len(integrations)
+    total = len(registry.integrations)
     if total == 0:
         health_score = 100
     else:
@@ -519,14 +562,19 @@ def _serialize_for_json(obj: Any) -> Any:
     Returns:
         JSON-serializable version of object
     """
-    if hasattr(obj, "value"):  # Enum
-        return obj.value
+    # Primitives dominate exported state, so test them first
+    if isinstance(obj, (str, int, float, bool, type(None))):
+        return obj
     elif isinstance(obj, dict):
         return {k: _serialize_for_json(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
+    elif isinstance(obj, (list, tuple, ValuesView)):
         return [_serialize_for_json(item) for item in obj]
     elif isinstance(obj, set):
         return list(obj)
+    elif isinstance(obj, Enum):
+        return obj.value
+    elif isinstance(obj, datetime):
+        return obj.isoformat()
     else:
         return obj
 
@@ -550,37 +598,12 @@ async def quick_setup_demo_environment(governance: GovernanceManager) -> Dict[st
     """
     logger.info("Setting up demo environment")
 
-    # Define demo domains
-    demo_domains = {
-        "BNI": ["authentication", "user_management", "access_control"],
-        "BNP": ["business_services", "data_processing", "api_gateway"],
-        "AXIS": ["architecture_governance", "integration_patterns", "service_mesh"],
-    }
-
     # Register domains
-    domain_results = await batch_register_domains(governance, demo_domains)
-
-    # Define demo integrations
-    demo_integrations = [
-        {
-            "source": "BNI",
-            "target": "BNP",
-            "type": "api",
-            "description": "Connect BNI authentication to BNP services",
-            "priority": "high",
-        },
-        {
-            "source": "BNP",
-            "target": "AXIS",
-            "type": "event",
-            "description": "Event-driven architecture sync",
-            "priority": "medium",
-        },
-    ]
+    domain_results = await batch_register_domains(governance, DEMO_DOMAINS)
 
     # Request integrations
     integration_results = await batch_request_integrations(
-        governance, demo_integrations
+        governance, DEMO_INTEGRATIONS
     )
 
     return {
@@ -12,11 +12,17 @@ This enables:
 - Contextual memory for compliance tracking
 """
 
+import asyncio
+import functools
 import logging
 import os
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from enum import Enum
 
+from ..governance.datapoints import DataPoint, review_to_datapoint
+from ..utils.cache import TTLCache
+from ..utils.locks import LazyAsyncLock
+
 try:
     import cognee
     from cognee import add, cognify, search
@@ -34,6 +40,56 @@ class SearchMode(Enum):
     DEFAULT = "default"  # Hybrid search
 
 
+# Search type strings passed to cognee.search, resolved once
+_SEARCH_MODE_VALUES: Dict[SearchMode, str] = {mode: mode.value for mode in SearchMode}
+
+# Vector collection holding document chunk embeddings
+_CHUNK_COLLECTION = "DocumentChunk_text"
+
+# Query templates for the fixed-prefix governance searches
+_QUERY_TEMPLATES: Dict[str, str] = {
+    "compliance": "compliance issues similar to: {0}",
+    "compliance_in_domain": "compliance issues similar to: {0} in domain {1}",
+    "integration_patterns": "integration patterns: {0}",
+    "integration_path": "successful integration patterns from {0} to {1}",
+    "domain_context": "everything about domain {0}",
+}
+
+# Provider settings last written to the environment, shared by all clients
+_applied_settings: Optional[Tuple[str, str, str, str]] = None
+
+
+@functools.lru_cache(maxsize=2048)
+def _canonicalize_query(template_id: str, payload: Tuple[str, ...]) -> str:
+    """
+    Build a search query from a template with whitespace-normalized values.
+
+    Recurring queries that differ only in spacing map to the same string,
+    so they share a search cache entry instead of being re-embedded.
+    """
+    values = (" ".join(value.split()) for value in payload)
+    return _QUERY_TEMPLATES[template_id].format(*values)
+
+
+def _similarity(result: Any) -> Optional[float]:
+    """
+    Return a similarity in (0, 1] for a search result that carries a distance.
+
+    Vector results report a distance, where lower is closer: ``_distance``
+    from LanceDB rows and ``score`` from cognee's vector engine. It is
+    mapped to ``1 / (1 + distance)`` so higher means more similar. Graph
+    insight results carry no distance and return None.
+    """
+    if not isinstance(result, dict):
+        return None
+    distance = result.get("_distance")
+    if distance is None:
+        distance = result.get("score")
+    if distance is None:
+        return None
+    return 1.0 / (1.0 + max(float(distance), 0.0))
+
+
 class CogneeClient:
     """
     Client for Cognee AI memory integration with PIPE.
@@ -48,6 +104,18 @@ class CogneeClient:
         llm_model: str = "gpt-4",
         vector_db_provider: str = "lancedb",
         graph_db_provider: str = "networkx",
+        batch_size: int = 32,
+        flush_interval: float = 5.0,
+        search_cache_size: int = 512,
+        search_cache_ttl: float = 300.0,
+        vector_index_type: Optional[str] = "IVF_HNSW",
+        quantization: Optional[str] = "int8",
+        index_num_partitions: Optional[int] = None,
+        index_num_sub_vectors: Optional[int] = None,
+        index_m: int = 20,
+        index_ef_construction: int = 300,
+        index_rebuild_threshold: int = 1000,
+        warmup: bool = True,
     ):
         """
         Initialize Cognee client.
@@ -57,6 +125,18 @@ class CogneeClient:
             llm_model: Model name (gpt-4, claude-3-opus, etc.)
             vector_db_provider: Vector store (lancedb, qdrant, weaviate)
             graph_db_provider: Graph store (networkx, neo4j, falkordb)
+            batch_size: Staged items that trigger an immediate flush
+            flush_interval: Seconds before staged items are flushed anyway
+            search_cache_size: Maximum cached search results
+            search_cache_ttl: Seconds a cached search result stays valid
+            vector_index_type: LanceDB ANN index (IVF_HNSW, IVF or None)
+            quantization: Stored vector encoding (int8, pq or None for fp32)
+            index_num_partitions: IVF partitions (default: sqrt of row count)
+            index_num_sub_vectors: PQ sub-vectors (default: dimension / 16)
+            index_m: HNSW neighbours per node
+            index_ef_construction: HNSW candidate list size while building
+            index_rebuild_threshold: Items added before the index is rebuilt
+            warmup: Prime the vector/graph store caches after configuring
         """
         if not COGNEE_AVAILABLE:
             raise ImportError(
@@ -72,32 +152,99 @@ class CogneeClient:
         self.graph_db_provider = graph_db_provider
 
         self._configured = False
+        self._config_lock = asyncio.Lock()
+
+        # Staged governance data, flushed in one add() + cognify() pass
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._pending: List[Any] = []
+        self._flush_task: Optional[asyncio.Task] = None
+
+        # Search results, invalidated whenever memory contents change
+        self._search_cache = TTLCache(maxsize=search_cache_size, ttl=search_cache_ttl)
+
+        # ANN index settings; without an index LanceDB scans every vector
+        self.vector_index_type = vector_index_type
+        self.quantization = quantization
+        self.index_num_partitions = index_num_partitions
+        self.index_num_sub_vectors = index_num_sub_vectors
+        self.index_m = index_m
+        self.index_ef_construction = index_ef_construction
+        self.index_rebuild_threshold = index_rebuild_threshold
+        self._added_since_index = 0
+
+        self.warmup = warmup
+        self._warmup_task: Optional[asyncio.Task] = None
 
     async def configure(self) -> bool:
         """
         Configure Cognee with PIPE settings.
 
+        Environment variables are only written when they differ from the
+        settings already applied in this process; later calls on a
+        configured client return immediately.
+
         Returns:
             True if configuration successful
         """
-        try:
-            # Set LLM configuration
-            os.environ["LLM_PROVIDER"] = self.llm_provider
-            os.environ["LLM_MODEL"] = self.llm_model
+        if self._configured:
+            return True
 
-            # Set vector DB configuration
-            os.environ["VECTOR_DB_PROVIDER"] = self.vector_db_provider
+        async with self._config_lock:
+            if self._configured:
+                return True
 
-            # Set graph DB configuration
-            os.environ["GRAPH_DB_PROVIDER"] = self.graph_db_provider
+            global _applied_settings
+            settings = (
+                self.llm_provider,
+                self.llm_model,
+                self.vector_db_provider,
+                self.graph_db_provider,
+            )
 
-            self._configured = True
-            self.logger.info("Cognee configured successfully")
-            return True
+            try:
+                if settings != _applied_settings:
+                    # Set LLM configuration
+                    os.environ["LLM_PROVIDER"] = self.llm_provider
+                    os.environ["LLM_MODEL"] = self.llm_model
 
-        except Exception as e:
-            self.logger.error(f"Failed to configure Cognee: {str(e)}")
-            return False
+                    # Set vector DB configuration
+                    os.environ["VECTOR_DB_PROVIDER"] = self.vector_db_provider
+
+                    # Set graph DB configuration
+                    os.environ["GRAPH_DB_PROVIDER"] = self.graph_db_provider
+
+                    _applied_settings = settings
+
+                self._configured = True
+                self.logger.info("Cognee configured successfully")
+
+                if self.warmup:
+                    self._warmup_task = asyncio.create_task(self._warmup())
+
+                return True
+
+            except Exception as e:
+                self.logger.error(f"Failed to configure Cognee: {str(e)}")
+                return False
+
+    async def _warmup(self) -> None:
+        """
+        Issue a throwaway probe per search mode in the background.
+
+        The first search after process start otherwise pays the full cold
+        I/O cost of loading index and graph pages from disk.
+        """
+        for mode in SearchMode:
+            try:
+                if mode is SearchMode.CHUNKS:
+                    await self._vector_search("_warmup_probe_", 1)
+                else:
+                    await search("_warmup_probe_", search_type=_SEARCH_MODE_VALUES[mode])
+            except Exception as e:
+                self.logger.debug(f"Warmup probe for {mode.value} failed: {str(e)}")
+
+        self.logger.info("Cognee stores warmed up")
 
     async def add_governance_data(self, data: Any) -> bool:
         """
@@ -117,6 +264,8 @@ class CogneeClient:
 
         try:
             await add(data)
+            self._search_cache.clear()
+            self._added_since_index += 1
             self.logger.info("Governance data added to Cognee")
             return True
 
@@ -124,6 +273,139 @@ class CogneeClient:
             self.logger.error(f"Failed to add governance data: {str(e)}")
             return False
 
+    async def add_governance_data_batch(self, data_list: List[Any]) -> bool:
+        """
+        Add several governance records to Cognee memory in one call.
+
+        Args:
+            data_list: Governance data items (text, dict, DataPoint, etc.)
+
+        Returns:
+            True if data added successfully
+        """
+        if not data_list:
+            return True
+
+        if not self._configured:
+            await self.configure()
+
+        try:
+            await add(data_list)
+            self._search_cache.clear()
+            self._added_since_index += len(data_list)
+            self.logger.info(f"Added {len(data_list)} governance items to Cognee")
+            return True
+
+        except Exception as e:
+            self.logger.error(f"Failed to add governance data batch: {str(e)}")
+            return False
+
+    async def stage_governance_data(self, data: Any) -> bool:
+        """
+        Stage governance data for a later batched add + cognify.
+
+        Staged items are flushed once ``batch_size`` items are pending or
+        ``flush_interval`` seconds after the first item was staged. Items
+        from a failed flush stay staged and are retried after another
+        interval.
+
+        Args:
+            data: Governance data (text, dict, DataPoint, etc.)
+
+        Returns:
+            True if data was staged; when it completed a batch, True only
+            if the batch was also flushed successfully
+        """
+        self._pending.append(data)
+
+        if len(self._pending) >= self.batch_size:
+            return await self.flush_pending()
+
+        self._schedule_flush()
+        return True
+
+    def _schedule_flush(self) -> None:
+        """Start the background flush unless one is already running."""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_after_interval())
+
+    async def _flush_after_interval(self) -> None:
+        """Flush staged data every flush interval until none is left."""
+        while self._pending:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush_pending()
+            except Exception:
+                self.logger.exception("Background flush of staged data failed")
+
+    async def flush_pending(self) -> bool:
+        """
+        Add all staged governance data and cognify it once.
+
+        Staged DataPoints are stored directly with ``add_data_points``;
+        only unstructured data goes through ``add`` and ``cognify``.
+        Items that could not be added are staged again. A failed cognify
+        is not retried here, since the added data is picked up by the
+        next successful cognify.
+
+        Returns:
+            True if the staged data was added and cognified successfully
+        """
+        if not self._pending:
+            return True
+
+        batch, self._pending = self._pending, []
+        datapoints = [item for item in batch if isinstance(item, DataPoint)]
+        documents = [item for item in batch if not isinstance(item, DataPoint)]
+
+        # Items not yet confirmed as added; requeued if the flush stops early
+        unsaved = batch
+        try:
+            if datapoints and not await self.add_datapoints(datapoints):
+                return False
+            unsaved = documents
+
+            if documents and not await self.add_governance_data_batch(documents):
+                return False
+            unsaved = []
+        finally:
+            if unsaved:
+                self._pending[:0] = unsaved
+                self.logger.warning(
+                    f"Flush failed; {len(unsaved)} governance items staged again"
+                )
+                self._schedule_flush()
+
+        if not documents:
+            return True
+
+        return await self.cognify_governance_data()
+
+    async def close(self) -> None:
+        """
+        Flush staged governance data and stop background tasks.
+
+        Items that still cannot be flushed are logged and dropped.
+        """
+        for task in (self._flush_task, self._warmup_task):
+            if task is not None and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+
+        await self.flush_pending()
+
+        if self._pending:
+            self.logger.error(
+                f"Dropping {len(self._pending)} staged governance items "
+                "that could not be flushed"
+            )
+            self._pending = []
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+
     async def cognify_governance_data(self) -> bool:
         """
         Build knowledge graph from governance data.
@@ -142,46 +424,196 @@ class CogneeClient:
 
         try:
             await cognify()
+            self._search_cache.clear()
             self.logger.info("Governance data cognified successfully")
-            return True
 
         except Exception as e:
             self.logger.error(f"Failed to cognify governance data: {str(e)}")
             return False
 
+        if self._added_since_index >= self.index_rebuild_threshold:
+            await self.build_vector_index()
+
+        return True
+
+    async def build_vector_index(self) -> bool:
+        """
+        Build (or rebuild) the ANN index on every LanceDB vector collection.
+
+        Only applies to the LanceDB vector store. Index build failures are
+        logged and leave the collections searchable by brute-force scan.
+
+        Returns:
+            True if the index was built
+        """
+        if self.vector_db_provider != "lancedb" or not self.vector_index_type:
+            return False
+
+        try:
+            from cognee.infrastructure.databases.vector import get_vector_engine
+            from lancedb import index as lance_index
+
+            vector_engine = get_vector_engine()
+            connection = await vector_engine.get_connection()
+            dimension = vector_engine.embedding_engine.get_vector_size()
+            num_sub_vectors = self.index_num_sub_vectors or max(1, dimension // 16)
+
+            for table_name in await connection.table_names():
+                table = await connection.open_table(table_name)
+                row_count = await table.count_rows()
+                # IVF training needs at least 256 rows
+                if row_count < 256:
+                    continue
+
+                num_partitions = self.index_num_partitions or max(
+                    1, int(row_count**0.5)
+                )
+                config = self._index_config(
+                    lance_index, num_partitions, num_sub_vectors
+                )
+
+                await table.create_index("vector", config=config, replace=True)
+
+            self._added_since_index = 0
+            self.logger.info(
+                f"Built {self.vector_index_type} vector index "
+                f"(quantization: {self.quantization or 'none'})"
+            )
+            return True
+
+        except Exception as e:
+            self.logger.warning(f"Failed to build vector index: {str(e)}")
+            return False
+
+    def _index_config(
+        self, lance_index: Any, num_partitions: int, num_sub_vectors: int
+    ) -> Any:
+        """
+        Build the LanceDB index config for the configured index type.
+
+        int8 scalar quantization stores a quarter of the fp32 bytes, pq
+        compresses further at some recall cost, and None keeps fp32 vectors.
+        """
+        hnsw = self.vector_index_type == "IVF_HNSW"
+        common = {"distance_type": "cosine", "num_partitions": num_partitions}
+        hnsw_params = {"m": self.index_m, "ef_construction": self.index_ef_construction}
+
+        if self.quantization == "int8":
+            if not hnsw:
+                raise ValueError("int8 quantization requires the IVF_HNSW index")
+            return lance_index.IvfHnswSq(**common, **hnsw_params)
+        if self.quantization == "pq":
+            if hnsw:
+                return lance_index.IvfHnswPq(
+                    **common, **hnsw_params, num_sub_vectors=num_sub_vectors
+                )
+            return lance_index.IvfPq(**common, num_sub_vectors=num_sub_vectors)
+        if self.quantization is None and not hnsw:
+            return lance_index.IvfFlat(**common)
+
+        raise ValueError(
+            f"Unsupported index: {self.vector_index_type} / {self.quantization}"
+        )
+
     async def search_integrations(
         self,
         query: str,
         search_mode: SearchMode = SearchMode.DEFAULT,
         limit: int = 10,
+        graph_depth: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """
         Search for integrations using semantic search + graph.
 
+        CHUNKS searches are pure vector similarity and go straight to the
+        vector store without graph expansion. Results are cached per
+        (query, mode, limit) until the cache TTL expires or memory contents
+        change.
+
         Args:
             query: Search query (e.g., "integrations similar to BNI-PIPE")
             search_mode: Search mode (chunks, insights, default)
             limit: Maximum results to return
+            graph_depth: 0 forces a vector-only search (default: CHUNKS only)
 
         Returns:
             List of search results with context
         """
+        search_type = _SEARCH_MODE_VALUES[search_mode]
+        if graph_depth is None:
+            vector_only = search_mode is SearchMode.CHUNKS
+        else:
+            vector_only = graph_depth == 0
+
+        cache_key = (query, search_type, limit, vector_only)
+        cached = self._search_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
+
         if not self._configured:
             await self.configure()
 
         try:
-            results = await search(
-                query,
-                search_type=search_mode.value,
-            )
+            if vector_only:
+                results = await self._vector_search(query, limit)
+            else:
+                results = await search(
+                    query,
+                    search_type=search_type,
+                )
 
             self.logger.info(f"Found {len(results)} results for: {query}")
-            return results[:limit]
+            results = results[:limit]
+            self._search_cache.set(cache_key, results)
+            return list(results)
 
         except Exception as e:
             self.logger.error(f"Search failed: {str(e)}")
             return []
 
+    async def _vector_search(self, query: str, limit: int) -> List[Dict[str, Any]]:
+        """Run a vector similarity search on document chunks, skipping the graph."""
+        from cognee.infrastructure.databases.vector import get_vector_engine
+
+        vector_engine = get_vector_engine()
+        results = await vector_engine.search(
+            _CHUNK_COLLECTION, query_text=query, limit=limit
+        )
+
+        return [
+            {"id": str(result.id), "score": result.score, **(result.payload or {})}
+            for result in results
+        ]
+
+    async def search_many(
+        self,
+        queries: List[str],
+        search_mode: SearchMode = SearchMode.DEFAULT,
+        limit: int = 10,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Run several searches as one batch.
+
+        Cached queries are answered directly; the remaining queries are
+        searched concurrently.
+
+        Args:
+            queries: Search queries
+            search_mode: Search mode (chunks, insights, default)
+            limit: Maximum results per query
+
+        Returns:
+            One result list per query, in input order
+        """
+        return list(
+            await asyncio.gather(
+                *(
+                    self.search_integrations(query, search_mode=search_mode, limit=limit)
+                    for query in queries
+                )
+            )
+        )
+
     async def find_similar_compliance_issues(
         self, issue_description: str, domain: str = None, limit: int = 5
     ) -> List[Dict[str, Any]]:
@@ -198,9 +630,12 @@ class CogneeClient:
         Returns:
             List of similar compliance issues with context
         """
-        query = f"compliance issues similar to: {issue_description}"
         if domain:
-            query += f" in domain {domain}"
+            query = _canonicalize_query(
+                "compliance_in_domain", (issue_description, domain)
+            )
+        else:
+            query = _canonicalize_query("compliance", (issue_description,))
 
         return await self.search_integrations(
             query, search_mode=SearchMode.INSIGHTS, limit=limit
@@ -219,7 +654,7 @@ class CogneeClient:
         Returns:
             List of matching integration patterns
         """
-        query = f"integration patterns: {pattern_description}"
+        query = _canonicalize_query("integration_patterns", (pattern_description,))
         return await self.search_integrations(
             query, search_mode=SearchMode.INSIGHTS, limit=limit
         )
@@ -240,15 +675,35 @@ class CogneeClient:
         Returns:
             Dictionary with domain context
         """
-        query = f"everything about domain {domain_code}"
-        results = await self.search_integrations(
-            query, search_mode=SearchMode.INSIGHTS, limit=20
+        contexts = await self.get_domain_contexts([domain_code])
+        return contexts[domain_code]
+
+    async def get_domain_contexts(
+        self, domain_codes: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get comprehensive context about several domains in one batch.
+
+        Args:
+            domain_codes: Domain codes (BNI, BNP, etc.)
+
+        Returns:
+            Dictionary mapping each domain code to its context
+        """
+        queries = [
+            _canonicalize_query("domain_context", (code,)) for code in domain_codes
+        ]
+        batch_results = await self.search_many(
+            queries, search_mode=SearchMode.INSIGHTS, limit=20
         )
 
         return {
-            "domain": domain_code,
-            "context": results,
-            "total_items": len(results),
+            code: {
+                "domain": code,
+                "context": results,
+                "total_items": len(results),
+            }
+            for code, results in zip(domain_codes, batch_results)
         }
 
     async def add_datapoints(self, datapoints: List[Any]) -> bool:
@@ -271,6 +726,8 @@ class CogneeClient:
 
         try:
             await add_data_points(datapoints)
+            self._search_cache.clear()
+            self._added_since_index += len(datapoints)
             self.logger.info(f"Added {len(datapoints)} DataPoints to Cognee")
             return True
 
@@ -279,57 +736,86 @@ class CogneeClient:
             return False
 
     async def learn_from_review_decision(
-        self, review_id: str, decision: str, rationale: str
+        self,
+        review_id: str,
+        decision: str,
+        rationale: str,
+        review_type: str = "integration",
     ) -> bool:
         """
         Learn from a review decision.
 
-        Adds the decision to AI memory so future similar cases
-        can reference this precedent.
+        Stages the decision as a ReviewDecisionDataPoint so future similar
+        cases can reference this precedent. The typed DataPoint is embedded
+        on its index fields without chunking or entity extraction.
+        Decisions are added in batches, so a True result only means the
+        decision was staged; it is persisted by the next flush. Call
+        ``flush_pending()`` to persist it immediately.
 
         Args:
             review_id: Review identifier
             decision: Decision made (approved, rejected, etc.)
             rationale: Reasoning behind decision
+            review_type: Review type (integration, security, etc.)
 
         Returns:
-            True if learned successfully
+            True if the decision was staged (see ``stage_governance_data``)
         """
-        decision_data = {
-            "type": "review_decision",
-            "review_id": review_id,
-            "decision": decision,
-            "rationale": rationale,
-        }
+        datapoint = review_to_datapoint(
+            {
+                "id": review_id,
+                "review_type": review_type,
+                "status": decision,
+                "rationale": rationale,
+            }
+        )
 
-        return await self.add_governance_data(decision_data)
+        return await self.stage_governance_data(datapoint)
 
     async def suggest_integration_path(
-        self, source_domain: str, target_domain: str
+        self, source_domain: str, target_domain: str, min_score: float = 0.0
     ) -> Dict[str, Any]:
         """
         Suggest optimal integration path based on learned patterns.
 
-        Uses AI memory to find successful integration patterns
-        between similar domains.
+        Uses a vector-only search over AI memory to find successful
+        integration patterns between similar domains. Patterns are ranked
+        by similarity (``1 / (1 + distance)``), weak matches below
+        ``min_score`` are dropped and confidence is the mean similarity of
+        the remaining patterns. If the vector store reports no distances,
+        confidence is based on the number of patterns found.
 
         Args:
             source_domain: Source domain code
             target_domain: Target domain code
+            min_score: Minimum similarity for a pattern to be suggested
 
         Returns:
             Suggested integration approach with reasoning
         """
-        query = f"successful integration patterns from {source_domain} to {target_domain}"
+        query = _canonicalize_query(
+            "integration_path", (source_domain, target_domain)
+        )
+        # Graph insights carry no distance, so rank on chunk similarity
         results = await self.search_integrations(
-            query, search_mode=SearchMode.INSIGHTS, limit=5
+            query, search_mode=SearchMode.CHUNKS, limit=5
         )
 
+        scored = [(_similarity(result), result) for result in results]
+        if results and all(score is not None for score, _ in scored):
+            scored.sort(key=lambda item: item[0], reverse=True)
+            kept = [(score, result) for score, result in scored if score >= min_score]
+            results = [result for _, result in kept]
+            confidence = sum(score for score, _ in kept) / len(kept) if kept else 0.0
+        else:
+            # No distances available, fall back to result count
+            confidence = len(results) / 5.0
+
         return {
             "source": source_domain,
             "target": target_domain,
             "suggested_patterns": results,
-            "confidence": len(results) / 5.0,  # Simple confidence score
+            "confidence": confidence,
         }
 
     async def reset_memory(self) -> bool:
@@ -344,6 +830,7 @@ class CogneeClient:
         try:
             await cognee.prune.prune_data()
             await cognee.prune.prune_system()
+            self._search_cache.clear()
             self.logger.warning("Cognee memory reset completed")
             return True
 
@@ -371,6 +858,7 @@ class CogneeClient:
 
 # Singleton instance
 _cognee_client: Optional[CogneeClient] = None
+_cognee_lock = LazyAsyncLock()
 
 
 async def get_cognee_client(
@@ -393,13 +881,27 @@ async def get_cognee_client(
     """
     global _cognee_client
 
-    if _cognee_client is None:
-        _cognee_client = CogneeClient(
-            llm_provider=llm_provider or os.getenv("LLM_PROVIDER", "openai"),
-            llm_model=llm_model or os.getenv("LLM_MODEL", "gpt-4"),
-            vector_db_provider=vector_db_provider or os.getenv("VECTOR_DB_PROVIDER", "lancedb"),
-            graph_db_provider=graph_db_provider or os.getenv("GRAPH_DB_PROVIDER", "networkx"),
-        )
-        await _cognee_client.configure()
+    if _cognee_client is not None:
+        return _cognee_client
+
+    async with _cognee_lock:
+        if _cognee_client is None:
+            client = CogneeClient(
+                llm_provider=llm_provider or os.getenv("LLM_PROVIDER", "openai"),
+                llm_model=llm_model or os.getenv("LLM_MODEL", "gpt-4"),
+                vector_db_provider=vector_db_provider or os.getenv("VECTOR_DB_PROVIDER", "lancedb"),
+                graph_db_provider=graph_db_provider or os.getenv("GRAPH_DB_PROVIDER", "networkx"),
+            )
+            await client.configure()
+            _cognee_client = client
 
     return _cognee_client
+
+
+async def close_cognee_client() -> None:
+    """Flush and close the Cognee client singleton, if one was created."""
+    global _cognee_client
+
+    client, _cognee_client = _cognee_client, None
+    if client is not None:
+        await client.close()
@@ -4,13 +4,88 @@ OpenBao is the open-source fork of HashiCorp Vault (forbidden).
 This module provides secrets management integration for PIPE bots.
 """
 
+import asyncio
+import base64
 import logging
 import os
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import aiohttp
-import json
 from pathlib import Path
 
+from ..utils import fast_json
+from ..utils.cache import TTLCache
+from ..utils.locks import LazyAsyncLock
+from ..utils.retry import jittered_backoff
+
+# Bound once for the encrypt/decrypt hot path
+_b64encode = base64.b64encode
+_b64decode = base64.b64decode
+
+# Transient statuses (rate limiting, leader failover) worth retrying
+_RETRY_STATUSES = frozenset({429, 502, 503})
+
+# Maximum items per transit batch_input request
+_TRANSIT_BATCH_SIZE = 256
+
+# Status transit batches report when only some items fail, so one bad item
+# does not turn the whole request into an error
+_TRANSIT_PARTIAL_FAILURE_STATUS = 200
+
+# Connection pool shared by every OpenBaoClient session
+_shared_connector: Optional[aiohttp.TCPConnector] = None
+
+
+def set_shared_connector(connector: aiohttp.TCPConnector) -> None:
+    """
+    Replace the connection pool shared by OpenBao client sessions.
+
+    Args:
+        connector: Connector to use for all subsequently created sessions
+    """
+    global _shared_connector
+    _shared_connector = connector
+
+
+def _get_shared_connector() -> aiohttp.TCPConnector:
+    """
+    Get the shared connector, creating a pooled one if needed.
+
+    Connections per OpenBao host are capped so concurrent secret reads
+    queue onto a small set of warm keep-alive connections instead of
+    each paying for a fresh TLS handshake.
+    """
+    global _shared_connector
+
+    if _shared_connector is None or _shared_connector.closed:
+        _shared_connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=20,
+            ttl_dns_cache=300,
+            keepalive_timeout=60,
+            enable_cleanup_closed=True,
+        )
+    return _shared_connector
+
+
+def _transit_batch_results(status: int, body: Any) -> Optional[List[Dict[str, Any]]]:
+    """
+    Get the per-item results of a transit batch response.
+
+    A 400 still carries per-item results when every item failed, or when
+    the server ignores ``partial_failure_response_code``.
+
+    Args:
+        status: Response status
+        body: Parsed response body
+
+    Returns:
+        List of per-item results, or None if the response has none
+    """
+    if status not in (200, 400) or not isinstance(body, dict):
+        return None
+    results = (body.get("data") or {}).get("batch_results")
+    return results if isinstance(results, list) else None
+
 
 class OpenBaoClient:
     """
@@ -26,6 +101,11 @@ class OpenBaoClient:
         token: str = None,
         namespace: str = None,
         kubernetes_role: str = None,
+        max_attempts: int = 3,
+        retry_base_delay: float = 0.1,
+        retry_max_delay: float = 2.0,
+        secret_cache_ttl: float = 60.0,
+        secret_cache_size: int = 1024,
     ):
         """
         Initialize OpenBao client.
@@ -35,27 +115,107 @@ class OpenBaoClient:
             token: Authentication token (default: from env OPENBAO_TOKEN)
             namespace: OpenBao namespace (default: from env OPENBAO_NAMESPACE)
             kubernetes_role: Kubernetes service account role for auth
+            max_attempts: Attempts per request for transient failures
+            retry_base_delay: Backoff ceiling for the first retry in seconds
+            retry_max_delay: Upper bound on the backoff ceiling in seconds
+            secret_cache_ttl: Cache lifetime for secrets without a lease
+                (0 disables secret caching, leased secrets included)
+            secret_cache_size: Maximum cached secrets
         """
         self.address = address or os.getenv("OPENBAO_ADDR", "http://localhost:8200")
         self.token = token or os.getenv("OPENBAO_TOKEN")
         self.namespace = namespace or os.getenv("OPENBAO_NAMESPACE", "")
         self.kubernetes_role = kubernetes_role
+        self.max_attempts = max_attempts
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
         self.logger = logging.getLogger("pipe.integrations.openbao")
 
         self._session: Optional[aiohttp.ClientSession] = None
         self._authenticated = False
 
+        # Secrets cached per (namespace, path) for 90% of their lease
+        self.secret_cache_ttl = secret_cache_ttl
+        self._secret_cache = TTLCache(maxsize=secret_cache_size, ttl=secret_cache_ttl)
+
     async def _ensure_session(self) -> aiohttp.ClientSession:
-        """Ensure aiohttp session exists."""
+        """Ensure aiohttp session exists on the shared connection pool."""
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
+            self._session = aiohttp.ClientSession(
+                connector=_get_shared_connector(),
+                connector_owner=False,
+                timeout=aiohttp.ClientTimeout(total=5),
+            )
         return self._session
 
     async def close(self) -> None:
-        """Close the HTTP session."""
+        """Close the HTTP session (the shared connection pool stays open)."""
         if self._session and not self._session.closed:
             await self._session.close()
 
+    async def _request(
+        self, method: str, url: str, retry: bool = True, **kwargs: Any
+    ) -> Tuple[int, Any]:
+        """
+        Send a request, retrying transient failures with jittered backoff.
+
+        Connection errors, timeouts and 429/502/503 responses are retried
+        up to ``max_attempts`` times.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            retry: Whether transient failures are retried
+            **kwargs: Extra arguments for ``ClientSession.request``
+
+        Returns:
+            Tuple of response status and body (parsed JSON for JSON
+            responses, text otherwise)
+
+        Raises:
+            aiohttp.ClientError: If the request still fails after retries
+            asyncio.TimeoutError: If the request still times out after retries
+        """
+        session = await self._ensure_session()
+        attempts = self.max_attempts if retry else 1
+
+        # Encode JSON payloads once, outside the retry loop
+        if "json" in kwargs:
+            kwargs["data"] = fast_json.dumps(kwargs.pop("json"))
+            kwargs["headers"] = {
+                **(kwargs.get("headers") or {}),
+                "Content-Type": "application/json",
+            }
+
+        for attempt in range(attempts):
+            last_attempt = attempt == attempts - 1
+            try:
+                async with session.request(method, url, **kwargs) as response:
+                    if response.status in _RETRY_STATUSES and not last_attempt:
+                        self.logger.warning(
+                            "OpenBao returned %s (attempt %d/%d), retrying",
+                            response.status,
+                            attempt + 1,
+                            attempts,
+                        )
+                    elif response.content_type == "application/json":
+                        return response.status, fast_json.loads(await response.read())
+                    else:
+                        return response.status, await response.text()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if last_attempt:
+                    raise
+                self.logger.warning(
+                    "OpenBao request failed (attempt %d/%d), retrying: %s",
+                    attempt + 1,
+                    attempts,
+                    e,
+                )
+
+            await asyncio.sleep(
+                jittered_backoff(attempt, self.retry_base_delay, self.retry_max_delay)
+            )
+
     async def authenticate_kubernetes(self, jwt_path: str = None) -> bool:
         """
         Authenticate to OpenBao using Kubernetes service account.
@@ -73,14 +233,13 @@ class OpenBaoClient:
         # Read service account JWT
         jwt_path = jwt_path or "/var/run/secrets/kubernetes.io/serviceaccount/token"
         try:
-            with open(jwt_path, "r") as f:
-                jwt = f.read().strip()
+            # Read off the event loop; overlay filesystems can be slow
+            jwt = (await asyncio.to_thread(Path(jwt_path).read_text)).strip()
         except Exception as e:
-            self.logger.error(f"Failed to read service account token: {str(e)}")
+            self.logger.error("Failed to read service account token: %s", e)
             return False
 
         # Authenticate with OpenBao
-        session = await self._ensure_session()
         url = f"{self.address}/v1/auth/kubernetes/login"
 
         headers = {}
@@ -90,27 +249,31 @@ class OpenBaoClient:
         payload = {"role": self.kubernetes_role, "jwt": jwt}
 
         try:
-            async with session.post(url, json=payload, headers=headers) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    self.token = data["auth"]["client_token"]
-                    self._authenticated = True
-                    self.logger.info("Successfully authenticated to OpenBao")
-                    return True
-                else:
-                    error_text = await response.text()
-                    self.logger.error(
-                        f"OpenBao authentication failed: {response.status} - {error_text}"
-                    )
-                    return False
+            status, body = await self._request(
+                "POST", url, json=payload, headers=headers
+            )
+            if status == 200:
+                self.token = body["auth"]["client_token"]
+                self._authenticated = True
+                self.logger.info("Successfully authenticated to OpenBao")
+                return True
+            else:
+                self.logger.error(
+                    "OpenBao authentication failed: %s - %s", status, body
+                )
+                return False
         except Exception as e:
-            self.logger.error(f"OpenBao authentication error: {str(e)}")
+            self.logger.error("OpenBao authentication error: %s", e)
             return False
 
     async def read_secret(self, path: str) -> Optional[Dict[str, Any]]:
         """
         Read a secret from OpenBao.
 
+        Secrets are cached for 90% of their lease duration, or for
+        ``secret_cache_ttl`` seconds when OpenBao reports no lease (KV).
+        Nothing is cached when ``secret_cache_ttl`` is 0.
+
         Args:
             path: Secret path (e.g., "secret/data/myapp/config")
 
@@ -121,7 +284,11 @@ class OpenBaoClient:
             self.logger.error("Not authenticated to OpenBao")
             return None
 
-        session = await self._ensure_session()
+        cache_key = (self.namespace, path)
+        cached = self._secret_cache.get(cache_key)
+        if cached is not None:
+            return dict(cached)
+
         url = f"{self.address}/v1/{path}"
 
         headers = {"X-Vault-Token": self.token}
@@ -129,26 +296,38 @@ class OpenBaoClient:
             headers["X-Vault-Namespace"] = self.namespace
 
         try:
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    # KV v2 returns data nested under 'data.data'
-                    if "data" in data and "data" in data["data"]:
-                        return data["data"]["data"]
-                    return data.get("data", {})
-                elif response.status == 404:
-                    self.logger.warning(f"Secret not found: {path}")
-                    return None
+            status, body = await self._request("GET", url, headers=headers)
+            if status == 200:
+                # KV v2 returns data nested under 'data.data'
+                if "data" in body and "data" in body["data"]:
+                    secret = body["data"]["data"]
                 else:
-                    error_text = await response.text()
-                    self.logger.error(
-                        f"Failed to read secret: {response.status} - {error_text}"
-                    )
-                    return None
+                    secret = body.get("data", {})
+
+                if self.secret_cache_ttl > 0:
+                    lease_duration = body.get("lease_duration") or 0
+                    ttl = lease_duration * 0.9 or self.secret_cache_ttl
+                    self._secret_cache.set(cache_key, secret, ttl=ttl)
+                return dict(secret)
+            elif status == 404:
+                self.logger.warning("Secret not found: %s", path)
+                return None
+            else:
+                self.logger.error("Failed to read secret: %s - %s", status, body)
+                return None
         except Exception as e:
-            self.logger.error(f"Error reading secret: {str(e)}")
+            self.logger.error("Error reading secret: %s", e)
             return None
 
+    def invalidate(self, path: str) -> None:
+        """
+        Drop a cached secret so the next read goes to OpenBao.
+
+        Args:
+            path: Secret path
+        """
+        self._secret_cache.pop((self.namespace, path))
+
     async def write_secret(self, path: str, data: Dict[str, Any]) -> bool:
         """
         Write a secret to OpenBao.
@@ -164,7 +343,8 @@ class OpenBaoClient:
             self.logger.error("Not authenticated to OpenBao")
             return False
 
-        session = await self._ensure_session()
+        self.invalidate(path)
+
         url = f"{self.address}/v1/{path}"
 
         headers = {"X-Vault-Token": self.token}
@@ -178,19 +358,21 @@ class OpenBaoClient:
             payload = data
 
         try:
-            async with session.post(url, json=payload, headers=headers) as response:
-                if response.status in [200, 204]:
-                    self.logger.info(f"Successfully wrote secret: {path}")
-                    return True
-                else:
-                    error_text = await response.text()
-                    self.logger.error(
-                        f"Failed to write secret: {response.status} - {error_text}"
-                    )
-                    return False
+            status, body = await self._request(
+                "POST", url, json=payload, headers=headers
+            )
+            if status in [200, 204]:
+                self.logger.info("Successfully wrote secret: %s", path)
+                return True
+            else:
+                self.logger.error("Failed to write secret: %s - %s", status, body)
+                return False
         except Exception as e:
-            self.logger.error(f"Error writing secret: {str(e)}")
+            self.logger.error("Error writing secret: %s", e)
             return False
+        finally:
+            # Drop values cached by reads that raced with the write
+            self.invalidate(path)
 
     async def delete_secret(self, path: str) -> bool:
         """
@@ -206,7 +388,8 @@ class OpenBaoClient:
             self.logger.error("Not authenticated to OpenBao")
             return False
 
-        session = await self._ensure_session()
+        self.invalidate(path)
+
         url = f"{self.address}/v1/{path}"
 
         headers = {"X-Vault-Token": self.token}
@@ -214,106 +397,222 @@ class OpenBaoClient:
             headers["X-Vault-Namespace"] = self.namespace
 
         try:
-            async with session.delete(url, headers=headers) as response:
-                if response.status in [200, 204]:
-                    self.logger.info(f"Successfully deleted secret: {path}")
-                    return True
-                else:
-                    error_text = await response.text()
-                    self.logger.error(
-                        f"Failed to delete secret: {response.status} - {error_text}"
-                    )
-                    return False
+            status, body = await self._request("DELETE", url, headers=headers)
+            if status in [200, 204]:
+                self.logger.info("Successfully deleted secret: %s", path)
+                return True
+            else:
+                self.logger.error("Failed to delete secret: %s - %s", status, body)
+                return False
         except Exception as e:
-            self.logger.error(f"Error deleting secret: {str(e)}")
+            self.logger.error("Error deleting secret: %s", e)
             return False
+        finally:
+            # Drop values cached by reads that raced with the delete
+            self.invalidate(path)
 
-    async def encrypt(self, plaintext: str, key_name: str = "pipe") -> Optional[str]:
+    async def read_secrets(
+        self, paths: List[str], concurrency: int = 16
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
         """
-        Encrypt data using OpenBao transit engine.
+        Read several secrets concurrently.
 
         Args:
-            plaintext: Data to encrypt
+            paths: Secret paths
+            concurrency: Maximum requests in flight
+
+        Returns:
+            Dictionary mapping each path to its secret data (None if not found)
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _read(path: str) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                return await self.read_secret(path)
+
+        results = await asyncio.gather(*(_read(path) for path in paths))
+        return dict(zip(paths, results))
+
+    async def write_secrets(
+        self, secrets: Dict[str, Dict[str, Any]], concurrency: int = 16
+    ) -> Dict[str, bool]:
+        """
+        Write several secrets concurrently.
+
+        Args:
+            secrets: Dictionary mapping secret paths to secret data
+            concurrency: Maximum requests in flight
+
+        Returns:
+            Dictionary mapping each path to whether its write succeeded
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _write(path: str, data: Dict[str, Any]) -> bool:
+            async with semaphore:
+                return await self.write_secret(path, data)
+
+        results = await asyncio.gather(
+            *(_write(path, data) for path, data in secrets.items())
+        )
+        return dict(zip(secrets, results))
+
+    async def encrypt_many(
+        self, plaintexts: List[str], key_name: str = "pipe"
+    ) -> List[Optional[str]]:
+        """
+        Encrypt several values using transit batch requests.
+
+        Plaintexts are sent in batches of up to 256 per request.
+
+        Args:
+            plaintexts: Data to encrypt
             key_name: Encryption key name
 
         Returns:
-            Encrypted ciphertext or None
+            Ciphertexts in input order (None for items that failed)
         """
         if not self.token:
             self.logger.error("Not authenticated to OpenBao")
-            return None
+            return [None] * len(plaintexts)
 
-        session = await self._ensure_session()
+        batches = await asyncio.gather(
+            *(
+                self._encrypt_batch(plaintexts[i : i + _TRANSIT_BATCH_SIZE], key_name)
+                for i in range(0, len(plaintexts), _TRANSIT_BATCH_SIZE)
+            )
+        )
+        return [ciphertext for batch in batches for ciphertext in batch]
+
+    async def _encrypt_batch(
+        self, plaintexts: List[str], key_name: str
+    ) -> List[Optional[str]]:
+        """Encrypt one transit batch request worth of plaintexts."""
         url = f"{self.address}/v1/transit/encrypt/{key_name}"
 
         headers = {"X-Vault-Token": self.token}
         if self.namespace:
             headers["X-Vault-Namespace"] = self.namespace
 
-        # Base64 encode plaintext
-        import base64
-
-        plaintext_b64 = base64.b64encode(plaintext.encode()).decode()
-
-        payload = {"plaintext": plaintext_b64}
+        # Base64 encode plaintexts
+        payload = {
+            "batch_input": [
+                {"plaintext": _b64encode(plaintext.encode()).decode()}
+                for plaintext in plaintexts
+            ],
+            "partial_failure_response_code": _TRANSIT_PARTIAL_FAILURE_STATUS,
+        }
 
         try:
-            async with session.post(url, json=payload, headers=headers) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return data["data"]["ciphertext"]
+            status, body = await self._request(
+                "POST", url, json=payload, headers=headers
+            )
+            results = _transit_batch_results(status, body)
+            if results is None:
+                self.logger.error("Encryption failed: %s - %s", status, body)
+                return [None] * len(plaintexts)
+
+            ciphertexts = []
+            for result in results:
+                if result.get("ciphertext") and not result.get("error"):
+                    ciphertexts.append(result["ciphertext"])
                 else:
-                    error_text = await response.text()
-                    self.logger.error(
-                        f"Encryption failed: {response.status} - {error_text}"
-                    )
-                    return None
+                    self.logger.error("Encryption failed: %s", result.get("error"))
+                    ciphertexts.append(None)
+            return ciphertexts
         except Exception as e:
-            self.logger.error(f"Encryption error: {str(e)}")
-            return None
+            self.logger.error("Encryption error: %s", e)
+            return [None] * len(plaintexts)
 
-    async def decrypt(self, ciphertext: str, key_name: str = "pipe") -> Optional[str]:
+    async def encrypt(self, plaintext: str, key_name: str = "pipe") -> Optional[str]:
         """
-        Decrypt data using OpenBao transit engine.
+        Encrypt data using OpenBao transit engine.
 
         Args:
-            ciphertext: Data to decrypt
+            plaintext: Data to encrypt
             key_name: Encryption key name
 
         Returns:
-            Decrypted plaintext or None
+            Encrypted ciphertext or None
+        """
+        return (await self.encrypt_many([plaintext], key_name))[0]
+
+    async def decrypt_many(
+        self, ciphertexts: List[str], key_name: str = "pipe"
+    ) -> List[Optional[str]]:
+        """
+        Decrypt several values using transit batch requests.
+
+        Ciphertexts are sent in batches of up to 256 per request.
+
+        Args:
+            ciphertexts: Data to decrypt
+            key_name: Encryption key name
+
+        Returns:
+            Decrypted plaintexts in input order (None for items that failed)
         """
         if not self.token:
             self.logger.error("Not authenticated to OpenBao")
-            return None
+            return [None] * len(ciphertexts)
 
-        session = await self._ensure_session()
+        batches = await asyncio.gather(
+            *(
+                self._decrypt_batch(ciphertexts[i : i + _TRANSIT_BATCH_SIZE], key_name)
+                for i in range(0, len(ciphertexts), _TRANSIT_BATCH_SIZE)
+            )
+        )
+        return [plaintext for batch in batches for plaintext in batch]
+
+    async def _decrypt_batch(
+        self, ciphertexts: List[str], key_name: str
+    ) -> List[Optional[str]]:
+        """Decrypt one transit batch request worth of ciphertexts."""
         url = f"{self.address}/v1/transit/decrypt/{key_name}"
 
         headers = {"X-Vault-Token": self.token}
         if self.namespace:
             headers["X-Vault-Namespace"] = self.namespace
 
-        payload = {"ciphertext": ciphertext}
+        payload = {
+            "batch_input": [{"ciphertext": c} for c in ciphertexts],
+            "partial_failure_response_code": _TRANSIT_PARTIAL_FAILURE_STATUS,
+        }
 
         try:
-            async with session.post(url, json=payload, headers=headers) as response:
-                if response.status == 200:
-                    data = await response.json()
+            status, body = await self._request(
+                "POST", url, json=payload, headers=headers
+            )
+            results = _transit_batch_results(status, body)
+            if results is None:
+                self.logger.error("Decryption failed: %s - %s", status, body)
+                return [None] * len(ciphertexts)
+
+            plaintexts = []
+            for result in results:
+                if result.get("plaintext") is not None and not result.get("error"):
                     # Base64 decode plaintext
-                    import base64
-
-                    plaintext_b64 = data["data"]["plaintext"]
-                    return base64.b64decode(plaintext_b64).decode()
+                    plaintexts.append(_b64decode(result["plaintext"]).decode())
                 else:
-                    error_text = await response.text()
-                    self.logger.error(
-                        f"Decryption failed: {response.status} - {error_text}"
-                    )
-                    return None
+                    self.logger.error("Decryption failed: %s", result.get("error"))
+                    plaintexts.append(None)
+            return plaintexts
         except Exception as e:
-            self.logger.error(f"Decryption error: {str(e)}")
-            return None
+            self.logger.error("Decryption error: %s", e)
+            return [None] * len(ciphertexts)
+
+    async def decrypt(self, ciphertext: str, key_name: str = "pipe") -> Optional[str]:
+        """
+        Decrypt data using OpenBao transit engine.
+
+        Args:
+            ciphertext: Data to decrypt
+            key_name: Encryption key name
+
+        Returns:
+            Decrypted plaintext or None
+        """
+        return (await self.decrypt_many([ciphertext], key_name))[0]
 
     async def generate_certificate(
         self, common_name: str, ttl: str = "24h", alt_names: list = None
@@ -333,7 +632,6 @@ class OpenBaoClient:
             self.logger.error("Not authenticated to OpenBao")
             return None
 
-        session = await self._ensure_session()
         url = f"{self.address}/v1/pki/issue/pipe"
 
         headers = {"X-Vault-Token": self.token}
@@ -346,23 +644,23 @@ class OpenBaoClient:
             payload["alt_names"] = ",".join(alt_names)
 
         try:
-            async with session.post(url, json=payload, headers=headers) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return {
-                        "certificate": data["data"]["certificate"],
-                        "private_key": data["data"]["private_key"],
-                        "ca_chain": data["data"].get("ca_chain", []),
-                        "serial_number": data["data"]["serial_number"],
-                    }
-                else:
-                    error_text = await response.text()
-                    self.logger.error(
-                        f"Certificate generation failed: {response.status} - {error_text}"
-                    )
-                    return None
+            status, body = await self._request(
+                "POST", url, json=payload, headers=headers
+            )
+            if status == 200:
+                return {
+                    "certificate": body["data"]["certificate"],
+                    "private_key": body["data"]["private_key"],
+                    "ca_chain": body["data"].get("ca_chain", []),
+                    "serial_number": body["data"]["serial_number"],
+                }
+            else:
+                self.logger.error(
+                    "Certificate generation failed: %s - %s", status, body
+                )
+                return None
         except Exception as e:
-            self.logger.error(f"Certificate generation error: {str(e)}")
+            self.logger.error("Certificate generation error: %s", e)
             return None
 
     async def health_check(self) -> bool:
@@ -372,20 +670,20 @@ class OpenBaoClient:
         Returns:
             True if healthy
         """
-        session = await self._ensure_session()
         url = f"{self.address}/v1/sys/health"
 
         try:
-            async with session.get(url) as response:
-                # OpenBao returns 200 if initialized and unsealed
-                return response.status == 200
+            status, _ = await self._request("GET", url, retry=False)
+            # OpenBao returns 200 if initialized and unsealed
+            return status == 200
         except Exception as e:
-            self.logger.error(f"Health check failed: {str(e)}")
+            self.logger.error("Health check failed: %s", e)
             return False
 
 
 # Singleton instance
 _openbao_client: Optional[OpenBaoClient] = None
+_openbao_lock = LazyAsyncLock()
 
 
 async def get_openbao_client(
@@ -403,13 +701,17 @@ async def get_openbao_client(
     """
     global _openbao_client
 
-    if _openbao_client is None:
-        _openbao_client = OpenBaoClient(
-            address=address, kubernetes_role=kubernetes_role
-        )
+    if _openbao_client is not None:
+        return _openbao_client
+
+    async with _openbao_lock:
+        if _openbao_client is None:
+            client = OpenBaoClient(address=address, kubernetes_role=kubernetes_role)
+
+            # Auto-authenticate if running in Kubernetes
+            if kubernetes_role:
+                await client.authenticate_kubernetes()
 
-        # Auto-authenticate if running in Kubernetes
-        if kubernetes_role:
-            await _openbao_client.authenticate_kubernetes()
+            _openbao_client = client
 
     return _openbao_client
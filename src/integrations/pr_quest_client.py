@@ -8,12 +8,15 @@ reviewing GitHub pull requests with LLM-powered analysis and gamification.
 
 import asyncio
 import logging
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 import aiohttp
 from aiohttp import ClientError, ClientTimeout
 
+from ..utils import fast_json
+from ..utils.cache import TTLCache
+from ..utils.locks import LazyAsyncLock
+from ..utils.retry import jittered_backoff, parse_retry_after
 from .pr_quest_models import (
     AnalyzeRequest,
     PRAnalysisResult,
@@ -24,8 +27,25 @@ from .pr_quest_models import (
     parse_pr_url,
 )
 
+try:
+    # Only probed: aiohttp decodes "br" responses itself when brotli is present
+    import brotli  # noqa: F401
+
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Compressed encodings aiohttp can decode in this environment
+_ACCEPT_ENCODING = "gzip, deflate, br" if BROTLI_AVAILABLE else "gzip, deflate"
+
+# Liveness checks should fail fast
+_HEALTHCHECK_TIMEOUT = ClientTimeout(total=2)
+
+# Leaderboards change as reviews complete, so cache them only briefly
+_LEADERBOARD_CACHE_TTL = 30.0
+
 
 class PRQuestError(Exception):
     """Base exception for PR-QUEST client errors."""
@@ -80,6 +100,11 @@ class PRQuestClient:
         base_url: str = "http://localhost:3000",
         timeout: int = 30,
         max_retries: int = 3,
+        base_backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        cache_ttl: float = 300.0,
+        cache_size: int = 256,
+        trust_responses: bool = True,
     ):
         """
         Initialize PR-QUEST client.
@@ -88,12 +113,37 @@ class PRQuestClient:
             base_url: Base URL of PR-QUEST service
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts for failed requests
+            base_backoff: Backoff ceiling for the first retry in seconds
+            max_backoff: Upper bound on any retry backoff in seconds
+            cache_ttl: Seconds to cache completed analysis results
+            cache_size: Maximum number of cached analysis results
+            trust_responses: Build review step and leaderboard models from
+                PR-QUEST responses without re-validating them
         """
         self.base_url = base_url.rstrip("/")
         self.timeout = ClientTimeout(total=timeout)
         self.max_retries = max_retries
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.trust_responses = trust_responses
+
+        # Parsed responses; completed analyses are immutable, leaderboards
+        # are cached briefly
+        self._analysis_cache = TTLCache(maxsize=cache_size, ttl=cache_ttl)
         self.session: Optional[aiohttp.ClientSession] = None
 
+        # In-flight analyses keyed by (pr_url, include_llm_analysis, llm_model)
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+
+        # Keep-alive pool tuned for the single PR-QUEST host
+        self._connector_kwargs = dict(
+            limit=100,
+            limit_per_host=32,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True,
+            keepalive_timeout=75,
+        )
+
         logger.info(f"Initialized PR-QUEST client for {self.base_url}")
 
     async def initialize(self) -> bool:
@@ -107,7 +157,15 @@ class PRQuestClient:
             PRQuestConnectionError: If cannot connect to PR-QUEST
         """
         if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession(timeout=self.timeout)
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(**self._connector_kwargs),
+                timeout=self.timeout,
+                headers={
+                    "Accept": "application/json",
+                    "Accept-Encoding": _ACCEPT_ENCODING,
+                },
+                json_serialize=lambda obj: fast_json.dumps(obj).decode(),
+            )
 
         # Verify connectivity
         try:
@@ -130,13 +188,29 @@ class PRQuestClient:
             await self.session.close()
             logger.info("PR-QUEST client session closed")
 
+    def invalidate(self, analysis_id: str) -> None:
+        """
+        Drop cached results for an analysis.
+
+        Args:
+            analysis_id: Analysis identifier
+        """
+        for kind in ("status", "steps", "export"):
+            self._analysis_cache.pop((kind, analysis_id), None)
+
+    def _backoff(self, attempt: int) -> float:
+        """Get a jittered, capped backoff delay for a retry attempt."""
+        return jittered_backoff(attempt, self.base_backoff, self.max_backoff)
+
     async def _request(
         self,
         method: str,
         endpoint: str,
         data: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
-    ) -> Dict[str, Any]:
+        body: Optional[bytes] = None,
+        accept: Optional[str] = None,
+    ) -> Union[Dict[str, Any], str]:
         """
         Make HTTP request to PR-QUEST API with retry logic.
 
@@ -145,9 +219,13 @@ class PRQuestClient:
             endpoint: API endpoint (without base URL)
             data: JSON data for POST/PUT requests
             params: Query parameters
+            body: Pre-serialized JSON body, sent instead of ``data``
+            accept: Accept header overriding the session default; non-JSON
+                responses are then returned as text
 
         Returns:
-            Parsed JSON response
+            Parsed JSON response, or the response text for non-JSON
+            responses to a custom ``accept``
 
         Raises:
             PRQuestConnectionError: If request fails after retries
@@ -156,44 +234,65 @@ class PRQuestClient:
             await self.initialize()
 
         url = f"{self.base_url}{endpoint}"
-        headers = {"Content-Type": "application/json"}
+
+        if body is not None:
+            request_kwargs = {
+                "data": body,
+                "headers": {"Content-Type": "application/json"},
+            }
+        else:
+            request_kwargs = {"json": data}
+
+        if accept is not None:
+            request_kwargs["headers"] = {
+                **request_kwargs.get("headers", {}),
+                "Accept": accept,
+            }
 
         for attempt in range(self.max_retries):
             try:
                 async with self.session.request(
-                    method, url, json=data, params=params, headers=headers
+                    method, url, params=params, **request_kwargs
                 ) as response:
-                    response_data = await response.json()
-
                     if response.status == 200:
-                        return response_data
+                        if accept is not None and response.content_type != "application/json":
+                            return await response.text()
+                        return await response.json(loads=fast_json.loads)
                     elif response.status == 404:
                         raise PRQuestError(f"Resource not found: {url}")
-                    elif response.status >= 500:
-                        # Server error - retry
+                    elif response.status >= 500 or response.status == 429:
+                        # Server error or rate limited - retry
                         if attempt < self.max_retries - 1:
-                            wait_time = 2 ** attempt  # Exponential backoff
+                            wait_time = self._backoff(attempt)
+                            retry_after = parse_retry_after(
+                                response.headers.get("Retry-After")
+                            )
+                            if retry_after is not None:
+                                wait_time = min(
+                                    self.max_backoff, max(wait_time, retry_after)
+                                )
                             logger.warning(
-                                f"PR-QUEST server error (attempt {attempt + 1}/{self.max_retries}). "
-                                f"Retrying in {wait_time}s..."
+                                f"PR-QUEST server error {response.status} "
+                                f"(attempt {attempt + 1}/{self.max_retries}). "
+                                f"Retrying in {wait_time:.2f}s..."
                             )
                             await asyncio.sleep(wait_time)
                             continue
                         else:
                             raise PRQuestConnectionError(
-                                f"PR-QUEST server error: {response_data}"
+                                f"PR-QUEST server error: {await response.text()}"
                             )
                     else:
                         raise PRQuestError(
-                            f"PR-QUEST request failed: {response.status} - {response_data}"
+                            f"PR-QUEST request failed: {response.status} - {await response.text()}"
                         )
 
             except asyncio.TimeoutError:
                 if attempt < self.max_retries - 1:
-                    wait_time = 2 ** attempt
+                    wait_time = self._backoff(attempt)
                     logger.warning(
                         f"Request timeout (attempt {attempt + 1}/{self.max_retries}). "
-                        f"Retrying in {wait_time}s..."
+                        f"Retrying in {wait_time:.2f}s..."
                     )
                     await asyncio.sleep(wait_time)
                     continue
@@ -204,10 +303,10 @@ class PRQuestClient:
 
             except ClientError as e:
                 if attempt < self.max_retries - 1:
-                    wait_time = 2 ** attempt
+                    wait_time = self._backoff(attempt)
                     logger.warning(
                         f"Request failed: {e} (attempt {attempt + 1}/{self.max_retries}). "
-                        f"Retrying in {wait_time}s..."
+                        f"Retrying in {wait_time:.2f}s..."
                     )
                     await asyncio.sleep(wait_time)
                     continue
@@ -232,6 +331,8 @@ class PRQuestClient:
         - Risk detection (security, breaking changes, etc.)
         - Suggestion generation
 
+        Concurrent calls for the same PR and options share a single request.
+
         Args:
             pr_url: Full GitHub PR URL (e.g., https://github.com/org/repo/pull/123)
             include_llm_analysis: Use LLM for intelligent clustering (default: True)
@@ -244,11 +345,30 @@ class PRQuestClient:
             PRQuestAnalysisError: If analysis fails
             ValueError: If PR URL is invalid
         """
+        # Concurrent calls for the same analysis share one request
+        key = (pr_url, include_llm_analysis, llm_model)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._analyze_pr(pr_url, include_llm_analysis, llm_model)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        return await asyncio.shield(task)
+
+    async def _analyze_pr(
+        self,
+        pr_url: str,
+        include_llm_analysis: bool,
+        llm_model: Optional[str],
+    ) -> PRAnalysisResult:
+        """Send a single PR analysis request (see ``analyze_pr``)."""
         logger.info(f"Analyzing PR: {pr_url} (LLM: {include_llm_analysis})")
 
         # Validate and parse PR URL
         try:
-            pr_parts = parse_pr_url(pr_url)
+            parse_pr_url(pr_url)
         except ValueError as e:
             raise ValueError(f"Invalid PR URL: {e}") from e
 
@@ -262,7 +382,7 @@ class PRQuestClient:
         try:
             # Send analysis request
             response_data = await self._request(
-                "POST", "/api/analyze", data=request.model_dump(mode="json")
+                "POST", "/api/analyze", body=request.model_dump_json().encode()
             )
 
             # Parse response into PRAnalysisResult
@@ -280,6 +400,35 @@ class PRQuestClient:
             logger.error(f"PR analysis failed for {pr_url}: {e}")
             raise PRQuestAnalysisError(f"Failed to analyze PR: {e}") from e
 
+    async def batch_analyze_prs(
+        self,
+        pr_urls: List[str],
+        *,
+        concurrency: int = 8,
+        include_llm_analysis: bool = True,
+    ) -> List[Union[PRAnalysisResult, Exception]]:
+        """
+        Analyze several PRs concurrently.
+
+        Args:
+            pr_urls: GitHub PR URLs to analyze
+            concurrency: Maximum number of analyses in flight
+            include_llm_analysis: Use LLM for intelligent clustering
+
+        Returns:
+            One PRAnalysisResult per URL, in input order, or the exception
+            raised for that URL
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def analyze_one(pr_url: str) -> PRAnalysisResult:
+            async with semaphore:
+                return await self.analyze_pr(pr_url, include_llm_analysis)
+
+        return await asyncio.gather(
+            *(analyze_one(pr_url) for pr_url in pr_urls), return_exceptions=True
+        )
+
     async def get_analysis_status(self, analysis_id: str) -> Dict[str, Any]:
         """
         Get the status of an ongoing analysis.
@@ -295,18 +444,49 @@ class PRQuestClient:
         Raises:
             PRQuestError: If analysis not found
         """
+        cached = self._analysis_cache.get(("status", analysis_id))
+        if cached is not None:
+            return dict(cached)
+
         logger.debug(f"Checking analysis status: {analysis_id}")
 
         response_data = await self._request("GET", f"/api/analyze/{analysis_id}/status")
 
+        # Only a completed analysis is guaranteed not to change
+        if response_data.get("status") == "completed":
+            self._analysis_cache.set(("status", analysis_id), dict(response_data))
+
         return response_data
 
+    def _analysis_completed(self, analysis_id: str, response_data: Any = None) -> bool:
+        """
+        Check whether an analysis is known to be complete.
+
+        Only completed analyses have stable steps and exports, so only
+        their results are cached.
+
+        Args:
+            analysis_id: Analysis identifier
+            response_data: Response that may carry the analysis status
+
+        Returns:
+            True if the response or the cached status says it completed
+        """
+        if (
+            isinstance(response_data, dict)
+            and response_data.get("status") == "completed"
+        ):
+            return True
+        # Only completed statuses are ever cached
+        return ("status", analysis_id) in self._analysis_cache
+
     async def get_review_steps(self, analysis_id: str) -> List[ReviewStep]:
         """
         Get interactive review steps for a PR analysis.
 
         Review steps provide a guided walkthrough of the PR changes,
         grouped by logical clusters with diff rendering.
+        Steps are cached once the analysis is known to be complete.
 
         Args:
             analysis_id: Analysis identifier
@@ -317,14 +497,21 @@ class PRQuestClient:
         Raises:
             PRQuestError: If analysis not found
         """
+        cached = self._analysis_cache.get(("steps", analysis_id))
+        if cached is not None:
+            return list(cached)
+
         logger.info(f"Fetching review steps for analysis: {analysis_id}")
 
         response_data = await self._request("GET", f"/api/analyze/{analysis_id}/steps")
 
-        steps = [ReviewStep(**step_data) for step_data in response_data.get("steps", [])]
+        build_step = ReviewStep.model_construct if self.trust_responses else ReviewStep
+        steps = [build_step(**step_data) for step_data in response_data.get("steps", ())]
 
         logger.info(f"Retrieved {len(steps)} review steps")
 
+        if self._analysis_completed(analysis_id, response_data):
+            self._analysis_cache.set(("steps", analysis_id), list(steps))
         return steps
 
     async def submit_review_notes(
@@ -354,11 +541,14 @@ class PRQuestClient:
         response_data = await self._request(
             "POST",
             f"/api/analyze/{analysis_id}/notes",
-            data=request.model_dump(mode="json"),
+            body=request.model_dump_json().encode(),
         )
 
         success = response_data.get("success", False)
 
+        # New notes change the steps and the exported markdown
+        self.invalidate(analysis_id)
+
         if success:
             logger.info("Review notes submitted successfully")
         else:
@@ -377,7 +567,9 @@ class PRQuestClient:
         - Detected risks and suggestions
         - Reviewer notes (if any)
 
-        Perfect for including in governance documentation.
+        Perfect for including in governance documentation. Exports of
+        completed analyses are cached until the cache TTL expires or new
+        notes are submitted.
 
         Args:
             analysis_id: Analysis identifier
@@ -388,14 +580,28 @@ class PRQuestClient:
         Raises:
             PRQuestError: If export fails
         """
+        cached = self._analysis_cache.get(("export", analysis_id))
+        if cached is not None:
+            return cached
+
         logger.info(f"Exporting markdown for analysis: {analysis_id}")
 
-        response_data = await self._request("GET", f"/api/analyze/{analysis_id}/export")
+        # Prefer the raw markdown body; older servers wrap it in JSON
+        response_data = await self._request(
+            "GET",
+            f"/api/analyze/{analysis_id}/export",
+            accept="text/markdown, application/json;q=0.9",
+        )
 
-        markdown = response_data.get("markdown", "")
+        if isinstance(response_data, str):
+            markdown = response_data
+        else:
+            markdown = response_data.get("markdown", "")
 
         logger.info(f"Exported {len(markdown)} character markdown document")
 
+        if self._analysis_completed(analysis_id, response_data):
+            self._analysis_cache.set(("export", analysis_id), markdown)
         return markdown
 
     async def get_xp_leaderboard(self, limit: int = 10) -> List[ReviewerXP]:
@@ -414,19 +620,29 @@ class PRQuestClient:
         Raises:
             PRQuestError: If request fails
         """
+        cached = self._analysis_cache.get(("leaderboard", limit))
+        if cached is not None:
+            return list(cached)
+
         logger.info(f"Fetching XP leaderboard (top {limit})")
 
         response_data = await self._request(
             "GET", "/api/leaderboard", params={"limit": limit}
         )
 
+        build_reviewer = (
+            ReviewerXP.model_construct if self.trust_responses else ReviewerXP
+        )
         leaderboard = [
-            ReviewerXP(**reviewer_data)
-            for reviewer_data in response_data.get("leaderboard", [])
+            build_reviewer(**reviewer_data)
+            for reviewer_data in response_data.get("leaderboard", ())
         ]
 
         logger.info(f"Retrieved leaderboard with {len(leaderboard)} reviewers")
 
+        self._analysis_cache.set(
+            ("leaderboard", limit), list(leaderboard), ttl=_LEADERBOARD_CACHE_TTL
+        )
         return leaderboard
 
     async def get_reviewer_stats(self, username: str) -> ReviewerXP:
@@ -455,10 +671,64 @@ class PRQuestClient:
 
         return stats
 
+    async def batch_get_reviewer_stats(
+        self, usernames: List[str], *, concurrency: int = 8
+    ) -> List[Union[ReviewerXP, Exception]]:
+        """
+        Get XP statistics for several reviewers concurrently.
+
+        Args:
+            usernames: Reviewer usernames
+            concurrency: Maximum number of requests in flight
+
+        Returns:
+            One ReviewerXP per username, in input order, or the exception
+            raised for that username
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def stats_one(username: str) -> ReviewerXP:
+            async with semaphore:
+                return await self.get_reviewer_stats(username)
+
+        return await asyncio.gather(
+            *(stats_one(username) for username in usernames), return_exceptions=True
+        )
+
     async def healthcheck(self) -> bool:
         """
         Check if PR-QUEST service is healthy.
 
+        Sends a single HEAD request with a short timeout and treats a 200
+        as healthy. Servers that do not support HEAD fall back to the
+        full JSON health check.
+
+        Returns:
+            bool: True if healthy, False otherwise
+        """
+        if not self.session or self.session.closed:
+            return await self._deep_healthcheck()
+
+        try:
+            async with self.session.head(
+                f"{self.base_url}/api/health", timeout=_HEALTHCHECK_TIMEOUT
+            ) as response:
+                if response.status == 405:
+                    return await self._deep_healthcheck()
+
+                healthy = response.status == 200
+                if not healthy:
+                    logger.warning(f"PR-QUEST health check: {response.status}")
+                return healthy
+
+        except Exception as e:
+            logger.error(f"PR-QUEST health check failed: {e}")
+            return False
+
+    async def _deep_healthcheck(self) -> bool:
+        """
+        Check PR-QUEST health from the JSON status reported by the service.
+
         Returns:
             bool: True if healthy, False otherwise
         """
@@ -484,6 +754,7 @@ class PRQuestClient:
 # ============================================================================
 
 _pr_quest_client_instance: Optional[PRQuestClient] = None
+_pr_quest_client_lock = LazyAsyncLock()
 
 
 async def get_pr_quest_client(
@@ -508,8 +779,11 @@ async def get_pr_quest_client(
     global _pr_quest_client_instance
 
     if force_new or _pr_quest_client_instance is None:
-        _pr_quest_client_instance = PRQuestClient(base_url=base_url, timeout=timeout)
-        await _pr_quest_client_instance.initialize()
+        async with _pr_quest_client_lock:
+            if force_new or _pr_quest_client_instance is None:
+                client = PRQuestClient(base_url=base_url, timeout=timeout)
+                await client.initialize()
+                _pr_quest_client_instance = client
 
     return _pr_quest_client_instance
 
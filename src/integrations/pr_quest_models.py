@@ -4,11 +4,13 @@ Data models for PR-QUEST integration.
 This module defines Pydantic models for PR-QUEST API requests and responses.
 """
 
-from dataclasses import dataclass, field
+import re
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from statistics import fmean
+from typing import Dict, List, NamedTuple, Optional
 
-from pydantic import BaseModel, Field, HttpUrl, validator
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, model_validator
 
 
 class RiskLevel(str, Enum):
@@ -20,6 +22,21 @@ class RiskLevel(str, Enum):
     CRITICAL = "CRITICAL"
 
 
+# Severity ranks for picking the highest risk level in one pass
+_RISK_LEVEL_RANK: Dict[RiskLevel, int] = {
+    RiskLevel.NONE: 0,
+    RiskLevel.LOW: 1,
+    RiskLevel.MODERATE: 2,
+    RiskLevel.CRITICAL: 3,
+}
+_RISK_LEVELS_BY_RANK: List[RiskLevel] = [
+    RiskLevel.NONE,
+    RiskLevel.LOW,
+    RiskLevel.MODERATE,
+    RiskLevel.CRITICAL,
+]
+
+
 class RiskType(str, Enum):
     """Types of risks that can be detected in PRs."""
 
@@ -55,10 +72,8 @@ class CodeCluster(BaseModel):
     line_count: int = Field(..., description="Total lines changed in cluster")
     category: Optional[str] = Field(None, description="Category (feature, bugfix, refactor)")
 
-    class Config:
-        """Pydantic config."""
-
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": "cluster-1",
                 "description": "Authentication middleware updates",
@@ -67,6 +82,7 @@ class CodeCluster(BaseModel):
                 "category": "feature",
             }
         }
+    )
 
 
 class Risk(BaseModel):
@@ -82,10 +98,8 @@ class Risk(BaseModel):
         ..., ge=0.0, le=1.0, description="Confidence in detection (0.0 to 1.0)"
     )
 
-    class Config:
-        """Pydantic config."""
-
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": "risk-1",
                 "type": "SECURITY",
@@ -96,6 +110,7 @@ class Risk(BaseModel):
                 "confidence": 0.95,
             }
         }
+    )
 
 
 class PRAnalysisResult(BaseModel):
@@ -123,21 +138,18 @@ class PRAnalysisResult(BaseModel):
     llm_used: bool = Field(True, description="Whether LLM was used for analysis")
     llm_model: Optional[str] = Field(None, description="LLM model used (e.g., gpt-4o-mini)")
 
-    @validator("overall_risk_level", always=True)
-    def calculate_overall_risk(cls, v, values):
+    @model_validator(mode="after")
+    def calculate_overall_risk(self) -> "PRAnalysisResult":
         """Calculate overall risk level from individual risks."""
-        if "risks" not in values or not values["risks"]:
-            return RiskLevel.NONE
+        if not self.risks:
+            self.overall_risk_level = RiskLevel.NONE
+            return self
 
         # Get highest severity from risks
-        severities = [risk.severity for risk in values["risks"]]
-        if RiskLevel.CRITICAL in severities:
-            return RiskLevel.CRITICAL
-        elif RiskLevel.MODERATE in severities:
-            return RiskLevel.MODERATE
-        elif RiskLevel.LOW in severities:
-            return RiskLevel.LOW
-        return RiskLevel.NONE
+        self.overall_risk_level = _RISK_LEVELS_BY_RANK[
+            max(_RISK_LEVEL_RANK[risk.severity] for risk in self.risks)
+        ]
+        return self
 
     def has_critical_risks(self) -> bool:
         """Check if any critical risks exist."""
@@ -151,10 +163,8 @@ class PRAnalysisResult(BaseModel):
         """Get all risks of a specific type."""
         return [risk for risk in self.risks if risk.type == risk_type]
 
-    class Config:
-        """Pydantic config."""
-
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "analysis_id": "ana_1234567890",
                 "pr_url": "https://github.com/bsw-arch/PIPE/pull/123",
@@ -171,6 +181,7 @@ class PRAnalysisResult(BaseModel):
                 "llm_model": "gpt-4o-mini",
             }
         }
+    )
 
 
 class ReviewStep(BaseModel):
@@ -183,10 +194,8 @@ class ReviewStep(BaseModel):
     guidance: Optional[str] = Field(None, description="LLM guidance for reviewing this step")
     notes: List[str] = Field(default_factory=list, description="Reviewer notes")
 
-    class Config:
-        """Pydantic config."""
-
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "step_id": "step-1",
                 "cluster_id": "cluster-1",
@@ -196,6 +205,7 @@ class ReviewStep(BaseModel):
                 "notes": [],
             }
         }
+    )
 
 
 class ReviewNote(BaseModel):
@@ -206,10 +216,8 @@ class ReviewNote(BaseModel):
     reviewer: str = Field(..., description="Reviewer username")
     timestamp: int = Field(..., description="Unix timestamp")
 
-    class Config:
-        """Pydantic config."""
-
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "step_id": "step-1",
                 "content": "Verified JWT signature algorithm is secure",
@@ -217,6 +225,7 @@ class ReviewNote(BaseModel):
                 "timestamp": 1705507200,
             }
         }
+    )
 
 
 class ReviewerXP(BaseModel):
@@ -229,10 +238,8 @@ class ReviewerXP(BaseModel):
     level: int = Field(..., description="Reviewer level (based on XP)")
     achievements: List[str] = Field(default_factory=list, description="Earned achievements")
 
-    class Config:
-        """Pydantic config."""
-
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "username": "john.doe",
                 "total_xp": 4500,
@@ -242,6 +249,7 @@ class ReviewerXP(BaseModel):
                 "achievements": ["First Review", "Critical Eye", "Speed Reviewer"],
             }
         }
+    )
 
 
 # ============================================================================
@@ -256,16 +264,15 @@ class AnalyzeRequest(BaseModel):
     include_llm_analysis: bool = Field(True, description="Use LLM for intelligent clustering")
     llm_model: Optional[str] = Field(None, description="Specific LLM model to use")
 
-    class Config:
-        """Pydantic config."""
-
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "pr_url": "https://github.com/bsw-arch/PIPE/pull/123",
                 "include_llm_analysis": True,
                 "llm_model": "gpt-4o-mini",
             }
         }
+    )
 
 
 class SubmitNotesRequest(BaseModel):
@@ -274,10 +281,8 @@ class SubmitNotesRequest(BaseModel):
     analysis_id: str = Field(..., description="Analysis ID")
     notes: List[ReviewNote] = Field(..., description="Review notes to add")
 
-    class Config:
-        """Pydantic config."""
-
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "analysis_id": "ana_1234567890",
                 "notes": [
@@ -290,43 +295,49 @@ class SubmitNotesRequest(BaseModel):
                 ],
             }
         }
+    )
 
 
 # ============================================================================
 # Utility Functions
 # ============================================================================
 
+class PRUrlParts(NamedTuple):
+    """Components of a GitHub PR URL."""
+
+    owner: str
+    repo: str
+    pr_number: str
+
 
-def parse_pr_url(pr_url: str) -> Dict[str, str]:
+# GitHub PR URL, optionally followed by a sub-path, query string or fragment
+_PR_URL_RE = re.compile(
+    r"^https?://github\.com/(?P<owner>[^/\s]+)/(?P<repo>[^/\s]+)"
+    r"/pull/(?P<pr_number>\d+)(?:[/?#].*)?$"
+)
+
+
+@lru_cache(maxsize=1024)
+def parse_pr_url(pr_url: str) -> PRUrlParts:
     """
     Parse GitHub PR URL to extract owner, repo, and PR number.
 
+    Results are cached, so repeated parses of the same URL are free.
+
     Args:
         pr_url: GitHub PR URL (e.g., https://github.com/owner/repo/pull/123)
 
     Returns:
-        Dict with 'owner', 'repo', and 'pr_number' keys
+        PRUrlParts with owner, repo, and pr_number
 
     Raises:
         ValueError: If URL format is invalid
     """
-    try:
-        # Remove trailing slash if present
-        pr_url = pr_url.rstrip("/")
+    match = _PR_URL_RE.match(pr_url) if isinstance(pr_url, str) else None
+    if match is None:
+        raise ValueError(f"Invalid GitHub PR URL format: {pr_url}")
 
-        # Expected format: https://github.com/owner/repo/pull/123
-        parts = pr_url.split("/")
-
-        if len(parts) < 7 or parts[2] != "github.com" or parts[5] != "pull":
-            raise ValueError("Invalid GitHub PR URL format")
-
-        return {
-            "owner": parts[3],
-            "repo": parts[4],
-            "pr_number": parts[6],
-        }
-    except (IndexError, AttributeError) as e:
-        raise ValueError(f"Failed to parse PR URL: {pr_url}") from e
+    return PRUrlParts(**match.groupdict())
 
 
 def determine_decision_from_analysis(
@@ -353,7 +364,7 @@ def determine_decision_from_analysis(
     # Low/no risks - can auto-approve if confidence is high enough
     if analysis.risks:
         # Calculate average confidence from all risks
-        avg_confidence = sum(risk.confidence for risk in analysis.risks) / len(analysis.risks)
+        avg_confidence = fmean(risk.confidence for risk in analysis.risks)
         if avg_confidence >= auto_approve_threshold:
             return ReviewDecision.APPROVE
         else:
@@ -4,12 +4,92 @@ Zitadel provides open-source identity and access management.
 This module handles OAuth 2.0, OIDC, and API authentication for PIPE.
 """
 
+import asyncio
+import hashlib
 import logging
 import os
+import time
 from typing import Dict, Any, Optional, List
 import aiohttp
-import jwt
-from datetime import datetime, timedelta
+
+try:
+    import jwt
+
+    JWT_AVAILABLE = True
+except ImportError:
+    JWT_AVAILABLE = False
+
+from ..utils import fast_json
+from ..utils.cache import TTLCache
+
+# Minimum seconds between JWKS fetches triggered by unknown key ids
+_JWKS_REFETCH_INTERVAL = 60.0
+
+# Max bytes of an error response body to read for logging
+_ERROR_BODY_LIMIT = 512
+
+# Connection pools shared by every ZitadelClient: management API calls, and
+# token introspection, which runs at much higher parallelism
+_shared_connector: Optional[aiohttp.TCPConnector] = None
+_introspection_connector: Optional[aiohttp.TCPConnector] = None
+
+
+def set_shared_connector(connector: aiohttp.TCPConnector) -> None:
+    """
+    Replace the connection pool shared by Zitadel client sessions.
+
+    Args:
+        connector: Connector to use for all subsequently created sessions
+    """
+    global _shared_connector
+    _shared_connector = connector
+
+
+def _get_shared_connector() -> aiohttp.TCPConnector:
+    """Get the shared connector, creating a pooled one if needed."""
+    global _shared_connector
+
+    if _shared_connector is None or _shared_connector.closed:
+        _shared_connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=20,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True,
+            keepalive_timeout=75,
+        )
+    return _shared_connector
+
+
+def set_introspection_connector(connector: aiohttp.TCPConnector) -> None:
+    """
+    Replace the connection pool used for token introspection.
+
+    Args:
+        connector: Connector to use for new introspection sessions
+    """
+    global _introspection_connector
+    _introspection_connector = connector
+
+
+def _get_introspection_connector() -> aiohttp.TCPConnector:
+    """Get the introspection connector, creating a pooled one if needed."""
+    global _introspection_connector
+
+    if _introspection_connector is None or _introspection_connector.closed:
+        _introspection_connector = aiohttp.TCPConnector(
+            limit=200,
+            limit_per_host=64,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True,
+            keepalive_timeout=75,
+        )
+    return _introspection_connector
+
+
+async def _read_error_text(response: aiohttp.ClientResponse) -> str:
+    """Read the start of an error response body for logging."""
+    body = await response.content.read(_ERROR_BODY_LIMIT)
+    return body.decode("utf-8", "replace")
 
 
 class ZitadelClient:
@@ -25,6 +105,10 @@ class ZitadelClient:
         client_id: str = None,
         client_secret: str = None,
         project_id: str = None,
+        introspection_cache_ttl: float = 10.0,
+        introspection_cache_size: int = 10000,
+        permission_cache_ttl: float = 5.0,
+        permission_cache_size: int = 10000,
     ):
         """
         Initialize Zitadel client.
@@ -34,6 +118,10 @@ class ZitadelClient:
             client_id: OAuth client ID
             client_secret: OAuth client secret
             project_id: Zitadel project ID
+            introspection_cache_ttl: Max seconds to reuse an introspection result
+            introspection_cache_size: Max number of cached introspection results
+            permission_cache_ttl: Seconds to reuse a permission check result
+            permission_cache_size: Max number of cached permission check results
         """
         self.issuer = issuer or os.getenv("ZITADEL_ISSUER", "http://localhost:8080")
         self.client_id = client_id or os.getenv("ZITADEL_CLIENT_ID")
@@ -41,25 +129,93 @@ class ZitadelClient:
         self.project_id = project_id or os.getenv("ZITADEL_PROJECT_ID")
         self.logger = logging.getLogger("pipe.integrations.zitadel")
 
+        # Endpoint URLs (or per-user templates) and the client-credentials
+        # form, built once
+        self._token_url = f"{self.issuer}/oauth/v2/token"
+        self._keys_url = f"{self.issuer}/oauth/v2/keys"
+        self._introspect_url = f"{self.issuer}/oauth/v2/introspect"
+        self._machine_users_url = f"{self.issuer}/management/v1/users/machine"
+        self._user_url_tpl = f"{self.issuer}/management/v1/users/{{user_id}}"
+        self._user_grants_url_tpl = self._user_url_tpl + "/grants"
+        self._user_grants_search_url_tpl = self._user_grants_url_tpl + "/_search"
+        self._project_roles_url = (
+            f"{self.issuer}/management/v1/projects/{self.project_id}/roles"
+        )
+        self._healthz_url = f"{self.issuer}/debug/healthz"
+        self._token_form = (
+            ("grant_type", "client_credentials"),
+            ("client_id", self.client_id),
+            ("client_secret", self.client_secret),
+            ("scope", "openid profile email urn:zitadel:iam:org:project:id:zitadel:aud"),
+        )
+
         self._session: Optional[aiohttp.ClientSession] = None
+        self._introspect_session: Optional[aiohttp.ClientSession] = None
         self._access_token: Optional[str] = None
-        self._token_expires: Optional[datetime] = None
+        self._token_expires: Optional[float] = None
+        self._token_lock = asyncio.Lock()
+        self._bearer_token: Optional[str] = None
+        self._bearer_headers: Dict[str, str] = {}
+        self._refresh_handle: Optional[asyncio.TimerHandle] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+
+        # Active introspection results keyed by SHA-256 of the token
+        self.introspection_cache_ttl = introspection_cache_ttl
+        self._introspect_cache = TTLCache(
+            maxsize=introspection_cache_size, ttl=introspection_cache_ttl
+        )
+
+        # Permission decisions keyed by (user_id, permission, resource)
+        self._perm_cache = TTLCache(
+            maxsize=permission_cache_size, ttl=permission_cache_ttl
+        )
+
+        # JWKS signing keys by key id, fetched on first use
+        self._jwks: Dict[str, "jwt.PyJWK"] = {}
+        self._jwks_fetched_at = float("-inf")
+
+    @staticmethod
+    def _new_session(connector: aiohttp.TCPConnector) -> aiohttp.ClientSession:
+        """Create a session on a shared connection pool."""
+        return aiohttp.ClientSession(
+            connector=connector,
+            connector_owner=False,
+            timeout=aiohttp.ClientTimeout(total=30, connect=5),
+            json_serialize=lambda obj: fast_json.dumps(obj).decode(),
+        )
 
     async def _ensure_session(self) -> aiohttp.ClientSession:
-        """Ensure aiohttp session exists."""
+        """Ensure the management API session exists on the shared pool."""
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
+            self._session = self._new_session(_get_shared_connector())
         return self._session
 
+    async def _ensure_introspect_session(self) -> aiohttp.ClientSession:
+        """Ensure the introspection session exists on its own pool."""
+        if self._introspect_session is None or self._introspect_session.closed:
+            self._introspect_session = self._new_session(
+                _get_introspection_connector()
+            )
+        return self._introspect_session
+
     async def close(self) -> None:
-        """Close the HTTP session."""
-        if self._session and not self._session.closed:
-            await self._session.close()
+        """Close the HTTP sessions (the shared connection pools stay open)."""
+        if self._refresh_handle:
+            self._refresh_handle.cancel()
+        if self._refresh_task and not self._refresh_task.done():
+            self._refresh_task.cancel()
+        for session in (self._session, self._introspect_session):
+            if session and not session.closed:
+                await session.close()
 
     async def get_access_token(self, force_refresh: bool = False) -> Optional[str]:
         """
         Get access token using client credentials flow.
 
+        Once a token is obtained, a background refresh is scheduled at 80%
+        of its lifetime so callers keep reading a valid cached token.
+        Concurrent refreshes are serialized so only one request is made.
+
         Args:
             force_refresh: Force token refresh even if not expired
 
@@ -67,43 +223,73 @@ class ZitadelClient:
             Access token or None
         """
         # Return cached token if still valid
-        if (
-            not force_refresh
-            and self._access_token
-            and self._token_expires
-            and datetime.now() < self._token_expires
-        ):
+        if not force_refresh and self._has_valid_token():
             return self._access_token
 
         if not self.client_id or not self.client_secret:
             self.logger.error("Client ID and secret not configured")
             return None
 
-        session = await self._ensure_session()
-        url = f"{self.issuer}/oauth/v2/token"
+        stale_token = self._access_token
 
-        payload = {
-            "grant_type": "client_credentials",
-            "client_id": self.client_id,
-            "client_secret": self.client_secret,
-            "scope": "openid profile email urn:zitadel:iam:org:project:id:zitadel:aud",
-        }
+        async with self._token_lock:
+            # Another caller may have refreshed while we waited; forced
+            # refreshes reuse it too, as long as it replaced the token they saw
+            if self._has_valid_token() and (
+                not force_refresh or self._access_token != stale_token
+            ):
+                return self._access_token
+
+            return await self._fetch_access_token()
+
+    def _has_valid_token(self) -> bool:
+        """Check whether the cached access token is still valid."""
+        return bool(
+            self._access_token
+            and self._token_expires
+            and time.monotonic() < self._token_expires
+        )
+
+    def _auth_headers(self, access_token: str) -> Dict[str, str]:
+        """Return the bearer Authorization header, built once per token."""
+        if access_token != self._bearer_token:
+            self._bearer_token = access_token
+            self._bearer_headers = {"Authorization": f"Bearer {access_token}"}
+        return self._bearer_headers
+
+    def _schedule_refresh(self, expires_in: float) -> None:
+        """Schedule a background token refresh at 80% of its lifetime."""
+        if self._refresh_handle:
+            self._refresh_handle.cancel()
+
+        self._refresh_handle = asyncio.get_running_loop().call_later(
+            expires_in * 0.8, self._start_refresh
+        )
+
+    def _start_refresh(self) -> None:
+        """Start the scheduled background token refresh."""
+        self._refresh_task = asyncio.ensure_future(
+            self.get_access_token(force_refresh=True)
+        )
+
+    async def _fetch_access_token(self) -> Optional[str]:
+        """Request a new access token from the token endpoint."""
+        session = await self._ensure_session()
 
         try:
-            async with session.post(
-                url, data=payload, headers={"Content-Type": "application/x-www-form-urlencoded"}
-            ) as response:
+            async with session.post(self._token_url, data=self._token_form) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = await response.json(loads=fast_json.loads)
                     self._access_token = data["access_token"]
                     expires_in = data.get("expires_in", 3600)
-                    self._token_expires = datetime.now() + timedelta(
-                        seconds=expires_in - 60
+                    self._token_expires = (
+                        time.monotonic() + expires_in - 60
                     )  # 60s buffer
+                    self._schedule_refresh(expires_in)
                     self.logger.info("Successfully obtained access token")
                     return self._access_token
                 else:
-                    error_text = await response.text()
+                    error_text = await _read_error_text(response)
                     self.logger.error(
                         f"Failed to get access token: {response.status} - {error_text}"
                     )
@@ -112,18 +298,118 @@ class ZitadelClient:
             self.logger.error(f"Error getting access token: {str(e)}")
             return None
 
-    async def verify_token(self, token: str) -> Optional[Dict[str, Any]]:
+    async def verify_token(
+        self, token: str, force_remote: bool = False
+    ) -> Optional[Dict[str, Any]]:
         """
         Verify and decode a JWT token.
 
+        When PyJWT is installed, JWTs are verified locally against the
+        issuer's JWKS signing keys. Opaque tokens, tokens signed with an
+        unknown key and ``force_remote`` calls fall back to remote
+        introspection.
+
+        Active results are cached for ``introspection_cache_ttl`` seconds,
+        or until the token expires if that is sooner. Inactive tokens are
+        never cached.
+
         Args:
             token: JWT token to verify
+            force_remote: Always use remote introspection
 
         Returns:
             Decoded token claims or None
         """
+        cache_key = hashlib.sha256(token.encode()).digest()
+        cached = self._introspect_cache.get(cache_key)
+        if cached is not None:
+            return dict(cached)
+
+        if JWT_AVAILABLE and not force_remote:
+            try:
+                claims = await self._verify_locally(token)
+            except jwt.InvalidTokenError as e:
+                self.logger.warning(f"Token is not valid: {str(e)}")
+                return None
+
+            if claims is not None:
+                claims["active"] = True
+                self._cache_claims(cache_key, claims)
+                return claims
+
+        return await self._introspect(token, cache_key)
+
+    def _cache_claims(self, cache_key: bytes, claims: Dict[str, Any]) -> None:
+        """Cache active token claims until they or the cache TTL expire."""
+        ttl = self.introspection_cache_ttl
+        if claims.get("exp"):
+            ttl = min(ttl, claims["exp"] - time.time())
+        if ttl > 0:
+            self._introspect_cache.set(cache_key, dict(claims), ttl=ttl)
+
+    async def _get_signing_key(self, key_id: str) -> Optional["jwt.PyJWK"]:
+        """Get a JWKS signing key, refetching the key set for unknown ids."""
+        if key_id in self._jwks:
+            return self._jwks[key_id]
+
+        # Unknown ids trigger a refetch, but at most once per interval
+        now = time.monotonic()
+        if now - self._jwks_fetched_at < _JWKS_REFETCH_INTERVAL:
+            return None
+        self._jwks_fetched_at = now
+
         session = await self._ensure_session()
-        url = f"{self.issuer}/oauth/v2/introspect"
+
+        try:
+            async with session.get(self._keys_url) as response:
+                if response.status != 200:
+                    self.logger.error(f"Failed to fetch JWKS: {response.status}")
+                    return None
+                jwks = await response.json(loads=fast_json.loads)
+                key_set = jwt.PyJWKSet.from_dict(jwks)
+        except Exception as e:
+            self.logger.error(f"Error fetching JWKS: {str(e)}")
+            return None
+
+        self._jwks = {key.key_id: key for key in key_set.keys if key.key_id}
+        return self._jwks.get(key_id)
+
+    async def _verify_locally(self, token: str) -> Optional[Dict[str, Any]]:
+        """
+        Verify a JWT signature and claims against the issuer's JWKS.
+
+        Returns:
+            Token claims, or None if the token cannot be verified locally
+
+        Raises:
+            jwt.InvalidTokenError: If the token is a JWT that fails verification
+        """
+        try:
+            header = jwt.get_unverified_header(token)
+        except jwt.DecodeError:
+            # Opaque token
+            return None
+
+        key_id = header.get("kid")
+        signing_key = await self._get_signing_key(key_id) if key_id else None
+        if signing_key is None:
+            return None
+
+        audience = [aud for aud in (self.project_id, self.client_id) if aud]
+        return jwt.decode(
+            token,
+            signing_key.key,
+            algorithms=[signing_key.algorithm_name],
+            audience=audience or None,
+            issuer=self.issuer,
+            options={"verify_aud": bool(audience)},
+        )
+
+    async def _introspect(
+        self, token: str, cache_key: bytes
+    ) -> Optional[Dict[str, Any]]:
+        """Verify a token with the remote introspection endpoint."""
+        session = await self._ensure_introspect_session()
 
         access_token = await self.get_access_token()
         if not access_token:
@@ -131,22 +417,22 @@ class ZitadelClient:
 
         payload = {"token": token, "client_id": self.client_id}
 
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/x-www-form-urlencoded",
-        }
+        headers = self._auth_headers(access_token)
 
         try:
-            async with session.post(url, data=payload, headers=headers) as response:
+            async with session.post(
+                self._introspect_url, data=payload, headers=headers
+            ) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = await response.json(loads=fast_json.loads)
                     if data.get("active"):
+                        self._cache_claims(cache_key, data)
                         return data
                     else:
                         self.logger.warning("Token is not active")
                         return None
                 else:
-                    error_text = await response.text()
+                    error_text = await _read_error_text(response)
                     self.logger.error(
                         f"Token verification failed: {response.status} - {error_text}"
                     )
@@ -173,12 +459,9 @@ class ZitadelClient:
             return None
 
         session = await self._ensure_session()
-        url = f"{self.issuer}/management/v1/users/machine"
+        url = self._machine_users_url
 
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
-        }
+        headers = self._auth_headers(access_token)
 
         payload = {
             "userName": name,
@@ -190,7 +473,7 @@ class ZitadelClient:
         try:
             async with session.post(url, json=payload, headers=headers) as response:
                 if response.status in [200, 201]:
-                    data = await response.json()
+                    data = await response.json(loads=fast_json.loads)
                     user_id = data["userId"]
                     self.logger.info(f"Created service account: {name} ({user_id})")
 
@@ -200,7 +483,7 @@ class ZitadelClient:
 
                     return data
                 else:
-                    error_text = await response.text()
+                    error_text = await _read_error_text(response)
                     self.logger.error(
                         f"Failed to create service account: {response.status} - {error_text}"
                     )
@@ -212,36 +495,30 @@ class ZitadelClient:
     async def _assign_roles(
         self, user_id: str, roles: List[str], access_token: str
     ) -> bool:
-        """Assign roles to a user."""
+        """Assign roles to a user with a single user grant."""
         session = await self._ensure_session()
+        url = self._user_grants_url_tpl.format(user_id=user_id)
 
-        for role in roles:
-            url = f"{self.issuer}/management/v1/users/{user_id}/grants"
-
-            headers = {
-                "Authorization": f"Bearer {access_token}",
-                "Content-Type": "application/json",
-            }
+        headers = self._auth_headers(access_token)
 
-            payload = {"projectId": self.project_id, "roleKeys": [role]}
+        payload = {"projectId": self.project_id, "roleKeys": list(roles)}
 
-            try:
-                async with session.post(
-                    url, json=payload, headers=headers
-                ) as response:
-                    if response.status in [200, 201]:
-                        self.logger.info(f"Assigned role {role} to user {user_id}")
-                    else:
-                        error_text = await response.text()
-                        self.logger.error(
-                            f"Failed to assign role: {response.status} - {error_text}"
-                        )
-                        return False
-            except Exception as e:
-                self.logger.error(f"Error assigning role: {str(e)}")
-                return False
-
-        return True
+        try:
+            async with session.post(url, json=payload, headers=headers) as response:
+                if response.status in [200, 201]:
+                    self.logger.info(
+                        f"Assigned roles {', '.join(roles)} to user {user_id}"
+                    )
+                    return True
+                else:
+                    error_text = await _read_error_text(response)
+                    self.logger.error(
+                        f"Failed to assign roles: {response.status} - {error_text}"
+                    )
+                    return False
+        except Exception as e:
+            self.logger.error(f"Error assigning roles: {str(e)}")
+            return False
 
     async def check_permission(
         self, user_id: str, permission: str, resource: str = None
@@ -257,34 +534,48 @@ class ZitadelClient:
         Returns:
             True if user has permission
         """
+        cache_key = (user_id, permission, resource)
+        cached = self._perm_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         access_token = await self.get_access_token()
         if not access_token:
             return False
 
         session = await self._ensure_session()
-        url = f"{self.issuer}/management/v1/users/{user_id}/grants/_search"
+        url = self._user_grants_search_url_tpl.format(user_id=user_id)
 
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
-        }
+        headers = self._auth_headers(access_token)
 
-        payload = {"query": {"limit": 100}, "sortingColumn": "GRANT_CREATION_DATE"}
+        # Let Zitadel filter by role key. No limit is set, so the check below
+        # still sees the matching grant if the filter is not applied
+        payload = {
+            "queries": [
+                {
+                    "roleKeyQuery": {
+                        "roleKey": permission,
+                        "method": "TEXT_QUERY_METHOD_EQUALS",
+                    }
+                }
+            ],
+        }
 
         try:
             async with session.post(url, json=payload, headers=headers) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = await response.json(loads=fast_json.loads)
                     grants = data.get("result", [])
 
-                    # Check if any grant contains the permission
-                    for grant in grants:
-                        if permission in grant.get("roleKeys", []):
-                            return True
-
-                    return False
+                    # Guard against servers that ignore the role key filter
+                    allowed = any(
+                        permission in set(grant.get("roleKeys", ()))
+                        for grant in grants
+                    )
+                    self._perm_cache.set(cache_key, allowed)
+                    return allowed
                 else:
-                    error_text = await response.text()
+                    error_text = await _read_error_text(response)
                     self.logger.error(
                         f"Permission check failed: {response.status} - {error_text}"
                     )
@@ -308,17 +599,17 @@ class ZitadelClient:
             return None
 
         session = await self._ensure_session()
-        url = f"{self.issuer}/management/v1/users/{user_id}"
+        url = self._user_url_tpl.format(user_id=user_id)
 
-        headers = {"Authorization": f"Bearer {access_token}"}
+        headers = self._auth_headers(access_token)
 
         try:
             async with session.get(url, headers=headers) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = await response.json(loads=fast_json.loads)
                     return data.get("user", {})
                 else:
-                    error_text = await response.text()
+                    error_text = await _read_error_text(response)
                     self.logger.error(
                         f"Failed to get user info: {response.status} - {error_text}"
                     )
@@ -346,12 +637,9 @@ class ZitadelClient:
             return False
 
         session = await self._ensure_session()
-        url = f"{self.issuer}/management/v1/projects/{self.project_id}/roles"
+        url = self._project_roles_url
 
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
-        }
+        headers = self._auth_headers(access_token)
 
         payload = {"roleKey": role_key, "displayName": display_name}
 
@@ -367,7 +655,7 @@ class ZitadelClient:
                     self.logger.info(f"Role already exists: {role_key}")
                     return True
                 else:
-                    error_text = await response.text()
+                    error_text = await _read_error_text(response)
                     self.logger.error(
                         f"Failed to create role: {response.status} - {error_text}"
                     )
@@ -384,7 +672,7 @@ class ZitadelClient:
             True if healthy
         """
         session = await self._ensure_session()
-        url = f"{self.issuer}/debug/healthz"
+        url = self._healthz_url
 
         try:
             async with session.get(url) as response:
@@ -414,9 +702,26 @@ async def get_zitadel_client(
     """
     global _zitadel_client
 
+    # No await between the check and the assignment, so concurrent callers
+    # on the loop cannot create two clients
     if _zitadel_client is None:
         _zitadel_client = ZitadelClient(
             issuer=issuer, client_id=client_id, client_secret=client_secret
         )
 
     return _zitadel_client
+
+
+async def close_zitadel_client() -> None:
+    """Close the Zitadel client singleton and the shared connection pools."""
+    global _zitadel_client, _shared_connector, _introspection_connector
+
+    client, _zitadel_client = _zitadel_client, None
+    if client is not None:
+        await client.close()
+
+    connectors = (_shared_connector, _introspection_connector)
+    _shared_connector = _introspection_connector = None
+    for connector in connectors:
+        if connector is not None and not connector.closed:
+            await connector.close()
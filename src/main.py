@@ -1,6 +1,8 @@
 """Main application entry point for PIPE domain bots."""
 
 import asyncio
+import logging
+import os
 import signal
 import sys
 from typing import List
@@ -15,6 +17,17 @@ from bots.pipeline_bot import PipelineBot
 from bots.data_processor_bot import DataProcessorBot
 from bots.monitor_bot import MonitorBot
 from bots.integration_hub_bot import IntegrationHubBot
+from integrations.cognee_client import close_cognee_client
+from integrations.zitadel_client import close_zitadel_client, get_zitadel_client
+
+try:
+    import uvloop
+
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+logger = logging.getLogger("pipe.orchestrator")
 
 
 class BotOrchestrator:
@@ -37,6 +50,7 @@ class BotOrchestrator:
         self.state_manager = StateManager(config.get("state_dir", "./state"))
         self.metrics = MetricsCollector()
         self.shutdown_event = asyncio.Event()
+        self.logger = logger
 
         # Set up logging
         log_config = config.get("logging", {})
@@ -91,24 +105,42 @@ class BotOrchestrator:
             )
             self.bots.append(integration_hub)
 
-        print(f"Initialized {len(self.bots)} bots")
+        self.logger.info("Initialized %d bots", len(self.bots))
+
+        await self.warm_up_zitadel()
+
+    async def warm_up_zitadel(self) -> None:
+        """
+        Open pooled Zitadel connections before bots send real traffic.
+
+        Runs only when ZITADEL_ISSUER is set. Failures are logged and never
+        block startup.
+        """
+        if not os.getenv("ZITADEL_ISSUER"):
+            return
+
+        client = await get_zitadel_client()
+        warm_ups = [client.health_check()]
+        if client.client_id and client.client_secret:
+            warm_ups.append(client.get_access_token())
+
+        healthy, *token = await asyncio.gather(*warm_ups)
+        if not healthy or token == [None]:
+            self.logger.warning("Zitadel warm-up failed, continuing startup")
 
     async def start_bots(self) -> None:
         """Start all bots."""
-        print("Starting PIPE domain bots...")
+        self.logger.info("Starting PIPE domain bots...")
 
-        tasks = []
-        for bot in self.bots:
-            task = asyncio.create_task(bot.start())
-            tasks.append(task)
+        # Bots initialize concurrently, so startup takes as long as the slowest
+        tasks = [asyncio.create_task(bot.start()) for bot in self.bots]
 
         # Wait for shutdown signal
         await self.shutdown_event.wait()
 
-        # Stop all bots
-        print("\nShutting down bots...")
-        for bot in self.bots:
-            await bot.stop()
+        # Stop all bots concurrently
+        self.logger.info("Shutting down bots...")
+        await asyncio.gather(*(bot.stop() for bot in self.bots))
 
         # Wait for all bot tasks to complete
         await asyncio.gather(*tasks, return_exceptions=True)
@@ -119,33 +151,36 @@ class BotOrchestrator:
             await self.initialize_bots()
             await self.start_bots()
         except KeyboardInterrupt:
-            print("\nReceived interrupt signal")
+            self.logger.info("Received interrupt signal")
         except Exception as e:
-            print(f"Error running orchestrator: {str(e)}")
+            self.logger.error("Error running orchestrator: %s", e)
             raise
         finally:
-            print("Orchestrator shutdown complete")
+            await close_cognee_client()
+            await close_zitadel_client()
+            self.logger.info("Orchestrator shutdown complete")
 
-    def handle_shutdown(self, signum, frame):
+    def handle_shutdown(self, signum, frame=None):
         """Handle shutdown signals."""
-        print(f"\nReceived signal {signum}")
+        self.logger.info("Received signal %s", signum)
         self.shutdown_event.set()
 
 
 async def main():
     """Main entry point."""
-    print("=" * 60)
-    print("PIPE Domain Bot System")
-    print("BSW Architecture Project")
-    print("=" * 60)
-    print()
+    # Log with defaults until the configured logging takes over
+    setup_logging()
+    logger.info("=" * 60)
+    logger.info("PIPE Domain Bot System")
+    logger.info("BSW Architecture Project")
+    logger.info("=" * 60)
 
     # Load configuration
     try:
         config = load_config(config_dir="./config")
     except Exception as e:
-        print(f"Failed to load configuration: {str(e)}")
-        print("Using default configuration")
+        logger.warning("Failed to load configuration: %s", e)
+        logger.warning("Using default configuration")
         config = {
             "state_dir": "./state",
             "logging": {"level": "INFO"},
@@ -173,17 +208,25 @@ async def main():
     # Create orchestrator
     orchestrator = BotOrchestrator(config)
 
-    # Set up signal handlers
-    signal.signal(signal.SIGINT, orchestrator.handle_shutdown)
-    signal.signal(signal.SIGTERM, orchestrator.handle_shutdown)
+    # Set up signal handlers on the event loop so shutdown runs as a callback
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(signum, orchestrator.handle_shutdown, signum)
+        except NotImplementedError:
+            # Event loops without signal support (e.g. on Windows)
+            signal.signal(signum, orchestrator.handle_shutdown)
 
     # Run
     await orchestrator.run()
 
 
 if __name__ == "__main__":
+    if UVLOOP_AVAILABLE:
+        uvloop.install()
+
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
-        print("\nShutdown complete")
+        logger.info("Shutdown complete")
         sys.exit(0)
@@ -5,8 +5,12 @@ Provides health check endpoints for load balancers,
 orchestrators, and monitoring systems.
 """
 
+import bisect
 import logging
-from typing import Dict, Any, List, Optional
+import time
+from collections import Counter, deque
+from itertools import islice
+from typing import Deque, Dict, Any, List, NamedTuple, Optional
 from datetime import datetime
 from enum import Enum
 
@@ -20,6 +24,37 @@ class HealthStatus(Enum):
     UNKNOWN = "unknown"
 
 
+_HEALTHY = HealthStatus.HEALTHY.value
+_DEGRADED = HealthStatus.DEGRADED.value
+_UNHEALTHY = HealthStatus.UNHEALTHY.value
+
+# Severity order used to pick the worst of several status values
+_STATUS_SEVERITY = {_HEALTHY: 0, _DEGRADED: 1, _UNHEALTHY: 2}
+
+
+# Compliance percentage bands: below 30 is critical, below 50 is low
+_COMPLIANCE_THRESHOLDS = (30, 50)
+_COMPLIANCE_STATUS = (_UNHEALTHY, _DEGRADED, _HEALTHY)
+_COMPLIANCE_ISSUE = ("Critical compliance", "Low compliance", None)
+
+# Pending review bands: more than 10 is a backlog
+_BACKLOG_THRESHOLDS = (10,)
+_BACKLOG_STATUS = (_HEALTHY, _DEGRADED)
+
+
+class _HealthRecord(NamedTuple):
+    """Compact health history entry; expanded to a dict only when read."""
+
+    timestamp: str
+    status: str
+    issue_count: int
+
+
+def _worst_status(*statuses: str) -> str:
+    """Return the most severe of the given status values."""
+    return max(statuses, key=_STATUS_SEVERITY.__getitem__)
+
+
 class HealthChecker:
     """
     Comprehensive health checking system.
@@ -32,9 +67,12 @@ class HealthChecker:
         """Initialize health checker."""
         self.logger = logging.getLogger("pipe.monitoring.health")
         self.start_time = datetime.now()
+        self._start_monotonic = time.monotonic()
         self.last_health_check = None
-        self.health_history: List[Dict[str, Any]] = []
         self.max_history = 100
+        self.health_history: Deque[_HealthRecord] = deque(maxlen=self.max_history)
+        # Status counts over health_history, kept in step with it
+        self._status_counts: Counter = Counter()
 
     def liveness_check(self) -> Dict[str, Any]:
         """
@@ -70,21 +108,25 @@ class HealthChecker:
         ready = True
         reasons = []
 
-        # Check if any bots are in error state
         if bot_statuses:
-            error_bots = [bot for bot in bot_statuses if bot.get("status") == "error"]
-            if error_bots:
+            error_names = []
+            running_bots = 0
+            for bot in bot_statuses:
+                bot_status = bot.get("status")
+                if bot_status == "error":
+                    error_names.append(bot["name"])
+                elif bot_status == "running":
+                    running_bots += 1
+
+            # Check if any bots are in error state
+            if error_names:
                 ready = False
                 reasons.append(
-                    f"{len(error_bots)} bot(s) in error state: "
-                    f"{[bot['name'] for bot in error_bots]}"
+                    f"{len(error_names)} bot(s) in error state: {error_names}"
                 )
 
             # Check if minimum bots are running
-            running_bots = [
-                bot for bot in bot_statuses if bot.get("status") == "running"
-            ]
-            if len(running_bots) == 0:
+            if running_bots == 0:
                 ready = False
                 reasons.append("No bots are running")
 
@@ -118,9 +160,10 @@ class HealthChecker:
         Returns:
             Detailed health status
         """
+        now = datetime.now()
         health_data = {
-            "status": HealthStatus.HEALTHY.value,
-            "timestamp": datetime.now().isoformat(),
+            "status": _HEALTHY,
+            "timestamp": now.isoformat(),
             "uptime_seconds": self._get_uptime_seconds(),
             "components": {},
             "metrics": {},
@@ -132,8 +175,10 @@ class HealthChecker:
             bot_health = self._check_bot_health(bot_statuses)
             health_data["components"]["bots"] = bot_health
 
-            if bot_health["status"] != HealthStatus.HEALTHY.value:
-                health_data["status"] = bot_health["status"]
+            if bot_health["status"] != _HEALTHY:
+                health_data["status"] = _worst_status(
+                    health_data["status"], bot_health["status"]
+                )
                 health_data["issues"].extend(bot_health.get("issues", []))
 
         # Check governance health
@@ -141,13 +186,11 @@ class HealthChecker:
             gov_health = self._check_governance_health(governance_dashboard)
             health_data["components"]["governance"] = gov_health
 
-            if gov_health["status"] != HealthStatus.HEALTHY.value:
+            if gov_health["status"] != _HEALTHY:
                 # Degrade overall status if needed
-                if (
-                    health_data["status"] == HealthStatus.HEALTHY.value
-                    or gov_health["status"] == HealthStatus.UNHEALTHY.value
-                ):
-                    health_data["status"] = gov_health["status"]
+                health_data["status"] = _worst_status(
+                    health_data["status"], gov_health["status"]
+                )
                 health_data["issues"].extend(gov_health.get("issues", []))
 
         # Add metrics summary
@@ -155,7 +198,7 @@ class HealthChecker:
             health_data["metrics"] = self._extract_key_metrics(metrics)
 
         # Record health check
-        self.last_health_check = datetime.now()
+        self.last_health_check = now
         self._record_health_check(health_data)
 
         return health_data
@@ -163,25 +206,29 @@ class HealthChecker:
     def _check_bot_health(self, bot_statuses: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Check health of bot system."""
         total_bots = len(bot_statuses)
-        running_bots = sum(1 for bot in bot_statuses if bot.get("status") == "running")
-        error_bots = sum(1 for bot in bot_statuses if bot.get("status") == "error")
-        total_errors = sum(bot.get("error_count", 0) for bot in bot_statuses)
+        running_bots = error_bots = total_errors = 0
+        for bot in bot_statuses:
+            bot_status = bot.get("status")
+            if bot_status == "running":
+                running_bots += 1
+            elif bot_status == "error":
+                error_bots += 1
+            total_errors += bot.get("error_count", 0)
 
         issues = []
-        status = HealthStatus.HEALTHY.value
+        status = _HEALTHY
 
         # Determine health status
         if error_bots > 0:
-            status = HealthStatus.DEGRADED.value
+            status = _DEGRADED
             issues.append(f"{error_bots} bot(s) in error state")
 
         if running_bots == 0:
-            status = HealthStatus.UNHEALTHY.value
+            status = _UNHEALTHY
             issues.append("No bots are running")
 
         if total_errors > 100:
-            if status == HealthStatus.HEALTHY.value:
-                status = HealthStatus.DEGRADED.value
+            status = _worst_status(status, _DEGRADED)
             issues.append(f"High error count: {total_errors} total errors")
 
         return {
@@ -202,22 +249,21 @@ class HealthChecker:
         reviews = governance_dashboard.get("reviews", {})
 
         issues = []
-        status = HealthStatus.HEALTHY.value
 
         # Check compliance
         compliance_pct = compliance.get("ecosystem_percentage", 0)
-        if compliance_pct < 50:
-            status = HealthStatus.DEGRADED.value
-            issues.append(f"Low compliance: {compliance_pct:.1f}%")
-        elif compliance_pct < 30:
-            status = HealthStatus.UNHEALTHY.value
-            issues.append(f"Critical compliance: {compliance_pct:.1f}%")
+        band = bisect.bisect_right(_COMPLIANCE_THRESHOLDS, compliance_pct)
+        status = _COMPLIANCE_STATUS[band]
+        if status != _HEALTHY:
+            issues.append(f"{_COMPLIANCE_ISSUE[band]}: {compliance_pct:.1f}%")
 
         # Check review backlog
         pending_reviews = reviews.get("pending", 0)
-        if pending_reviews > 10:
-            if status == HealthStatus.HEALTHY.value:
-                status = HealthStatus.DEGRADED.value
+        backlog_status = _BACKLOG_STATUS[
+            bisect.bisect_left(_BACKLOG_THRESHOLDS, pending_reviews)
+        ]
+        if backlog_status != _HEALTHY:
+            status = _worst_status(status, backlog_status)
             issues.append(f"High review backlog: {pending_reviews} pending")
 
         return {
@@ -245,23 +291,24 @@ class HealthChecker:
         return key_metrics
 
     def _get_uptime_seconds(self) -> float:
-        """Get application uptime in seconds."""
-        delta = datetime.now() - self.start_time
-        return delta.total_seconds()
+        """Get application uptime in seconds (immune to wall-clock changes)."""
+        return time.monotonic() - self._start_monotonic
 
     def _record_health_check(self, health_data: Dict[str, Any]) -> None:
-        """Record health check in history."""
+        """Record health check in history, dropping the oldest when full."""
+        if len(self.health_history) == self.health_history.maxlen:
+            evicted = self.health_history[0].status
+            self._status_counts[evicted] -= 1
+            if not self._status_counts[evicted]:
+                del self._status_counts[evicted]
+
+        status = health_data["status"]
         self.health_history.append(
-            {
-                "timestamp": health_data["timestamp"],
-                "status": health_data["status"],
-                "issue_count": len(health_data.get("issues", [])),
-            }
+            _HealthRecord(
+                health_data["timestamp"], status, len(health_data.get("issues", []))
+            )
         )
-
-        # Trim history if needed
-        if len(self.health_history) > self.max_history:
-            self.health_history = self.health_history[-self.max_history :]
+        self._status_counts[status] += 1
 
     def get_health_history(self, limit: int = 50) -> List[Dict[str, Any]]:
         """
@@ -273,7 +320,8 @@ class HealthChecker:
         Returns:
             List of health check records
         """
-        return self.health_history[-limit:]
+        start = max(0, len(self.health_history) - limit)
+        return [record._asdict() for record in islice(self.health_history, start, None)]
 
     def get_health_summary(self) -> Dict[str, Any]:
         """
@@ -289,20 +337,15 @@ class HealthChecker:
                 "status_distribution": {},
             }
 
-        status_counts = {}
-        for entry in self.health_history:
-            status = entry["status"]
-            status_counts[status] = status_counts.get(status, 0) + 1
+        status_counts = dict(self._status_counts)
 
         return {
             "total_checks": len(self.health_history),
             "last_check": (
-                self.health_history[-1]["timestamp"] if self.health_history else None
+                self.health_history[-1].timestamp if self.health_history else None
             ),
             "status_distribution": status_counts,
             "healthy_percentage": (
-                100
-                * status_counts.get(HealthStatus.HEALTHY.value, 0)
-                / len(self.health_history)
+                100 * status_counts.get(_HEALTHY, 0) / len(self.health_history)
             ),
         }
@@ -6,14 +6,124 @@ and health checks (liveness/readiness probes).
 """
 
 import asyncio
+import gzip
+import hashlib
 import logging
-from typing import Optional, Dict, Any, List, Callable
+from typing import (
+    Optional,
+    Dict,
+    Any,
+    List,
+    Callable,
+    Awaitable,
+    Tuple,
+    AsyncIterator,
+)
 from aiohttp import web
 
 from .prometheus_exporter import PrometheusExporter
 from .health_checker import HealthChecker
+from ..utils import fast_json
+from ..utils.cache import TTLCache
 from ..utils.metrics import MetricsCollector
 
+# Rendered response: (body, status, content type header)
+_RenderedResponse = Tuple[bytes, int, str]
+# Cached response: rendered response plus its ETag
+_CachedResponse = Tuple[bytes, int, str, str]
+
+_JSON_CONTENT_TYPE = "application/json; charset=utf-8"
+_METRICS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+_GZIP_HEADERS = {"Content-Encoding": "gzip", "Vary": "Accept-Encoding"}
+_JSON_HEADERS = {"Content-Type": _JSON_CONTENT_TYPE}
+
+# Static index page, encoded once and served with a fixed validator
+_INDEX_HTML_BYTES = """\
+<!DOCTYPE html>
+<html>
+<head>
+    <title>PIPE Metrics & Health</title>
+    <style>
+        body {
+            font-family: Arial, sans-serif;
+            max-width: 800px;
+            margin: 50px auto;
+            padding: 20px;
+        }
+        h1 { color: #333; }
+        ul { list-style-type: none; padding: 0; }
+        li { margin: 10px 0; }
+        a {
+            color: #007bff;
+            text-decoration: none;
+            padding: 5px 10px;
+            border: 1px solid #007bff;
+            border-radius: 3px;
+            display: inline-block;
+        }
+        a:hover { background-color: #007bff; color: white; }
+        .description { color: #666; margin-left: 10px; }
+    </style>
+</head>
+<body>
+    <h1>PIPE Metrics & Health Server</h1>
+    <p>Available endpoints:</p>
+    <ul>
+        <li>
+            <a href="/metrics">/metrics</a>
+            <span class="description">Prometheus metrics (text format)</span>
+        </li>
+        <li>
+            <a href="/health/live">/health/live</a>
+            <span class="description">Liveness probe (JSON)</span>
+        </li>
+        <li>
+            <a href="/health/ready">/health/ready</a>
+            <span class="description">Readiness probe (JSON)</span>
+        </li>
+        <li>
+            <a href="/health">/health</a>
+            <span class="description">Detailed health check (JSON)</span>
+        </li>
+    </ul>
+    <hr>
+    <p style="color: #999; font-size: 12px;">
+        PIPE Bot System - Monitoring & Observability
+    </p>
+</body>
+</html>
+""".encode("utf-8")
+_INDEX_ETAG = f'"{hashlib.blake2b(_INDEX_HTML_BYTES, digest_size=8).hexdigest()}"'
+_INDEX_HEADERS = {"Cache-Control": "public, max-age=3600", "ETag": _INDEX_ETAG}
+
+
+def _json_response(data: Any, status: int = 200) -> web.Response:
+    """Build a JSON response encoded with fast_json."""
+    return web.Response(
+        body=fast_json.dumps(data), status=status, headers=_JSON_HEADERS
+    )
+
+
+async def _run_callback(callback: Callable, is_async: bool) -> Any:
+    """
+    Run a state callback without blocking the event loop.
+
+    Args:
+        callback: Callback to run
+        is_async: Whether the callback is a coroutine function
+
+    Returns:
+        Callback result
+    """
+    if is_async:
+        return await callback()
+
+    result = await asyncio.get_running_loop().run_in_executor(None, callback)
+    # Plain callables may still hand back a coroutine (e.g. partials)
+    if asyncio.iscoroutine(result):
+        return await result
+    return result
+
 
 class MetricsServer:
     """
@@ -32,6 +142,8 @@ class MetricsServer:
         health_checker: HealthChecker,
         port: int = 9090,
         host: str = "0.0.0.0",
+        cache_ttl: float = 5.0,
+        refresh_interval: float = 5.0,
     ):
         """
         Initialize metrics server.
@@ -41,6 +153,12 @@ class MetricsServer:
             health_checker: HealthChecker instance
             port: Port to listen on (default: 9090)
             host: Host to bind to (default: 0.0.0.0)
+            cache_ttl: Seconds to reuse rendered /metrics and /health*
+                responses (default: 5.0, 0 disables caching)
+            refresh_interval: Seconds between background refreshes of the
+                /health/ready and /health snapshots while the server runs
+                (default: 5.0, 0 disables the refresh task; it also stays off
+                when caching is disabled)
         """
         self.metrics_collector = metrics_collector
         self.health_checker = health_checker
@@ -48,12 +166,21 @@ class MetricsServer:
         self.host = host
         self.logger = logging.getLogger("pipe.monitoring.server")
 
+        # Rendered responses per endpoint, recomputed by one request at a time
+        self._response_cache = TTLCache(maxsize=8, ttl=cache_ttl)
+        self._render_locks: Dict[str, asyncio.Lock] = {}
+        self.cache_ttl = cache_ttl
+        self.refresh_interval = refresh_interval
+        self._refresh_task: Optional[asyncio.Task] = None
+
         # Create Prometheus exporter
         self.prometheus = PrometheusExporter(metrics_collector)
 
         # Callbacks for fetching current state
         self.bot_status_callback: Optional[Callable] = None
         self.governance_dashboard_callback: Optional[Callable] = None
+        self._bot_status_callback_async = False
+        self._governance_dashboard_callback_async = False
 
         # Create web application
         self.app = web.Application()
@@ -76,18 +203,24 @@ class MetricsServer:
         Set callback for fetching bot statuses.
 
         Args:
-            callback: Function that returns list of bot status dicts
+            callback: Function or coroutine function that returns list of
+                bot status dicts; plain functions run in the default executor
         """
         self.bot_status_callback = callback
+        self._bot_status_callback_async = asyncio.iscoroutinefunction(callback)
 
     def set_governance_dashboard_callback(self, callback: Callable) -> None:
         """
         Set callback for fetching governance dashboard.
 
         Args:
-            callback: Function that returns governance dashboard dict
+            callback: Function or coroutine function that returns governance
+                dashboard dict; plain functions run in the default executor
         """
         self.governance_dashboard_callback = callback
+        self._governance_dashboard_callback_async = asyncio.iscoroutinefunction(
+            callback
+        )
 
     async def handle_metrics(self, request: web.Request) -> web.Response:
         """
@@ -99,34 +232,90 @@ class MetricsServer:
         Returns:
             Prometheus-formatted metrics response
         """
+        if self.cache_ttl <= 0:
+            return await self._stream_metrics(request)
+
         try:
-            # Export basic metrics
-            metrics_text = self.prometheus.export_metrics()
-
-            # Add bot metrics if available
-            if self.bot_status_callback:
-                bot_statuses = await self._get_bot_statuses()
-                bot_metrics = self.prometheus.get_bot_metrics(bot_statuses)
-                metrics_text += "\n" + bot_metrics
-
-            # Add governance metrics if available
-            if self.governance_dashboard_callback:
-                gov_dashboard = await self._get_governance_dashboard()
-                gov_metrics = self.prometheus.get_governance_metrics(gov_dashboard)
-                metrics_text += "\n" + gov_metrics
-
-            return web.Response(
-                text=metrics_text,
-                content_type="text/plain; version=0.0.4",
-                charset="utf-8",
-            )
+            # Scrapers usually accept gzip; serve a separately cached
+            # compressed copy so each TTL window compresses at most once
+            if "gzip" in request.headers.get("Accept-Encoding", ""):
+                return await self._cached_response(
+                    request, "metrics.gz", self._render_metrics_gzip, _GZIP_HEADERS
+                )
+            return await self._cached_response(request, "metrics", self._render_metrics)
         except Exception as e:
-            self.logger.error(f"Error generating metrics: {str(e)}", exc_info=True)
-            return web.Response(
-                text=f"Error generating metrics: {str(e)}",
-                status=500,
-                content_type="text/plain",
-            )
+            return self._metrics_error_response(e)
+
+    def _metrics_error_response(self, error: Exception) -> web.Response:
+        """Log a metrics generation failure and build the 500 response."""
+        self.logger.error(f"Error generating metrics: {str(error)}", exc_info=True)
+        return web.Response(
+            text=f"Error generating metrics: {str(error)}",
+            status=500,
+            content_type="text/plain",
+        )
+
+    async def _iter_metrics_sections(self) -> AsyncIterator[str]:
+        """Yield the Prometheus metrics page section by section."""
+        # Fetch bot and governance state concurrently
+        bot_statuses, gov_dashboard = await asyncio.gather(
+            self._get_bot_statuses(), self._get_governance_dashboard()
+        )
+
+        # Export basic metrics
+        yield self.prometheus.export_metrics()
+
+        # Add bot metrics if available
+        if self.bot_status_callback:
+            yield self.prometheus.get_bot_metrics(bot_statuses)
+
+        # Add governance metrics if available
+        if self.governance_dashboard_callback:
+            yield self.prometheus.get_governance_metrics(gov_dashboard)
+
+    async def _render_metrics(self) -> _RenderedResponse:
+        """Render the Prometheus metrics page."""
+        # Encode each section once and join the bytes, no string concatenation
+        body = b"\n".join(
+            [section.encode("utf-8") async for section in self._iter_metrics_sections()]
+        )
+        return body, 200, _METRICS_CONTENT_TYPE
+
+    async def _stream_metrics(self, request: web.Request) -> web.StreamResponse:
+        """
+        Stream the metrics page section by section when caching is disabled.
+
+        Peak memory is bounded by the largest section instead of the whole
+        page. Failures before the first section is sent still produce a 500.
+
+        Args:
+            request: HTTP request
+
+        Returns:
+            Streamed Prometheus-formatted metrics response
+        """
+        sections = self._iter_metrics_sections()
+        try:
+            first = await sections.__anext__()
+        except Exception as e:
+            return self._metrics_error_response(e)
+
+        response = web.StreamResponse(headers={"Content-Type": _METRICS_CONTENT_TYPE})
+        if "gzip" in request.headers.get("Accept-Encoding", ""):
+            response.enable_compression(web.ContentCoding.gzip)
+        await response.prepare(request)
+
+        await response.write(first.encode("utf-8"))
+        async for section in sections:
+            await response.write(b"\n" + section.encode("utf-8"))
+
+        await response.write_eof()
+        return response
+
+    async def _render_metrics_gzip(self) -> _RenderedResponse:
+        """Render the Prometheus metrics page, gzip-compressed."""
+        body, status, content_type = await self._render_metrics()
+        return gzip.compress(body, compresslevel=6), status, content_type
 
     async def handle_liveness(self, request: web.Request) -> web.Response:
         """
@@ -140,10 +329,10 @@ class MetricsServer:
         """
         try:
             liveness = self.health_checker.liveness_check()
-            return web.json_response(liveness, status=200)
+            return _json_response(liveness)
         except Exception as e:
             self.logger.error(f"Liveness check failed: {str(e)}", exc_info=True)
-            return web.json_response({"status": "error", "message": str(e)}, status=503)
+            return _json_response({"status": "error", "message": str(e)}, status=503)
 
     async def handle_readiness(self, request: web.Request) -> web.Response:
         """
@@ -156,14 +345,10 @@ class MetricsServer:
             Readiness status (200 = ready, 503 = not ready)
         """
         try:
-            bot_statuses = await self._get_bot_statuses()
-            readiness = self.health_checker.readiness_check(bot_statuses)
-
-            status_code = 200 if readiness["ready"] else 503
-            return web.json_response(readiness, status=status_code)
+            return await self._cached_response(request, "ready", self._render_readiness)
         except Exception as e:
             self.logger.error(f"Readiness check failed: {str(e)}", exc_info=True)
-            return web.json_response(
+            return _json_response(
                 {"status": "error", "ready": False, "message": str(e)}, status=503
             )
 
@@ -178,22 +363,89 @@ class MetricsServer:
             Detailed health status
         """
         try:
-            bot_statuses = await self._get_bot_statuses()
-            gov_dashboard = await self._get_governance_dashboard()
-            metrics = self.metrics_collector.get_all_metrics()
-
-            health = self.health_checker.detailed_health_check(
-                bot_statuses=bot_statuses,
-                governance_dashboard=gov_dashboard,
-                metrics=metrics,
-            )
-
-            # Return 200 for healthy/degraded, 503 for unhealthy
-            status_code = 200 if health["status"] != "unhealthy" else 503
-            return web.json_response(health, status=status_code)
+            return await self._cached_response(request, "health", self._render_health)
         except Exception as e:
             self.logger.error(f"Health check failed: {str(e)}", exc_info=True)
-            return web.json_response({"status": "error", "message": str(e)}, status=503)
+            return _json_response({"status": "error", "message": str(e)}, status=503)
+
+    async def _render_readiness(self) -> _RenderedResponse:
+        """Render the readiness probe result."""
+        bot_statuses = await self._get_bot_statuses()
+        readiness = self.health_checker.readiness_check(bot_statuses)
+
+        status_code = 200 if readiness["ready"] else 503
+        return fast_json.dumps(readiness), status_code, _JSON_CONTENT_TYPE
+
+    async def _render_health(self) -> _RenderedResponse:
+        """Render the detailed health check result."""
+        bot_statuses, gov_dashboard = await asyncio.gather(
+            self._get_bot_statuses(), self._get_governance_dashboard()
+        )
+        metrics = self.metrics_collector.get_all_metrics()
+
+        health = self.health_checker.detailed_health_check(
+            bot_statuses=bot_statuses,
+            governance_dashboard=gov_dashboard,
+            metrics=metrics,
+        )
+
+        # Return 200 for healthy/degraded, 503 for unhealthy
+        status_code = 200 if health["status"] != "unhealthy" else 503
+        return fast_json.dumps(health), status_code, _JSON_CONTENT_TYPE
+
+    def _store_response(
+        self, key: str, rendered: _RenderedResponse, ttl: Optional[float] = None
+    ) -> _CachedResponse:
+        """Cache a rendered response together with a strong ETag for it."""
+        body, status, content_type = rendered
+        etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+        cached = (body, status, content_type, etag)
+        self._response_cache.set(key, cached, ttl=ttl)
+        return cached
+
+    async def _cached_response(
+        self,
+        request: web.Request,
+        key: str,
+        render: Callable[[], Awaitable[_RenderedResponse]],
+        headers: Optional[Dict[str, str]] = None,
+    ) -> web.Response:
+        """
+        Serve a rendered response, re-rendering it at most once per TTL.
+
+        Concurrent requests for an expired entry wait for a single render.
+        Exceptions propagate and are never cached. Successful responses carry
+        an ETag, and a matching If-None-Match gets an empty 304.
+
+        Args:
+            request: HTTP request
+            key: Cache key for the endpoint
+            render: Coroutine function producing the response parts
+            headers: Extra response headers, e.g. Content-Encoding
+
+        Returns:
+            HTTP response
+        """
+        cached = self._response_cache.get(key)
+        if cached is None:
+            lock = self._render_locks.get(key)
+            if lock is None:
+                lock = self._render_locks[key] = asyncio.Lock()
+
+            async with lock:
+                cached = self._response_cache.get(key)
+                if cached is None:
+                    cached = self._store_response(key, await render())
+
+        body, status, content_type, etag = cached
+        response_headers = {"Content-Type": content_type, "ETag": etag}
+        if headers:
+            response_headers.update(headers)
+
+        if status == 200 and etag in request.headers.get("If-None-Match", ""):
+            del response_headers["Content-Type"]
+            return web.Response(status=304, headers=response_headers)
+        return web.Response(body=body, status=status, headers=response_headers)
 
     async def handle_index(self, request: web.Request) -> web.Response:
         """
@@ -205,101 +457,81 @@ class MetricsServer:
         Returns:
             HTML index page
         """
-        html = """
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>PIPE Metrics & Health</title>
-            <style>
-                body {
-                    font-family: Arial, sans-serif;
-                    max-width: 800px;
-                    margin: 50px auto;
-                    padding: 20px;
-                }
-                h1 { color: #333; }
-                ul { list-style-type: none; padding: 0; }
-                li { margin: 10px 0; }
-                a {
-                    color: #007bff;
-                    text-decoration: none;
-                    padding: 5px 10px;
-                    border: 1px solid #007bff;
-                    border-radius: 3px;
-                    display: inline-block;
-                }
-                a:hover { background-color: #007bff; color: white; }
-                .description { color: #666; margin-left: 10px; }
-            </style>
-        </head>
-        <body>
-            <h1>PIPE Metrics & Health Server</h1>
-            <p>Available endpoints:</p>
-            <ul>
-                <li>
-                    <a href="/metrics">/metrics</a>
-                    <span class="description">Prometheus metrics (text format)</span>
-                </li>
-                <li>
-                    <a href="/health/live">/health/live</a>
-                    <span class="description">Liveness probe (JSON)</span>
-                </li>
-                <li>
-                    <a href="/health/ready">/health/ready</a>
-                    <span class="description">Readiness probe (JSON)</span>
-                </li>
-                <li>
-                    <a href="/health">/health</a>
-                    <span class="description">Detailed health check (JSON)</span>
-                </li>
-            </ul>
-            <hr>
-            <p style="color: #999; font-size: 12px;">
-                PIPE Bot System - Monitoring & Observability
-            </p>
-        </body>
-        </html>
-        """
-        return web.Response(text=html, content_type="text/html")
+        if _INDEX_ETAG in request.headers.get("If-None-Match", ""):
+            return web.Response(status=304, headers=_INDEX_HEADERS)
+        return web.Response(
+            body=_INDEX_HTML_BYTES, content_type="text/html", headers=_INDEX_HEADERS
+        )
 
     async def _get_bot_statuses(self) -> List[Dict[str, Any]]:
         """Get bot statuses from callback."""
         if self.bot_status_callback:
-            result = self.bot_status_callback()
-            # Handle both sync and async callbacks
-            if asyncio.iscoroutine(result):
-                return await result
-            return result
+            return await _run_callback(
+                self.bot_status_callback, self._bot_status_callback_async
+            )
         return []
 
     async def _get_governance_dashboard(self) -> Dict[str, Any]:
         """Get governance dashboard from callback."""
         if self.governance_dashboard_callback:
-            result = self.governance_dashboard_callback()
-            # Handle both sync and async callbacks
-            if asyncio.iscoroutine(result):
-                return await result
-            return result
+            return await _run_callback(
+                self.governance_dashboard_callback,
+                self._governance_dashboard_callback_async,
+            )
         return {}
 
     async def start(self) -> None:
         """Start the metrics server."""
         self.logger.info(f"Starting metrics server on {self.host}:{self.port}")
 
-        self.runner = web.AppRunner(self.app)
+        # Keep scraper/probe connections open between requests and skip
+        # per-request access log formatting for this high-frequency traffic
+        self.runner = web.AppRunner(self.app, keepalive_timeout=75, access_log=None)
         await self.runner.setup()
 
-        self.site = web.TCPSite(self.runner, self.host, self.port)
+        self.site = web.TCPSite(self.runner, self.host, self.port, backlog=512)
         await self.site.start()
 
         self.logger.info(f"Metrics server running at http://{self.host}:{self.port}")
         self.logger.info(f"  Metrics: http://{self.host}:{self.port}/metrics")
         self.logger.info(f"  Health:  http://{self.host}:{self.port}/health")
 
+        if self.refresh_interval > 0 and self.cache_ttl > 0:
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def _refresh_loop(self) -> None:
+        """
+        Periodically re-render the health snapshots served to probes.
+
+        Probe handlers then read the cached snapshot, so callback and
+        aggregation cost no longer scales with probe frequency. Snapshots
+        outlive one refresh interval so they never lapse between refreshes;
+        if refreshing stops, they expire and handlers render on demand.
+        """
+        snapshot_ttl = self.cache_ttl + self.refresh_interval
+        renders = (("ready", self._render_readiness), ("health", self._render_health))
+
+        while True:
+            for key, render in renders:
+                try:
+                    self._store_response(key, await render(), ttl=snapshot_ttl)
+                except Exception as e:
+                    self.logger.warning(f"Failed to refresh {key} snapshot: {str(e)}")
+
+            await asyncio.sleep(self.refresh_interval)
+
     async def stop(self) -> None:
         """Stop the metrics server."""
         self.logger.info("Stopping metrics server")
 
+        if self._refresh_task:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+
         if self.runner:
             await self.runner.cleanup()
 
@@ -5,11 +5,76 @@ Converts internal metrics to Prometheus format and provides
 HTTP endpoint for metrics scraping.
 """
 
+import io
 import logging
-from typing import Dict, Any, List
+import re
+from typing import Dict, Any, List, Tuple
 from datetime import datetime
 from ..utils.metrics import MetricsCollector
 
+# Upper bound for the sanitized-name and label caches; they are simply
+# cleared when full so pathological cardinality cannot grow them forever.
+_CACHE_MAX_ENTRIES = 4096
+
+# Anything outside the Prometheus metric-name alphabet (after lowercasing)
+_INVALID_NAME_CHARS_RE = re.compile(r"[^0-9a-z_]")
+
+# Static HELP/TYPE banners for the fixed bot and governance metric families
+_BOT_STATUS_HEADER = (
+    "# HELP pipe_bot_status Bot operational status (1=running, 0=other)\n"
+    "# TYPE pipe_bot_status gauge\n"
+)
+_BOT_UPTIME_HEADER = (
+    "# HELP pipe_bot_uptime_seconds Bot uptime in seconds\n"
+    "# TYPE pipe_bot_uptime_seconds gauge\n"
+)
+_BOT_TASKS_HEADER = (
+    "# HELP pipe_bot_tasks_total Total tasks processed by bot\n"
+    "# TYPE pipe_bot_tasks_total counter\n"
+)
+_BOT_ERRORS_HEADER = (
+    "# HELP pipe_bot_errors_total Total errors encountered by bot\n"
+    "# TYPE pipe_bot_errors_total counter\n"
+)
+
+# (dashboard section, field, metric name, help) for each governance gauge
+_GOVERNANCE_GAUGES = (
+    (
+        "ecosystem",
+        "total_domains",
+        "pipe_governance_domains_total",
+        "Total domains in ecosystem",
+    ),
+    ("ecosystem", "active_domains", "pipe_governance_domains_active", "Active domains"),
+    (
+        "ecosystem",
+        "total_integrations",
+        "pipe_governance_integrations_total",
+        "Total integrations",
+    ),
+    (
+        "ecosystem",
+        "active_integrations",
+        "pipe_governance_integrations_active",
+        "Active integrations",
+    ),
+    (
+        "compliance",
+        "ecosystem_percentage",
+        "pipe_governance_compliance_percentage",
+        "Ecosystem compliance percentage",
+    ),
+    ("reviews", "total", "pipe_governance_reviews_total", "Total reviews"),
+    ("reviews", "pending", "pipe_governance_reviews_pending", "Pending reviews"),
+    ("reviews", "approved", "pipe_governance_reviews_approved", "Approved reviews"),
+)
+
+# Banner plus the sample's metric name, ready for the value to be appended
+_GOVERNANCE_LINES = tuple(
+    (section, field, f"# HELP {name} {help_text}\n# TYPE {name} gauge\n{name} ")
+    for section, field, name, help_text in _GOVERNANCE_GAUGES
+)
+
 
 class PrometheusExporter:
     """
@@ -30,6 +95,8 @@ class PrometheusExporter:
         self.metrics = metrics_collector
         self.namespace = namespace
         self.logger = logging.getLogger("pipe.monitoring.prometheus")
+        self._sanitize_cache: Dict[str, str] = {}
+        self._label_cache: Dict[Tuple[Tuple[str, str], ...], str] = {}
 
     def export_metrics(self) -> str:
         """
@@ -38,50 +105,45 @@ class PrometheusExporter:
         Returns:
             Prometheus-formatted metrics string
         """
-        lines = []
+        buf = io.StringIO()
 
         # Add header comment
-        lines.append("# PIPE Bot System Metrics")
-        lines.append(f"# Generated at {datetime.now().isoformat()}")
-        lines.append("")
+        buf.write("# PIPE Bot System Metrics\n")
+        buf.write(f"# Generated at {datetime.now().isoformat()}\n")
 
         # Get all metrics
         all_metrics = self.metrics.get_all_metrics()
+        prefix = f"{self.namespace}_"
 
         # Export counters
         if "counters" in all_metrics:
             for metric_name, value in all_metrics["counters"].items():
-                prom_name = self._sanitize_metric_name(metric_name)
-                lines.append(f"# TYPE {self.namespace}_{prom_name} counter")
-                lines.append(f"{self.namespace}_{prom_name} {value}")
-                lines.append("")
+                prom_name = prefix + self._sanitize_metric_name(metric_name)
+                self._write(buf, prom_name, "counter", value)
 
         # Export gauges
         if "gauges" in all_metrics:
             for metric_name, value in all_metrics["gauges"].items():
-                prom_name = self._sanitize_metric_name(metric_name)
-                lines.append(f"# TYPE {self.namespace}_{prom_name} gauge")
-                lines.append(f"{self.namespace}_{prom_name} {value}")
-                lines.append("")
+                prom_name = prefix + self._sanitize_metric_name(metric_name)
+                self._write(buf, prom_name, "gauge", value)
 
         # Export timing metrics as summaries
         if "timings" in all_metrics:
             for metric_name, timing_stats in all_metrics["timings"].items():
-                prom_name = self._sanitize_metric_name(metric_name)
+                prom_name = prefix + self._sanitize_metric_name(metric_name)
 
-                # timing_stats is a dict with min, max, avg, count
+                # timing_stats is a dict with min, max, avg, sum, count
                 if timing_stats:
                     count = timing_stats.get("count", 0)
-                    total = timing_stats.get("sum", timing_stats.get("avg", 0) * count)
+                    total = timing_stats.get("sum", 0)
                     avg = timing_stats.get("avg", 0)
 
-                    lines.append(f"# TYPE {self.namespace}_{prom_name} summary")
-                    lines.append(f"{self.namespace}_{prom_name}_count {count}")
-                    lines.append(f"{self.namespace}_{prom_name}_sum {total:.6f}")
-                    lines.append(f"{self.namespace}_{prom_name}_avg {avg:.6f}")
-                    lines.append("")
+                    self._write_header(buf, prom_name, "summary")
+                    buf.write(f"{prom_name}_count {count}\n")
+                    buf.write(f"{prom_name}_sum {total:.6f}\n")
+                    buf.write(f"{prom_name}_avg {avg:.6f}\n")
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
     def export_custom_metrics(self, custom_metrics: Dict[str, Any]) -> str:
         """
@@ -129,59 +191,44 @@ class PrometheusExporter:
         Returns:
             Prometheus-formatted bot metrics
         """
-        lines = []
-
-        # Bot status gauge
-        lines.append(
-            "# HELP pipe_bot_status Bot operational status (1=running, 0=other)"
-        )
-        lines.append("# TYPE pipe_bot_status gauge")
+        status_buf = io.StringIO()
+        uptime_buf = io.StringIO()
+        tasks_buf = io.StringIO()
+        errors_buf = io.StringIO()
 
+        # One pass over the bots fills all four metric families
         for bot in bot_statuses:
             bot_name = bot.get("name", "unknown")
             status = bot.get("status", "unknown")
             status_value = 1 if status == "running" else 0
-
-            lines.append(
-                f'pipe_bot_status{{bot="{bot_name}",status="{status}"}} {status_value}'
-            )
-
-        lines.append("")
-
-        # Bot uptime
-        lines.append("# HELP pipe_bot_uptime_seconds Bot uptime in seconds")
-        lines.append("# TYPE pipe_bot_uptime_seconds gauge")
-
-        for bot in bot_statuses:
-            bot_name = bot.get("name", "unknown")
             uptime = bot.get("uptime_seconds", 0)
-            lines.append(f'pipe_bot_uptime_seconds{{bot="{bot_name}"}} {uptime}')
-
-        lines.append("")
-
-        # Bot task count
-        lines.append("# HELP pipe_bot_tasks_total Total tasks processed by bot")
-        lines.append("# TYPE pipe_bot_tasks_total counter")
-
-        for bot in bot_statuses:
-            bot_name = bot.get("name", "unknown")
             task_count = bot.get("task_count", 0)
-            lines.append(f'pipe_bot_tasks_total{{bot="{bot_name}"}} {task_count}')
-
-        lines.append("")
-
-        # Bot error count
-        lines.append("# HELP pipe_bot_errors_total Total errors encountered by bot")
-        lines.append("# TYPE pipe_bot_errors_total counter")
-
-        for bot in bot_statuses:
-            bot_name = bot.get("name", "unknown")
             error_count = bot.get("error_count", 0)
-            lines.append(f'pipe_bot_errors_total{{bot="{bot_name}"}} {error_count}')
 
-        lines.append("")
+            status_buf.write(
+                f'pipe_bot_status{{bot="{bot_name}",status="{status}"}} {status_value}\n'
+            )
+            uptime_buf.write(f'pipe_bot_uptime_seconds{{bot="{bot_name}"}} {uptime}\n')
+            tasks_buf.write(f'pipe_bot_tasks_total{{bot="{bot_name}"}} {task_count}\n')
+            errors_buf.write(
+                f'pipe_bot_errors_total{{bot="{bot_name}"}} {error_count}\n'
+            )
 
-        return "\n".join(lines)
+        return "".join(
+            (
+                _BOT_STATUS_HEADER,
+                status_buf.getvalue(),
+                "\n",
+                _BOT_UPTIME_HEADER,
+                uptime_buf.getvalue(),
+                "\n",
+                _BOT_TASKS_HEADER,
+                tasks_buf.getvalue(),
+                "\n",
+                _BOT_ERRORS_HEADER,
+                errors_buf.getvalue(),
+            )
+        )
 
     def get_governance_metrics(self, governance_dashboard: Dict[str, Any]) -> str:
         """
@@ -193,87 +240,78 @@ class PrometheusExporter:
         Returns:
             Prometheus-formatted governance metrics
         """
-        lines = []
-
-        ecosystem = governance_dashboard.get("ecosystem", {})
-        compliance = governance_dashboard.get("compliance", {})
-        reviews = governance_dashboard.get("reviews", {})
-
-        # Ecosystem metrics
-        lines.append("# HELP pipe_governance_domains_total Total domains in ecosystem")
-        lines.append("# TYPE pipe_governance_domains_total gauge")
-        lines.append(
-            f"pipe_governance_domains_total {ecosystem.get('total_domains', 0)}"
-        )
-        lines.append("")
-
-        lines.append("# HELP pipe_governance_domains_active Active domains")
-        lines.append("# TYPE pipe_governance_domains_active gauge")
-        lines.append(
-            f"pipe_governance_domains_active {ecosystem.get('active_domains', 0)}"
-        )
-        lines.append("")
-
-        lines.append("# HELP pipe_governance_integrations_total Total integrations")
-        lines.append("# TYPE pipe_governance_integrations_total gauge")
-        lines.append(
-            f"pipe_governance_integrations_total {ecosystem.get('total_integrations', 0)}"
-        )
-        lines.append("")
-
-        lines.append("# HELP pipe_governance_integrations_active Active integrations")
-        lines.append("# TYPE pipe_governance_integrations_active gauge")
-        lines.append(
-            f"pipe_governance_integrations_active {ecosystem.get('active_integrations', 0)}"
-        )
-        lines.append("")
-
-        # Compliance metrics
-        lines.append(
-            "# HELP pipe_governance_compliance_percentage Ecosystem compliance percentage"
-        )
-        lines.append("# TYPE pipe_governance_compliance_percentage gauge")
-        lines.append(
-            f"pipe_governance_compliance_percentage {compliance.get('ecosystem_percentage', 0)}"
-        )
-        lines.append("")
+        buf = io.StringIO()
+        sections = {
+            "ecosystem": governance_dashboard.get("ecosystem", {}),
+            "compliance": governance_dashboard.get("compliance", {}),
+            "reviews": governance_dashboard.get("reviews", {}),
+        }
+
+        for section, field, line_prefix in _GOVERNANCE_LINES:
+            if buf.tell():
+                buf.write("\n")
+            buf.write(line_prefix)
+            buf.write(f"{sections[section].get(field, 0)}\n")
+
+        return buf.getvalue()
+
+    @staticmethod
+    def _write_header(buf: io.StringIO, name: str, metric_type: str) -> None:
+        """
+        Write the TYPE banner for a metric family.
 
-        # Review metrics
-        lines.append("# HELP pipe_governance_reviews_total Total reviews")
-        lines.append("# TYPE pipe_governance_reviews_total gauge")
-        lines.append(f"pipe_governance_reviews_total {reviews.get('total', 0)}")
-        lines.append("")
+        Families are separated by a blank line, so one is written first
+        whenever the buffer already holds output.
 
-        lines.append("# HELP pipe_governance_reviews_pending Pending reviews")
-        lines.append("# TYPE pipe_governance_reviews_pending gauge")
-        lines.append(f"pipe_governance_reviews_pending {reviews.get('pending', 0)}")
-        lines.append("")
+        Args:
+            buf: Output buffer
+            name: Fully qualified metric name
+            metric_type: Prometheus metric type
+        """
+        if buf.tell():
+            buf.write("\n")
+        buf.write(f"# TYPE {name} {metric_type}\n")
 
-        lines.append("# HELP pipe_governance_reviews_approved Approved reviews")
-        lines.append("# TYPE pipe_governance_reviews_approved gauge")
-        lines.append(f"pipe_governance_reviews_approved {reviews.get('approved', 0)}")
-        lines.append("")
+    @classmethod
+    def _write(cls, buf: io.StringIO, name: str, metric_type: str, value: Any) -> None:
+        """
+        Write a single-sample metric family.
 
-        return "\n".join(lines)
+        Args:
+            buf: Output buffer
+            name: Fully qualified metric name
+            metric_type: Prometheus metric type
+            value: Sample value
+        """
+        cls._write_header(buf, name, metric_type)
+        buf.write(f"{name} {value}\n")
 
     def _sanitize_metric_name(self, name: str) -> str:
         """
         Sanitize metric name for Prometheus.
 
+        Results are memoized since the same names recur on every scrape.
+
         Args:
             name: Original metric name
 
         Returns:
             Sanitized metric name
         """
-        # Replace dots with underscores
-        name = name.replace(".", "_")
-        # Remove any invalid characters
-        name = "".join(c if c.isalnum() or c == "_" else "_" for c in name)
+        cached = self._sanitize_cache.get(name)
+        if cached is not None:
+            return cached
+
+        # Replace dots and any other invalid characters with underscores
+        sanitized = _INVALID_NAME_CHARS_RE.sub("_", name.lower())
         # Ensure it doesn't start with a number
-        if name and name[0].isdigit():
-            name = "_" + name
-        return name.lower()
+        if sanitized[:1].isdigit():
+            sanitized = "_" + sanitized
+
+        if len(self._sanitize_cache) >= _CACHE_MAX_ENTRIES:
+            self._sanitize_cache.clear()
+        self._sanitize_cache[name] = sanitized
+        return sanitized
 
     def _format_labels(self, labels: Dict[str, str]) -> str:
         """
@@ -285,5 +323,15 @@ class PrometheusExporter:
         Returns:
             Formatted label string
         """
+        cache_key = tuple(labels.items())
+        cached = self._label_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         label_pairs = [f'{key}="{value}"' for key, value in labels.items()]
-        return ",".join(label_pairs)
+        formatted = ",".join(label_pairs)
+
+        if len(self._label_cache) >= _CACHE_MAX_ENTRIES:
+            self._label_cache.clear()
+        self._label_cache[cache_key] = formatted
+        return formatted
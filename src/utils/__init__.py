@@ -1,7 +1,15 @@
 """Utility modules for PIPE domain bots."""
 
+from .cache import TTLCache
+from .locks import LazyAsyncLock
 from .logger import setup_logging
 from .metrics import MetricsCollector
 from .retry import retry_async
 
-__all__ = ["setup_logging", "MetricsCollector", "retry_async"]
+__all__ = [
+    "setup_logging",
+    "MetricsCollector",
+    "retry_async",
+    "TTLCache",
+    "LazyAsyncLock",
+]
@@ -0,0 +1,81 @@
+"""Caching utilities for PIPE domain bots."""
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Bounded LRU cache whose entries expire after a time-to-live.
+
+    Expired entries are evicted lazily on access; the least recently used
+    entry is evicted when the cache grows beyond ``maxsize``.
+    """
+
+    def __init__(self, maxsize: int = 512, ttl: float = 300.0):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept
+            ttl: Default entry lifetime in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss or expired entry
+
+        Returns:
+            Cached value or default
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return default
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a value.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Entry lifetime in seconds (default: cache ttl)
+        """
+        lifetime = self.ttl if ttl is None else ttl
+        self._entries[key] = (time.monotonic() + lifetime, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove an entry and return its value, or default if absent."""
+        entry = self._entries.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and entry[0] > time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,48 @@
+"""Fast JSON helpers for PIPE domain bots.
+
+Uses orjson when installed and falls back to the stdlib json module.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    # Coerce non-string dict keys to strings like the stdlib json module
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON.
+
+    Non-string dict keys are converted to strings on both backends.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        JSON document as bytes
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def loads(data: Any) -> Any:
+    """
+    Deserialize a JSON document.
+
+    Args:
+        data: JSON document as str or bytes
+
+    Returns:
+        Parsed object
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,45 @@
+"""Asyncio locking utilities for PIPE domain bots."""
+
+import asyncio
+from typing import Optional
+
+
+class LazyAsyncLock:
+    """
+    Module-level asyncio lock created inside the running event loop.
+
+    An ``asyncio.Lock()`` built at import time binds to the loop that is
+    current then (Python < 3.10) or to the first loop that contends for it
+    (3.10+), so a module-level lock fails with "attached to a different
+    loop" once it is used from ``asyncio.run()``. This wrapper creates the
+    real lock on first use and replaces it whenever the running loop changes.
+
+    Usage:
+        _lock = LazyAsyncLock()
+
+        async with _lock:
+            ...
+    """
+
+    def __init__(self):
+        """Initialize without binding to any event loop."""
+        self._lock: Optional[asyncio.Lock] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_lock(self) -> asyncio.Lock:
+        """Get the lock for the running loop, creating it if needed."""
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._loop is not loop:
+            self._lock = asyncio.Lock()
+            self._loop = loop
+        return self._lock
+
+    def locked(self) -> bool:
+        """Return True if the lock is held in the current loop."""
+        return self._lock is not None and self._lock.locked()
+
+    async def __aenter__(self) -> None:
+        await self._get_lock().acquire()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._lock.release()
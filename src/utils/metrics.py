@@ -1,10 +1,11 @@
 """Metrics collection for PIPE domain bots."""
 
+import math
 import time
-from typing import Dict, Any, List
+from typing import Deque, Dict, Any
 from dataclasses import dataclass, field
 from datetime import datetime
-from collections import defaultdict
+from collections import defaultdict, deque
 
 
 @dataclass
@@ -17,6 +18,25 @@ class Metric:
     tags: Dict[str, str] = field(default_factory=dict)
 
 
+@dataclass
+class TimingStats:
+    """Running aggregate of the durations recorded for one timing metric."""
+
+    count: int = 0
+    sum: float = 0.0
+    min: float = math.inf
+    max: float = -math.inf
+
+    def add(self, duration: float) -> None:
+        """Fold a new duration into the aggregate."""
+        self.count += 1
+        self.sum += duration
+        if duration < self.min:
+            self.min = duration
+        if duration > self.max:
+            self.max = duration
+
+
 class MetricsCollector:
     """
     Collects and aggregates metrics from bots.
@@ -28,9 +48,9 @@ class MetricsCollector:
         """Initialize the metrics collector."""
         self.counters: Dict[str, float] = defaultdict(float)
         self.gauges: Dict[str, float] = {}
-        self.timings: Dict[str, List[float]] = defaultdict(list)
-        self.metrics_history: List[Metric] = []
+        self.timings: Dict[str, TimingStats] = defaultdict(TimingStats)
         self.max_history = 10000
+        self.metrics_history: Deque[Metric] = deque(maxlen=self.max_history)
 
     def increment(
         self, name: str, value: float = 1.0, tags: Dict[str, str] = None
@@ -67,7 +87,7 @@ class MetricsCollector:
             duration: Duration in seconds
             tags: Optional tags for the metric
         """
-        self.timings[name].append(duration)
+        self.timings[name].add(duration)
         self._record_metric(name, duration, tags)
 
     def get_counter(self, name: str) -> float:
@@ -83,17 +103,18 @@ class MetricsCollector:
         Get timing statistics.
 
         Returns:
-            Dictionary with min, max, avg, and count
+            Dictionary with min, max, avg, sum, and count
         """
-        timings = self.timings.get(name, [])
-        if not timings:
-            return {"min": 0, "max": 0, "avg": 0, "count": 0}
+        stats = self.timings.get(name)
+        if stats is None or not stats.count:
+            return {"min": 0, "max": 0, "avg": 0, "sum": 0, "count": 0}
 
         return {
-            "min": min(timings),
-            "max": max(timings),
-            "avg": sum(timings) / len(timings),
-            "count": len(timings),
+            "min": stats.min,
+            "max": stats.max,
+            "avg": stats.sum / stats.count,
+            "sum": stats.sum,
+            "count": stats.count,
         }
 
     def get_all_metrics(self) -> Dict[str, Any]:
@@ -124,12 +145,9 @@ class MetricsCollector:
     ) -> None:
         """Record a metric in history."""
         metric = Metric(name=name, value=value, tags=tags or {})
+        # The deque's maxlen drops the oldest entry once history is full
         self.metrics_history.append(metric)
 
-        # Trim history if needed
-        if len(self.metrics_history) > self.max_history:
-            self.metrics_history = self.metrics_history[-self.max_history :]
-
     class Timer:
         """Context manager for timing operations."""
 
@@ -2,12 +2,57 @@
 
 import asyncio
 import logging
-from typing import Callable, Any, Type, Tuple
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Any, Optional, Type, Tuple
 from functools import wraps
 
 logger = logging.getLogger(__name__)
 
 
+def jittered_backoff(attempt: int, base: float = 0.1, cap: float = 2.0) -> float:
+    """
+    Compute a "full jitter" exponential backoff delay.
+
+    Args:
+        attempt: Zero-based retry attempt number
+        base: Delay ceiling for the first retry in seconds
+        cap: Upper bound on the delay ceiling in seconds
+
+    Returns:
+        Random delay between 0 and min(cap, base * 2 ** attempt)
+    """
+    return random.uniform(0, min(cap, base * (2**attempt)))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse an HTTP Retry-After header value.
+
+    Args:
+        value: Header value, either delay seconds or an HTTP-date
+
+    Returns:
+        Seconds to wait (never negative), or None if absent or unparseable
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
 def retry_async(
     max_attempts: int = 3,
     delay: float = 1.0,
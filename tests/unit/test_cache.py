@@ -0,0 +1,68 @@
+"""Unit tests for caching utilities."""
+
+from src.utils.cache import TTLCache
+
+
+def test_ttl_cache_get_and_set():
+    """Test storing and retrieving values."""
+    cache = TTLCache(maxsize=4, ttl=60)
+
+    cache.set("key", {"value": 1})
+
+    assert cache.get("key") == {"value": 1}
+    assert "key" in cache
+    assert len(cache) == 1
+
+
+def test_ttl_cache_miss_returns_default():
+    """Test that misses return the default value."""
+    cache = TTLCache()
+
+    assert cache.get("missing") is None
+    assert cache.get("missing", "fallback") == "fallback"
+
+
+def test_ttl_cache_expires_entries(monkeypatch):
+    """Test that entries expire after their ttl."""
+    now = [1000.0]
+    monkeypatch.setattr("src.utils.cache.time.monotonic", lambda: now[0])
+    cache = TTLCache(ttl=10)
+
+    cache.set("default", "a")
+    cache.set("short", "b", ttl=1)
+
+    now[0] += 5
+    assert cache.get("default") == "a"
+    assert cache.get("short") is None
+    assert "short" not in cache
+
+    now[0] += 10
+    assert cache.get("default") is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    """Test LRU eviction once maxsize is exceeded."""
+    cache = TTLCache(maxsize=2, ttl=60)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_pop_and_clear():
+    """Test explicit invalidation."""
+    cache = TTLCache()
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    assert cache.pop("a") == 1
+    assert cache.pop("a", "gone") == "gone"
+
+    cache.clear()
+    assert len(cache) == 0
@@ -0,0 +1,403 @@
+"""Unit tests for the Cognee client."""
+
+import asyncio
+import sys
+import types
+
+import pytest
+
+from src.governance.datapoints import review_to_datapoint
+from src.integrations import cognee_client
+from src.integrations.cognee_client import CogneeClient
+
+
+@pytest.fixture(autouse=True)
+def cognee_available(monkeypatch):
+    """Let CogneeClient be constructed without the cognee package."""
+    monkeypatch.setattr(cognee_client, "COGNEE_AVAILABLE", True)
+
+
+async def test_get_cognee_client_concurrent_calls_share_instance(monkeypatch):
+    """Test concurrent first calls create and configure a single client."""
+    monkeypatch.setattr(cognee_client, "_cognee_client", None)
+    configured = []
+
+    async def fake_configure(self):
+        configured.append(self)
+        await asyncio.sleep(0.01)
+        return True
+
+    monkeypatch.setattr(CogneeClient, "configure", fake_configure)
+
+    first, second = await asyncio.gather(
+        cognee_client.get_cognee_client(), cognee_client.get_cognee_client()
+    )
+
+    assert first is second
+    assert configured == [first]
+
+
+@pytest.fixture
+def vector_engine(monkeypatch):
+    """Install a fake cognee vector engine that records its searches."""
+    engine = types.SimpleNamespace(searches=[], results=[])
+
+    async def search(collection, query_text, limit):
+        engine.searches.append((collection, query_text, limit))
+        return engine.results[:limit]
+
+    engine.search = search
+    vector_module = types.ModuleType("cognee.infrastructure.databases.vector")
+    vector_module.get_vector_engine = lambda: engine
+    for name in ("cognee", "cognee.infrastructure", "cognee.infrastructure.databases"):
+        monkeypatch.setitem(sys.modules, name, types.ModuleType(name))
+    monkeypatch.setitem(sys.modules, vector_module.__name__, vector_module)
+    return engine
+
+
+def _scored(result_id, score, **payload):
+    """Build a vector engine result row."""
+    return types.SimpleNamespace(id=result_id, score=score, payload=payload)
+
+
+def _client_with_store(fail_adds=0, **kwargs):
+    """Create a client whose document adds fail a given number of times."""
+    client = CogneeClient(warmup=False, **kwargs)
+    client._configured = True
+    client.stored = []
+    failures = [fail_adds]
+
+    async def fake_add_batch(data_list):
+        if failures[0]:
+            failures[0] -= 1
+            return False
+        client.stored.extend(data_list)
+        return True
+
+    async def fake_cognify():
+        return True
+
+    client.add_governance_data_batch = fake_add_batch
+    client.cognify_governance_data = fake_cognify
+    return client
+
+
+async def test_flush_pending_requeues_failed_batch():
+    """Test a failed flush keeps the batch staged for the next flush."""
+    client = _client_with_store(fail_adds=1, batch_size=10, flush_interval=60)
+    await client.stage_governance_data("first")
+    await client.stage_governance_data("second")
+
+    assert await client.flush_pending() is False
+    assert client._pending == ["first", "second"]
+
+    await client.stage_governance_data("third")
+    assert await client.flush_pending() is True
+    assert client.stored == ["first", "second", "third"]
+    assert client._pending == []
+
+    await client.close()
+
+
+async def test_background_flush_retries_after_failure():
+    """Test the interval flush keeps retrying until staged data is stored."""
+    client = _client_with_store(fail_adds=1, batch_size=10, flush_interval=0.01)
+
+    await client.stage_governance_data("decision")
+    await asyncio.wait_for(client._flush_task, timeout=1)
+
+    assert client.stored == ["decision"]
+    assert client._pending == []
+
+
+async def test_close_flushes_staged_data():
+    """Test closing the client persists data staged before shutdown."""
+    client = _client_with_store(batch_size=10, flush_interval=60)
+    await client.stage_governance_data("decision")
+
+    await client.close()
+
+    assert client.stored == ["decision"]
+    assert client._flush_task.done()
+
+
+async def test_suggest_integration_path_ranks_by_distance():
+    """Test closer patterns (smaller distance) rank first."""
+    client = CogneeClient(warmup=False)
+    results = [
+        {"id": "far", "score": 0.9},
+        {"id": "closest", "score": 0.1},
+        {"id": "middle", "_distance": 0.5},
+    ]
+
+    async def fake_search(query, **kwargs):
+        return list(results)
+
+    client.search_integrations = fake_search
+
+    suggestion = await client.suggest_integration_path("BNI", "BNP", min_score=0.6)
+
+    assert [p["id"] for p in suggestion["suggested_patterns"]] == [
+        "closest",
+        "middle",
+    ]
+    assert suggestion["confidence"] == pytest.approx((1 / 1.1 + 1 / 1.5) / 2)
+
+
+async def test_suggest_integration_path_scores_vector_results(vector_engine):
+    """Test the suggestion query reaches the vector store and uses its scores."""
+    vector_engine.results = [_scored("far", 0.9), _scored("close", 0.1, text="mTLS")]
+    client = CogneeClient(warmup=False)
+    client._configured = True
+
+    suggestion = await client.suggest_integration_path("BNI", "BNP", min_score=0.6)
+
+    assert vector_engine.searches == [
+        (
+            "DocumentChunk_text",
+            "successful integration patterns from BNI to BNP",
+            5,
+        )
+    ]
+    assert suggestion["suggested_patterns"] == [
+        {"id": "close", "score": 0.1, "text": "mTLS"}
+    ]
+    assert suggestion["confidence"] == pytest.approx(1 / 1.1)
+
+
+async def test_suggest_integration_path_without_distances():
+    """Test results without distances fall back to count-based confidence."""
+    client = CogneeClient(warmup=False)
+
+    async def fake_search(query, **kwargs):
+        return ["insight one", "insight two"]
+
+    client.search_integrations = fake_search
+
+    suggestion = await client.suggest_integration_path("BNI", "BNP")
+
+    assert suggestion["suggested_patterns"] == ["insight one", "insight two"]
+    assert suggestion["confidence"] == pytest.approx(0.4)
+
+
+@pytest.fixture
+def graph_search(monkeypatch):
+    """Replace cognee.search and the memory writers with recording fakes."""
+    calls = []
+
+    async def search(query, search_type):
+        calls.append((query, search_type))
+        return [{"query": query, "call": len(calls)}]
+
+    async def noop(*args, **kwargs):
+        return None
+
+    prune = types.SimpleNamespace(prune_data=noop, prune_system=noop)
+    monkeypatch.setattr(cognee_client, "search", search, raising=False)
+    for name in ("add", "cognify", "add_data_points"):
+        monkeypatch.setattr(cognee_client, name, noop, raising=False)
+    monkeypatch.setattr(
+        cognee_client, "cognee", types.SimpleNamespace(prune=prune), raising=False
+    )
+    return calls
+
+
+def _configured_client(**kwargs):
+    """Create a configured client without warmup."""
+    client = CogneeClient(warmup=False, **kwargs)
+    client._configured = True
+    return client
+
+
+async def test_search_cache_hit_within_ttl(graph_search):
+    """Test repeated searches are answered from the cache until the TTL."""
+    client = _configured_client(search_cache_ttl=0.05)
+
+    first = await client.search_integrations("BNI integrations")
+    second = await client.search_integrations("BNI integrations")
+
+    assert first == second
+    assert len(graph_search) == 1
+
+    await asyncio.sleep(0.06)
+    await client.search_integrations("BNI integrations")
+    assert len(graph_search) == 2
+
+
+async def test_search_cache_key_includes_mode_limit_and_routing(
+    graph_search, vector_engine
+):
+    """Test each of query, mode, limit and vector routing gets its own entry."""
+    client = _configured_client()
+
+    await client.search_integrations("q")
+    await client.search_integrations("other q")
+    await client.search_integrations("q", search_mode=cognee_client.SearchMode.INSIGHTS)
+    await client.search_integrations("q", limit=3)
+    await client.search_integrations("q", graph_depth=0)
+
+    assert len(graph_search) == 4
+    assert len(vector_engine.searches) == 1
+
+    await client.search_integrations("q", limit=3)
+    await client.search_integrations("q", graph_depth=0)
+    assert len(graph_search) == 4
+    assert len(vector_engine.searches) == 1
+
+
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        lambda client: client.add_governance_data("decision"),
+        lambda client: client.add_governance_data_batch(["a", "b"]),
+        lambda client: client.add_datapoints([object()]),
+        lambda client: client.cognify_governance_data(),
+        lambda client: client.reset_memory(),
+    ],
+    ids=["add", "add_batch", "add_datapoints", "cognify", "reset"],
+)
+async def test_search_cache_cleared_when_memory_changes(graph_search, mutate):
+    """Test changing memory contents drops cached search results."""
+    client = _configured_client()
+    await client.search_integrations("q")
+
+    assert await mutate(client) is True
+
+    await client.search_integrations("q")
+    assert len(graph_search) == 2
+
+
+@pytest.mark.parametrize(
+    "search_mode, graph_depth, vector_only",
+    [
+        ("CHUNKS", None, True),
+        ("DEFAULT", 0, True),
+        ("INSIGHTS", 0, True),
+        ("DEFAULT", None, False),
+        ("CHUNKS", 2, False),
+    ],
+)
+async def test_search_integrations_routes_vector_only_searches(
+    graph_search, vector_engine, search_mode, graph_depth, vector_only
+):
+    """Test CHUNKS and graph_depth=0 skip the graph and hit the vector store."""
+    vector_engine.results = [_scored("chunk", 0.2, text="mTLS")]
+    client = _configured_client()
+
+    results = await client.search_integrations(
+        "q",
+        search_mode=cognee_client.SearchMode[search_mode],
+        limit=4,
+        graph_depth=graph_depth,
+    )
+
+    if vector_only:
+        assert vector_engine.searches == [("DocumentChunk_text", "q", 4)]
+        assert graph_search == []
+        assert results == [{"id": "chunk", "score": 0.2, "text": "mTLS"}]
+    else:
+        assert vector_engine.searches == []
+        assert graph_search == [("q", search_mode.lower())]
+
+
+def test_canonicalize_query_normalizes_whitespace():
+    """Test payloads differing only in spacing build the same query."""
+    canonical = cognee_client._canonicalize_query(
+        "compliance_in_domain", ("missing  mTLS\n on ingress", " BNI ")
+    )
+
+    assert canonical == cognee_client._canonicalize_query(
+        "compliance_in_domain", ("missing mTLS on ingress", "BNI")
+    )
+    assert (
+        canonical
+        == "compliance issues similar to: missing mTLS on ingress in domain BNI"
+    )
+
+
+async def test_equivalent_queries_share_search_cache_entry(graph_search):
+    """Test canonical queries let equivalent lookups reuse cached results."""
+    client = _configured_client()
+
+    await client.find_integration_patterns("event  driven\tsync")
+    await client.find_integration_patterns(" event driven sync ")
+
+    assert graph_search == [("integration patterns: event driven sync", "insights")]
+
+
+def _recording_client(fail_datapoints=False, fail_documents=False):
+    """Create a client that records DataPoint adds, document adds and cognify."""
+    client = _configured_client(batch_size=10, flush_interval=60)
+    client.calls = []
+
+    async def fake_add_datapoints(datapoints):
+        client.calls.append(("add_datapoints", list(datapoints)))
+        return not fail_datapoints
+
+    async def fake_add_batch(data_list):
+        client.calls.append(("add_documents", list(data_list)))
+        return not fail_documents
+
+    async def fake_cognify():
+        client.calls.append(("cognify", None))
+        return True
+
+    client.add_datapoints = fake_add_datapoints
+    client.add_governance_data_batch = fake_add_batch
+    client.cognify_governance_data = fake_cognify
+    return client
+
+
+def _decision(review_id):
+    return review_to_datapoint(
+        {"id": review_id, "review_type": "integration", "status": "approved"}
+    )
+
+
+async def test_flush_pending_skips_documents_when_datapoints_fail():
+    """Test a failed DataPoint add requeues the batch without adding documents."""
+    client = _recording_client(fail_datapoints=True)
+    decision = _decision("r1")
+    await client.stage_governance_data("doc")
+    await client.stage_governance_data(decision)
+
+    assert await client.flush_pending() is False
+
+    assert client.calls == [("add_datapoints", [decision])]
+    assert client._pending == ["doc", decision]
+    client._flush_task.cancel()
+
+
+async def test_flush_pending_requeues_only_unsaved_documents():
+    """Test stored DataPoints are not requeued when the document add fails."""
+    client = _recording_client(fail_documents=True)
+    decision = _decision("r1")
+    await client.stage_governance_data("doc")
+    await client.stage_governance_data(decision)
+
+    assert await client.flush_pending() is False
+
+    assert client.calls == [
+        ("add_datapoints", [decision]),
+        ("add_documents", ["doc"]),
+    ]
+    assert client._pending == ["doc"]
+    client._flush_task.cancel()
+
+
+async def test_flush_pending_datapoints_only_skips_cognify():
+    """Test DataPoint-only flushes store the DataPoints without cognifying."""
+    client = _recording_client()
+    decisions = [_decision("r1"), _decision("r2")]
+    for decision in decisions:
+        await client.stage_governance_data(decision)
+
+    assert await client.flush_pending() is True
+
+    assert client.calls == [("add_datapoints", decisions)]
+    assert client._pending == []
+
+    await client.stage_governance_data("doc")
+    assert await client.flush_pending() is True
+    assert client.calls[1:] == [("add_documents", ["doc"]), ("cognify", None)]
+    await client.close()
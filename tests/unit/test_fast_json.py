@@ -0,0 +1,36 @@
+"""Unit tests for fast JSON helpers."""
+
+import json
+
+import pytest
+
+from src.utils import fast_json
+
+
+@pytest.mark.parametrize("orjson_available", [True, False])
+def test_fast_json_round_trip(monkeypatch, orjson_available):
+    """Test dumps/loads round trip with and without orjson."""
+    if orjson_available and not fast_json.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(fast_json, "ORJSON_AVAILABLE", orjson_available)
+
+    obj = {"name": "PIPE", "count": 3, "nested": {"items": [1, 2.5, None, True]}}
+
+    encoded = fast_json.dumps(obj)
+
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == obj
+    assert fast_json.loads(encoded) == obj
+    assert fast_json.loads(encoded.decode()) == obj
+
+
+@pytest.mark.parametrize("orjson_available", [True, False])
+def test_fast_json_non_string_keys(monkeypatch, orjson_available):
+    """Test non-string keys serialize identically with and without orjson."""
+    if orjson_available and not fast_json.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(fast_json, "ORJSON_AVAILABLE", orjson_available)
+
+    encoded = fast_json.dumps({1: "one", 2: {3: [4]}, "name": "PIPE"})
+
+    assert encoded == b'{"1":"one","2":{"3":[4]},"name":"PIPE"}'
@@ -13,9 +13,13 @@ from src.governance.utils import (
     get_integration_health_status,
     quick_setup_demo_environment,
     _serialize_for_json,
+    DEMO_DOMAINS,
+    DEMO_INTEGRATIONS,
 )
 from src.governance.governance_manager import GovernanceManager
+from src.governance.domain_registry import IntegrationStatus
 from src.governance.review_pipeline import ReviewStatus
+from datetime import datetime
 from enum import Enum
 
 
@@ -162,6 +166,31 @@ async def test_batch_request_integrations_default_values():
     assert "review_id" in integration_data
 
 
+@pytest.mark.asyncio
+async def test_batch_request_integrations_mixed_results():
+    """Test batch requests report per-item results in input order."""
+    governance = GovernanceManager()
+
+    await governance.register_domain("BNI", ["auth"])
+    await governance.register_domain("BNP", ["services"])
+
+    integrations = [
+        {"source": "BNI", "target": "BNP"},
+        {"source": "BNI", "target": "NONEXISTENT"},
+        {"source": "BNP", "target": "BNI", "type": "event"},
+    ]
+
+    results = await batch_request_integrations(governance, integrations)
+
+    assert results["success_count"] == 2
+    assert results["failure_count"] == 1
+    assert results["failed"][0]["target"] == "NONEXISTENT"
+    assert [i["integration_id"] for i in results["successful"]] == [
+        "BNI-BNP-api",
+        "BNP-BNI-event",
+    ]
+
+
 def test_export_governance_state_success(tmp_path):
     """Test successful governance state export."""
     governance = GovernanceManager()
@@ -185,6 +214,35 @@ def test_export_governance_state_success(tmp_path):
     assert "dashboard" in data
 
 
+def test_export_governance_state_msgpack(tmp_path):
+    """Test governance state export in msgpack format."""
+    msgpack = pytest.importorskip("msgpack")
+    governance = GovernanceManager()
+
+    output_file = tmp_path / "governance_export.json"
+    result = export_governance_state(governance, output_file, format="msgpack")
+
+    assert result["success"] is True
+    assert Path(result["path"]) == tmp_path / "governance_export.msgpack"
+
+    with open(result["path"], "rb") as f:
+        data = msgpack.unpackb(f.read(), raw=False)
+
+    assert "exported_at" in data
+    assert "domains" in data
+    assert "dashboard" in data
+
+
+def test_export_governance_state_unsupported_format(tmp_path):
+    """Test export rejects unknown formats."""
+    governance = GovernanceManager()
+
+    result = export_governance_state(governance, tmp_path / "x.xml", format="xml")
+
+    assert result["success"] is False
+    assert "Unsupported export format" in result["error"]
+
+
 def test_export_governance_state_creates_directories(tmp_path):
     """Test that export creates necessary directories."""
     governance = GovernanceManager()
@@ -214,6 +272,14 @@ async def test_export_governance_state_with_data(tmp_path):
     # Just check that we have at least the 2 domains we registered
     assert result["domains"] >= 2
 
+    with open(output_file) as f:
+        data = json.load(f)
+
+    domain_codes = [d["domain_code"] for d in data["domains"]]
+    assert domain_codes == governance.domain_registry.list_active_domains()
+    assert "BNI" in domain_codes
+    assert "BNP" in domain_codes
+
 
 def test_generate_compliance_report_basic():
     """Test basic compliance report generation."""
@@ -419,6 +485,41 @@ async def test_get_integration_health_status_review_backlog():
     assert "in_review" in health["review_backlog"]
 
 
+@pytest.mark.asyncio
+async def test_get_integration_health_status_tracks_transitions():
+    """Test health status follows integration status transitions."""
+    governance = GovernanceManager()
+
+    await governance.register_domain("BNI", ["auth"])
+    await governance.register_domain("BNP", ["services"])
+    result = await governance.request_integration(
+        source_domain="BNI",
+        target_domain="BNP",
+        integration_type="api",
+        description="Test integration",
+    )
+
+    governance.domain_registry.update_integration_status(
+        result["integration_id"], IntegrationStatus.DEGRADED
+    )
+    health = get_integration_health_status(governance)
+
+    assert health["status_breakdown"]["degraded"] == 1
+    assert health["status_breakdown"]["initializing"] == 2
+    assert [i["id"] for i in health["degraded_integrations"]] == [
+        result["integration_id"]
+    ]
+
+    governance.domain_registry.update_integration_status(
+        result["integration_id"], IntegrationStatus.CONNECTED
+    )
+    health = get_integration_health_status(governance)
+
+    assert health["status_breakdown"]["degraded"] == 0
+    assert health["status_breakdown"]["connected"] == 1
+    assert health["degraded_integrations"] == []
+
+
 def test_serialize_for_json_enum():
     """Test JSON serialization of enums."""
     obj = {"status": ReviewStatus.PENDING, "name": "test"}
@@ -471,6 +572,24 @@ def test_serialize_for_json_set():
     assert set(result) == {1, 2, 3}
 
 
+def test_serialize_for_json_dict_values():
+    """Test JSON serialization of dict value views."""
+    obj = {"a": SerializationTestEnum.VALUE_ONE, "b": "plain"}
+
+    result = _serialize_for_json(obj.values())
+
+    assert result == ["one", "plain"]
+
+
+def test_serialize_for_json_datetime():
+    """Test JSON serialization of datetimes."""
+    moment = datetime(2024, 1, 2, 3, 4, 5)
+
+    result = _serialize_for_json({"at": moment})
+
+    assert result["at"] == "2024-01-02T03:04:05"
+
+
 def test_serialize_for_json_primitives():
     """Test JSON serialization preserves primitives."""
     obj = {"string": "value", "int": 42, "float": 3.14, "bool": True, "none": None}
@@ -524,3 +643,18 @@ async def test_quick_setup_demo_environment_creates_integrations():
     pairs = [(i["source"], i["target"]) for i in integrations]
     assert ("BNI", "BNP") in pairs
     assert ("BNP", "AXIS") in pairs
+
+
+@pytest.mark.asyncio
+async def test_quick_setup_demo_environment_reuses_constants():
+    """Test repeated demo setups leave the shared demo config untouched."""
+    expected_domains = dict(DEMO_DOMAINS)
+    expected_integrations = [dict(i) for i in DEMO_INTEGRATIONS]
+
+    for _ in range(2):
+        results = await quick_setup_demo_environment(GovernanceManager())
+        assert results["domains_created"] == len(DEMO_DOMAINS)
+        assert results["integrations_created"] == len(DEMO_INTEGRATIONS)
+
+    assert dict(DEMO_DOMAINS) == expected_domains
+    assert [dict(i) for i in DEMO_INTEGRATIONS] == expected_integrations
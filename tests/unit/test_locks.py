@@ -0,0 +1,42 @@
+"""Unit tests for asyncio locking utilities."""
+
+import asyncio
+
+from src.utils.locks import LazyAsyncLock
+
+
+def _contend(lock, order):
+    """Run two coroutines that contend for the lock in a fresh loop."""
+
+    async def worker(name):
+        async with lock:
+            order.append(f"{name}-in")
+            await asyncio.sleep(0.01)
+            order.append(f"{name}-out")
+
+    async def main():
+        await asyncio.gather(worker("a"), worker("b"))
+
+    asyncio.run(main())
+
+
+def test_lazy_async_lock_serializes_holders():
+    """Test the lock admits one holder at a time."""
+    lock = LazyAsyncLock()
+    order = []
+
+    _contend(lock, order)
+
+    assert order == ["a-in", "a-out", "b-in", "b-out"]
+    assert not lock.locked()
+
+
+def test_lazy_async_lock_survives_new_event_loop():
+    """Test the same lock works under contention in successive loops."""
+    lock = LazyAsyncLock()
+    order = []
+
+    _contend(lock, order)
+    _contend(lock, order)
+
+    assert len(order) == 8
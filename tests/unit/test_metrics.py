@@ -32,6 +32,13 @@ def test_metrics_timing(metrics_collector):
     assert stats["min"] == 1.0
     assert stats["max"] == 2.0
     assert stats["avg"] == pytest.approx(1.5, rel=0.01)
+    assert stats["sum"] == pytest.approx(4.5)
+
+
+def test_metrics_timing_unknown_name(metrics_collector):
+    """Test timing stats for a metric that was never recorded."""
+    stats = metrics_collector.get_timing_stats("missing")
+    assert stats == {"min": 0, "max": 0, "avg": 0, "sum": 0, "count": 0}
 
 
 def test_metrics_timer_context_manager(metrics_collector):
@@ -73,3 +80,14 @@ def test_metrics_reset(metrics_collector):
     assert len(all_metrics["counters"]) == 0
     assert len(all_metrics["gauges"]) == 0
     assert len(all_metrics["timings"]) == 0
+
+
+def test_metrics_history_bounded(metrics_collector):
+    """Test metric history keeps only the most recent entries."""
+    max_history = metrics_collector.max_history
+    for i in range(max_history + 5):
+        metrics_collector.gauge("test.gauge", i)
+
+    assert len(metrics_collector.metrics_history) == max_history
+    assert metrics_collector.metrics_history[0].value == 5
+    assert metrics_collector.metrics_history[-1].value == max_history + 4
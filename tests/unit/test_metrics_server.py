@@ -3,7 +3,12 @@
 import pytest
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from aiohttp import web
-from aiohttp.test_utils import AioHTTPTestCase
+from aiohttp.test_utils import (
+    AioHTTPTestCase,
+    TestClient,
+    TestServer,
+    make_mocked_request,
+)
 
 from src.monitoring.metrics_server import MetricsServer
 from src.monitoring.health_checker import HealthChecker
@@ -71,6 +76,18 @@ class TestMetricsServer(AioHTTPTestCase):
             assert "/metrics" in text
             assert "/health" in text
 
+    async def test_handle_index_not_modified(self):
+        """Test index endpoint honors If-None-Match with a 304."""
+        async with self.client.request("GET", "/") as resp:
+            etag = resp.headers["ETag"]
+            assert "max-age" in resp.headers["Cache-Control"]
+
+        async with self.client.request(
+            "GET", "/", headers={"If-None-Match": etag}
+        ) as resp:
+            assert resp.status == 304
+            assert await resp.read() == b""
+
     @patch("src.monitoring.metrics_server.PrometheusExporter")
     async def test_handle_metrics_basic(self, mock_prometheus_class):
         """Test /metrics endpoint with basic metrics."""
@@ -88,6 +105,51 @@ class TestMetricsServer(AioHTTPTestCase):
             text = await resp.text()
             assert "test_metric 42" in text
 
+    async def test_handle_metrics_not_modified(self):
+        """Test /metrics supports ETag revalidation and HEAD."""
+        mock_prom = Mock()
+        mock_prom.export_metrics.return_value = "# Basic metrics\ntest_metric 42"
+        self.metrics_server.prometheus = mock_prom
+
+        async with self.client.request("GET", "/metrics") as resp:
+            assert resp.status == 200
+            etag = resp.headers["ETag"]
+
+        async with self.client.request(
+            "GET", "/metrics", headers={"If-None-Match": etag}
+        ) as resp:
+            assert resp.status == 304
+            assert await resp.read() == b""
+
+        async with self.client.request("HEAD", "/metrics") as resp:
+            assert resp.status == 200
+            assert resp.headers["ETag"] == etag
+            assert int(resp.headers["Content-Length"]) > 0
+
+        assert mock_prom.export_metrics.call_count == 1
+
+    async def test_handle_metrics_gzip(self):
+        """Test /metrics endpoint compresses when the scraper accepts gzip."""
+        mock_prom = Mock()
+        mock_prom.export_metrics.return_value = "# Basic metrics\ntest_metric 42"
+        self.metrics_server.prometheus = mock_prom
+
+        async with self.client.request(
+            "GET", "/metrics", headers={"Accept-Encoding": "gzip"}
+        ) as resp:
+            assert resp.status == 200
+            assert resp.headers["Content-Encoding"] == "gzip"
+            text = await resp.text()
+            assert "test_metric 42" in text
+
+        async with self.client.request(
+            "GET", "/metrics", headers={"Accept-Encoding": "identity"}
+        ) as resp:
+            assert resp.status == 200
+            assert "Content-Encoding" not in resp.headers
+            text = await resp.text()
+            assert "test_metric 42" in text
+
     @patch("src.monitoring.metrics_server.PrometheusExporter")
     async def test_handle_metrics_with_bot_callback(self, mock_prometheus_class):
         """Test /metrics endpoint with bot status callback."""
@@ -293,6 +355,42 @@ class TestMetricsServer(AioHTTPTestCase):
             data = await resp.json()
             assert data["status"] == "error"
 
+    async def test_health_responses_cached(self):
+        """Test repeated probes reuse the rendered response within the TTL."""
+        bot_callback = Mock(return_value=[{"bot_id": "bot1", "status": "running"}])
+        self.metrics_server.set_bot_status_callback(bot_callback)
+
+        for _ in range(3):
+            async with self.client.request("GET", "/health/ready") as resp:
+                assert resp.status == 200
+                data = await resp.json()
+                assert data["ready"] is True
+
+        assert bot_callback.call_count == 1
+        assert self.health_checker.readiness_check.call_count == 1
+
+        self.metrics_server._response_cache.clear()
+
+        async with self.client.request("GET", "/health/ready") as resp:
+            assert resp.status == 200
+
+        assert bot_callback.call_count == 2
+
+    async def test_health_errors_not_cached(self):
+        """Test failed health renders are retried on the next request."""
+        self.health_checker.detailed_health_check.side_effect = [
+            Exception("Health check failed"),
+            {"status": "healthy"},
+        ]
+
+        async with self.client.request("GET", "/health") as resp:
+            assert resp.status == 503
+
+        async with self.client.request("GET", "/health") as resp:
+            assert resp.status == 200
+            data = await resp.json()
+            assert data["status"] == "healthy"
+
     async def test_set_callbacks(self):
         """Test setting bot and governance callbacks."""
         bot_callback = lambda: [{"bot_id": "test"}]
@@ -327,6 +425,23 @@ class TestMetricsServer(AioHTTPTestCase):
         result = await self.metrics_server._get_bot_statuses()
         assert result == [{"bot_id": "bot1"}]
 
+    async def test_get_bot_statuses_sync_callback_off_loop(self):
+        """Test synchronous callbacks run outside the event loop thread."""
+        import threading
+
+        loop_thread = threading.get_ident()
+        callback_threads = []
+
+        def sync_callback():
+            callback_threads.append(threading.get_ident())
+            return [{"bot_id": "bot1"}]
+
+        self.metrics_server.set_bot_status_callback(sync_callback)
+
+        result = await self.metrics_server._get_bot_statuses()
+        assert result == [{"bot_id": "bot1"}]
+        assert callback_threads and callback_threads[0] != loop_thread
+
     async def test_get_governance_dashboard_no_callback(self):
         """Test _get_governance_dashboard with no callback set."""
         result = await self.metrics_server._get_governance_dashboard()
@@ -375,3 +490,61 @@ async def test_server_start_stop():
 
     # Verify cleanup was called
     # (We can't easily check if runner.cleanup() was called without more mocking)
+
+
+@pytest.mark.asyncio
+async def test_server_refreshes_health_snapshots():
+    """Test the background task keeps probe snapshots cached while running."""
+    import asyncio
+
+    metrics_collector = MetricsCollector()
+    server = MetricsServer(
+        metrics_collector=metrics_collector,
+        health_checker=HealthChecker(),
+        port=19998,
+        host="127.0.0.1",
+        refresh_interval=0.05,
+    )
+    bot_callback = Mock(return_value=[{"name": "bot1", "status": "running"}])
+    server.set_bot_status_callback(bot_callback)
+
+    await server.start()
+    try:
+        await asyncio.sleep(0.2)
+        assert bot_callback.call_count >= 4
+
+        # Probes read the snapshot instead of calling back into bot state
+        calls = bot_callback.call_count
+        response = await server.handle_readiness(
+            make_mocked_request("GET", "/health/ready")
+        )
+        assert response.status == 200
+        assert bot_callback.call_count == calls
+    finally:
+        await server.stop()
+
+    assert server._refresh_task is None
+
+
+@pytest.mark.asyncio
+async def test_handle_metrics_streams_when_uncached():
+    """Test /metrics streams sections when response caching is disabled."""
+    server = MetricsServer(
+        metrics_collector=MetricsCollector(),
+        health_checker=HealthChecker(),
+        cache_ttl=0,
+    )
+    mock_prom = Mock()
+    mock_prom.export_metrics.return_value = "# Basic metrics"
+    mock_prom.get_bot_metrics.return_value = "bot_count 1"
+    server.prometheus = mock_prom
+    server.set_bot_status_callback(lambda: [{"name": "bot1", "status": "running"}])
+
+    async with TestClient(TestServer(server.app)) as client:
+        resp = await client.get("/metrics")
+        assert resp.status == 200
+        assert await resp.text() == "# Basic metrics\nbot_count 1"
+
+        mock_prom.export_metrics.side_effect = Exception("Export failed")
+        resp = await client.get("/metrics")
+        assert resp.status == 500
@@ -52,6 +52,31 @@ def test_prometheus_exporter_bot_metrics():
     assert "pipe_bot_errors_total" in output
 
 
+def test_prometheus_exporter_bot_metrics_grouped_by_family():
+    """Test each bot metric family lists every bot under its own banner."""
+    exporter = PrometheusExporter(MetricsCollector())
+
+    output = exporter.get_bot_metrics(
+        [
+            {"name": "a", "status": "running", "task_count": 3},
+            {"name": "b", "status": "stopped", "error_count": 1},
+        ]
+    )
+    samples = [line for line in output.splitlines() if line.startswith("pipe_")]
+
+    assert samples == [
+        'pipe_bot_status{bot="a",status="running"} 1',
+        'pipe_bot_status{bot="b",status="stopped"} 0',
+        'pipe_bot_uptime_seconds{bot="a"} 0',
+        'pipe_bot_uptime_seconds{bot="b"} 0',
+        'pipe_bot_tasks_total{bot="a"} 3',
+        'pipe_bot_tasks_total{bot="b"} 0',
+        'pipe_bot_errors_total{bot="a"} 0',
+        'pipe_bot_errors_total{bot="b"} 1',
+    ]
+    assert output.count("# TYPE") == 4
+
+
 def test_prometheus_exporter_governance_metrics():
     """Test governance metrics export."""
     metrics = MetricsCollector()
@@ -86,6 +111,30 @@ def test_prometheus_exporter_sanitize_names():
     assert exporter._sanitize_metric_name("test-metric") == "test_metric"
     assert exporter._sanitize_metric_name("123metric") == "_123metric"
     assert exporter._sanitize_metric_name("test metric") == "test_metric"
+    assert exporter._sanitize_metric_name("Test.Métric") == "test_m_tric"
+
+
+def test_prometheus_exporter_name_cache_bounded(monkeypatch):
+    """Test sanitized names are memoized and the cache stays bounded."""
+    from src.monitoring import prometheus_exporter
+
+    monkeypatch.setattr(prometheus_exporter, "_CACHE_MAX_ENTRIES", 2)
+    exporter = PrometheusExporter(MetricsCollector())
+
+    assert exporter._sanitize_metric_name("a.b") == "a_b"
+    assert exporter._sanitize_cache == {"a.b": "a_b"}
+    assert exporter._sanitize_metric_name("a.b") == "a_b"
+
+    exporter._sanitize_metric_name("c.d")
+    exporter._sanitize_metric_name("e.f")
+    assert exporter._sanitize_cache == {"e.f": "e_f"}
+
+    assert exporter._format_labels({"bot": "x", "env": "prod"}) == (
+        'bot="x",env="prod"'
+    )
+    assert exporter._format_labels({"env": "prod", "bot": "x"}) == (
+        'env="prod",bot="x"'
+    )
 
 
 def test_health_checker_liveness():
@@ -174,6 +223,48 @@ def test_health_checker_degraded_compliance():
     assert len(result["issues"]) > 0
 
 
+@pytest.mark.parametrize(
+    "compliance_pct, expected",
+    [
+        (29.9, HealthStatus.UNHEALTHY),
+        (30.0, HealthStatus.DEGRADED),
+        (49.9, HealthStatus.DEGRADED),
+        (50.0, HealthStatus.HEALTHY),
+    ],
+)
+def test_health_checker_compliance_bands(compliance_pct, expected):
+    """Test compliance thresholds map to health status bands."""
+    checker = HealthChecker()
+
+    result = checker.detailed_health_check(
+        governance_dashboard={"compliance": {"ecosystem_percentage": compliance_pct}}
+    )
+
+    assert result["components"]["governance"]["status"] == expected.value
+    assert result["status"] == expected.value
+
+
+def test_health_checker_worst_status_wins():
+    """Test overall status is the most severe component status."""
+    checker = HealthChecker()
+
+    bot_statuses = [{"name": "bot1", "status": "stopped", "error_count": 0}]
+    governance_dashboard = {
+        "ecosystem": {},
+        "compliance": {"ecosystem_percentage": 45.0},
+        "reviews": {"pending": 0},
+    }
+
+    result = checker.detailed_health_check(
+        bot_statuses=bot_statuses, governance_dashboard=governance_dashboard
+    )
+
+    assert result["components"]["bots"]["status"] == HealthStatus.UNHEALTHY.value
+    assert result["components"]["governance"]["status"] == HealthStatus.DEGRADED.value
+    assert result["status"] == HealthStatus.UNHEALTHY.value
+    assert len(result["issues"]) == 2
+
+
 def test_health_checker_history():
     """Test health check history tracking."""
     checker = HealthChecker()
@@ -190,6 +281,31 @@ def test_health_checker_history():
     assert "status_distribution" in summary
 
 
+def test_health_checker_history_bounded():
+    """Test health check history keeps only the most recent entries."""
+    checker = HealthChecker()
+
+    for i in range(checker.max_history + 10):
+        checker.detailed_health_check(
+            bot_statuses=[{"name": "bot", "status": "running", "error_count": i}]
+        )
+
+    assert len(checker.health_history) == checker.max_history
+
+    history = checker.get_health_history(limit=3)
+    assert len(history) == 3
+    assert history[-1] == checker.health_history[-1]._asdict()
+    assert set(history[-1]) == {"timestamp", "status", "issue_count"}
+
+    # Checks with more than 100 bot errors are degraded; evicted ones drop out
+    summary = checker.get_health_summary()
+    assert summary["status_distribution"] == {
+        HealthStatus.HEALTHY.value: 91,
+        HealthStatus.DEGRADED.value: 9,
+    }
+    assert summary["healthy_percentage"] == 91
+
+
 def test_json_formatter():
     """Test JSON log formatter."""
     formatter = JSONFormatter()
@@ -0,0 +1,225 @@
+"""Unit tests for the OpenBao client."""
+
+import asyncio
+import base64
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.integrations import openbao_client
+from src.integrations.openbao_client import OpenBaoClient
+
+
+async def test_get_openbao_client_concurrent_calls_share_instance(monkeypatch):
+    """Test concurrent first calls create and authenticate a single client."""
+    monkeypatch.setattr(openbao_client, "_openbao_client", None)
+    authenticated = []
+
+    async def fake_authenticate(self, *args, **kwargs):
+        authenticated.append(self)
+        await asyncio.sleep(0.01)
+        return True
+
+    monkeypatch.setattr(OpenBaoClient, "authenticate_kubernetes", fake_authenticate)
+
+    first, second = await asyncio.gather(
+        openbao_client.get_openbao_client(kubernetes_role="pipe"),
+        openbao_client.get_openbao_client(kubernetes_role="pipe"),
+    )
+
+    assert first is second
+    assert authenticated == [first]
+
+
+def _b64(text):
+    return base64.b64encode(text.encode()).decode()
+
+
+def _client_with_response(status, body):
+    """Create a client whose requests return a canned transit response."""
+    client = OpenBaoClient(address="http://bao.test", token="t")
+    requests = []
+
+    async def fake_request(method, url, retry=True, **kwargs):
+        requests.append((method, url, kwargs))
+        return status, body
+
+    client._request = fake_request
+    return client, requests
+
+
+async def test_decrypt_many_maps_partial_failures_per_item():
+    """Test one failed item does not void the rest of the batch."""
+    client, requests = _client_with_response(
+        200,
+        {
+            "data": {
+                "batch_results": [
+                    {"plaintext": _b64("first")},
+                    {"error": "cipher: message authentication failed"},
+                    {"plaintext": _b64("third")},
+                ]
+            }
+        },
+    )
+
+    result = await client.decrypt_many(["vault:v1:a", "vault:v1:bad", "vault:v1:c"])
+
+    assert result == ["first", None, "third"]
+    payload = requests[0][2]["json"]
+    assert payload["partial_failure_response_code"] == 200
+    assert len(payload["batch_input"]) == 3
+
+
+async def test_decrypt_many_reads_batch_results_on_400():
+    """Test per-item results are used when the server answers 400."""
+    client, _ = _client_with_response(
+        400,
+        {
+            "errors": ["partial failure"],
+            "data": {"batch_results": [{"plaintext": _b64("ok")}, {"error": "bad"}]},
+        },
+    )
+
+    assert await client.decrypt_many(["vault:v1:a", "vault:v1:bad"]) == ["ok", None]
+
+
+async def test_decrypt_many_request_error_fails_every_item():
+    """Test a response without batch results fails the whole batch."""
+    client, _ = _client_with_response(403, {"errors": ["permission denied"]})
+
+    assert await client.decrypt_many(["vault:v1:a", "vault:v1:b"]) == [None, None]
+    assert await client.decrypt("vault:v1:a") is None
+
+
+async def test_encrypt_many_maps_partial_failures_per_item():
+    """Test one failed plaintext does not void the rest of the batch."""
+    client, requests = _client_with_response(
+        200,
+        {
+            "data": {
+                "batch_results": [
+                    {"ciphertext": "vault:v1:aaa"},
+                    {"error": "failed to encrypt the plaintext"},
+                ]
+            }
+        },
+    )
+
+    result = await client.encrypt_many(["first", "second"])
+
+    assert result == ["vault:v1:aaa", None]
+    payload = requests[0][2]["json"]
+    assert payload["partial_failure_response_code"] == 200
+    assert payload["batch_input"][0] == {"plaintext": _b64("first")}
+
+
+async def test_encrypt_many_request_error_fails_every_item():
+    """Test a response without batch results fails the whole batch."""
+    client, _ = _client_with_response(404, {"errors": ["no handler for route"]})
+
+    assert await client.encrypt_many(["first", "second"]) == [None, None]
+    assert await client.encrypt("first") is None
+
+
+async def test_encrypt_many_splits_into_transit_batches(monkeypatch):
+    """Test plaintexts are chunked per batch and empty input sends nothing."""
+    monkeypatch.setattr(openbao_client, "_TRANSIT_BATCH_SIZE", 2)
+    client = OpenBaoClient(address="http://bao.test", token="t")
+    batch_sizes = []
+
+    async def fake_request(method, url, retry=True, **kwargs):
+        batch = kwargs["json"]["batch_input"]
+        batch_sizes.append(len(batch))
+        results = [{"ciphertext": f"vault:v1:{item['plaintext']}"} for item in batch]
+        return 200, {"data": {"batch_results": results}}
+
+    client._request = fake_request
+
+    assert await client.encrypt_many([]) == []
+    assert batch_sizes == []
+
+    result = await client.encrypt_many(["a", "b", "c"])
+
+    assert result == [f"vault:v1:{_b64(text)}" for text in "abc"]
+    assert batch_sizes == [2, 1]
+    assert await client.encrypt("a") == f"vault:v1:{_b64('a')}"
+
+
+@pytest.fixture
+async def flaky_openbao(monkeypatch):
+    """Run a fake OpenBao whose first secret read is rate limited."""
+    monkeypatch.setattr(openbao_client, "_shared_connector", None)
+    hits = []
+
+    async def read(request):
+        hits.append(request.headers.get("X-Vault-Token"))
+        if len(hits) == 1:
+            return web.json_response({"errors": ["rate limited"]}, status=429)
+        return web.json_response({"data": {"data": {"password": "s3cret"}}})
+
+    app = web.Application()
+    app.router.add_get("/v1/secret/data/app", read)
+    server = TestServer(app)
+    await server.start_server()
+    client = OpenBaoClient(
+        address=str(server.make_url("")).rstrip("/"),
+        token="t",
+        retry_base_delay=0.001,
+    )
+    yield client, hits
+    await client.close()
+    await openbao_client._shared_connector.close()
+    await server.close()
+
+
+async def test_read_secret_retries_and_caches(flaky_openbao):
+    """Test transient errors are retried and the secret is then cached."""
+    client, hits = flaky_openbao
+
+    assert await client.read_secret("secret/data/app") == {"password": "s3cret"}
+    assert await client.read_secret("secret/data/app") == {"password": "s3cret"}
+    assert len(hits) == 2
+
+    client.invalidate("secret/data/app")
+    await client.read_secret("secret/data/app")
+    assert len(hits) == 3
+
+
+def _client_with_kv(**kwargs):
+    """Create a client backed by an in-memory KV store that counts reads."""
+    client = OpenBaoClient(address="http://bao.test", token="t", **kwargs)
+    client.store = {"value": "old"}
+    client.reads = 0
+
+    async def fake_request(method, url, retry=True, **request_kwargs):
+        if method == "GET":
+            client.reads += 1
+            return 200, {"data": dict(client.store), "lease_duration": 3600}
+        # A read racing with the write sees the value from before it
+        await client.read_secret("secret/app")
+        client.store = request_kwargs["json"]
+        return 204, ""
+
+    client._request = fake_request
+    return client
+
+
+async def test_write_secret_drops_value_cached_during_write():
+    """Test a read racing with a write does not leave the old value cached."""
+    client = _client_with_kv()
+
+    assert await client.write_secret("secret/app", {"value": "new"}) is True
+    assert await client.read_secret("secret/app") == {"value": "new"}
+    assert client.reads == 2
+
+
+async def test_secret_cache_ttl_zero_skips_leased_secrets():
+    """Test a zero cache TTL disables caching even for leased secrets."""
+    client = _client_with_kv(secret_cache_ttl=0)
+
+    await client.read_secret("secret/app")
+    await client.read_secret("secret/app")
+
+    assert client.reads == 2
@@ -0,0 +1,162 @@
+"""Unit tests for the PR-QUEST client."""
+
+import asyncio
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.integrations import pr_quest_client
+from src.integrations.pr_quest_client import PRQuestClient
+
+
+async def test_get_pr_quest_client_concurrent_calls_share_instance(monkeypatch):
+    """Test concurrent first calls create and initialize a single client."""
+    monkeypatch.setattr(pr_quest_client, "_pr_quest_client_instance", None)
+    initialized = []
+
+    async def fake_initialize(self):
+        initialized.append(self)
+        await asyncio.sleep(0.01)
+        return True
+
+    monkeypatch.setattr(PRQuestClient, "initialize", fake_initialize)
+
+    first, second = await asyncio.gather(
+        pr_quest_client.get_pr_quest_client(), pr_quest_client.get_pr_quest_client()
+    )
+
+    assert first is second
+    assert initialized == [first]
+
+
+def _client_with_responses(responses):
+    """Create a client whose requests return canned responses by endpoint."""
+    client = PRQuestClient(base_url="http://pr-quest.test")
+    calls = []
+
+    async def fake_request(method, endpoint, **kwargs):
+        calls.append(endpoint)
+        return responses[endpoint]
+
+    client._request = fake_request
+    return client, calls
+
+
+async def test_review_steps_and_export_not_cached_while_running():
+    """Test results of an unfinished analysis are fetched again."""
+    client, calls = _client_with_responses(
+        {
+            "/api/analyze/a1/status": {"status": "running", "progress": 40},
+            "/api/analyze/a1/steps": {"steps": []},
+            "/api/analyze/a1/export": "# Partial review",
+        }
+    )
+
+    await client.get_analysis_status("a1")
+    for _ in range(2):
+        await client.get_review_steps("a1")
+        assert await client.export_markdown("a1") == "# Partial review"
+
+    assert calls.count("/api/analyze/a1/steps") == 2
+    assert calls.count("/api/analyze/a1/export") == 2
+
+
+async def test_review_steps_and_export_cached_once_completed():
+    """Test results of a completed analysis are served from the cache."""
+    client, calls = _client_with_responses(
+        {
+            "/api/analyze/a1/status": {"status": "completed", "progress": 100},
+            "/api/analyze/a1/steps": {"steps": []},
+            "/api/analyze/a1/export": "# Review",
+        }
+    )
+
+    await client.get_analysis_status("a1")
+    for _ in range(2):
+        await client.get_review_steps("a1")
+        assert await client.export_markdown("a1") == "# Review"
+
+    assert calls.count("/api/analyze/a1/steps") == 1
+    assert calls.count("/api/analyze/a1/export") == 1
+
+
+_ANALYSIS = {
+    "analysis_id": "ana_1",
+    "pr_url": "https://github.com/bsw-arch/PIPE/pull/1",
+    "pr_number": 1,
+    "repository": "bsw-arch/PIPE",
+    "analyzed_at": 1705507200,
+    "analysis_duration_seconds": 1.0,
+}
+
+
+async def test_analyze_pr_coalesces_concurrent_calls():
+    """Test concurrent analyses of the same PR share one request."""
+    client = PRQuestClient(base_url="http://pr-quest.test")
+    calls = []
+
+    async def fake_request(method, endpoint, **kwargs):
+        calls.append(endpoint)
+        await asyncio.sleep(0.01)
+        return dict(_ANALYSIS)
+
+    client._request = fake_request
+    pr_url = _ANALYSIS["pr_url"]
+
+    first, second = await asyncio.gather(
+        client.analyze_pr(pr_url), client.analyze_pr(pr_url)
+    )
+
+    assert first is second
+    assert calls == ["/api/analyze"]
+    assert client._inflight == {}
+
+    await client.analyze_pr(pr_url)
+    assert len(calls) == 2
+
+
+@pytest.fixture
+async def rate_limited_pr_quest():
+    """Run a fake PR-QUEST whose first status call is rate limited."""
+    hits = []
+
+    async def health(request):
+        return web.json_response({"status": "ok"})
+
+    async def status(request):
+        hits.append(request.path)
+        if len(hits) == 1:
+            return web.json_response(
+                {"error": "slow down"}, status=429, headers={"Retry-After": "2"}
+            )
+        return web.json_response({"status": "running"})
+
+    app = web.Application()
+    app.router.add_get("/api/health", health)
+    app.router.add_get("/api/analyze/{analysis_id}/status", status)
+    server = TestServer(app)
+    await server.start_server()
+    client = PRQuestClient(
+        base_url=str(server.make_url("")), base_backoff=0.001, max_backoff=5.0
+    )
+    yield client, hits
+    await client.cleanup()
+    await server.close()
+
+
+async def test_request_honors_retry_after(rate_limited_pr_quest, monkeypatch):
+    """Test a 429 Retry-After delay is used instead of the shorter backoff."""
+    client, hits = rate_limited_pr_quest
+    sleeps = []
+    real_sleep = asyncio.sleep
+
+    async def recording_sleep(delay, *args, **kwargs):
+        sleeps.append(delay)
+        await real_sleep(0)
+
+    monkeypatch.setattr(pr_quest_client.asyncio, "sleep", recording_sleep)
+
+    assert await client.get_analysis_status("a1") == {"status": "running"}
+    assert len(hits) == 2
+    assert 2.0 in sleeps
@@ -0,0 +1,59 @@
+"""Unit tests for PR-QUEST data models."""
+
+from src.integrations.pr_quest_models import (
+    PRAnalysisResult,
+    Risk,
+    RiskLevel,
+    RiskType,
+)
+
+
+def _risk(risk_id, risk_type, severity):
+    return Risk(
+        id=risk_id,
+        type=risk_type,
+        severity=severity,
+        description="test risk",
+        confidence=0.9,
+    )
+
+
+def _analysis(risks):
+    return PRAnalysisResult(
+        analysis_id="ana_1",
+        pr_url="https://github.com/bsw-arch/PIPE/pull/1",
+        pr_number=1,
+        repository="bsw-arch/PIPE",
+        risks=risks,
+        analyzed_at=1705507200,
+        analysis_duration_seconds=1.0,
+    )
+
+
+def test_analysis_result_risk_queries():
+    """Test risk lookups by severity and type."""
+    secret = _risk("r1", RiskType.SECURITY, RiskLevel.CRITICAL)
+    docs = _risk("r2", RiskType.DOCUMENTATION, RiskLevel.LOW)
+    result = _analysis([secret, docs])
+
+    assert result.overall_risk_level == RiskLevel.CRITICAL
+    assert result.has_critical_risks()
+    assert not result.has_moderate_risks()
+    assert result.get_risks_by_type(RiskType.SECURITY) == [secret]
+    assert result.get_risks_by_type(RiskType.TESTING) == []
+
+
+def test_analysis_result_risk_queries_follow_updates():
+    """Test risk lookups reflect copies and mutation of the risk list."""
+    result = _analysis([_risk("r1", RiskType.SECURITY, RiskLevel.CRITICAL)])
+    assert result.has_critical_risks()
+
+    assert not result.model_copy(update={"risks": []}).has_critical_risks()
+
+    result.risks.append(_risk("r2", RiskType.PERFORMANCE, RiskLevel.MODERATE))
+    assert result.has_moderate_risks()
+    assert len(result.get_risks_by_type(RiskType.PERFORMANCE)) == 1
+
+    result.risks = []
+    assert not result.has_critical_risks()
+    assert result.get_risks_by_type(RiskType.SECURITY) == []
@@ -2,7 +2,9 @@
 
 import pytest
 import asyncio
-from src.utils.retry import retry_async
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from src.utils.retry import jittered_backoff, parse_retry_after, retry_async
 
 
 class CustomError(Exception):
@@ -175,3 +177,23 @@ async def test_retry_async_with_zero_delay():
     result = await instant_retry()
     assert result == "success"
     assert call_count == 3
+
+
+def test_jittered_backoff_bounds():
+    """Test that jittered backoff grows exponentially up to the cap."""
+    for attempt in range(10):
+        delay = jittered_backoff(attempt, base=0.1, cap=2.0)
+        assert 0 <= delay <= min(2.0, 0.1 * 2**attempt)
+
+
+def test_parse_retry_after():
+    """Test parsing Retry-After delay seconds and HTTP-dates."""
+    assert parse_retry_after("120") == 120.0
+    assert parse_retry_after(" 3 ") == 3.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+    future = datetime.now(timezone.utc) + timedelta(seconds=60)
+    delay = parse_retry_after(format_datetime(future, usegmt=True))
+    assert 55 <= delay <= 60
@@ -0,0 +1,292 @@
+"""Unit tests for the Zitadel client."""
+
+import asyncio
+import json
+import time
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.integrations import zitadel_client
+from src.integrations.zitadel_client import ZitadelClient
+
+
+@pytest.fixture(autouse=True)
+def reset_zitadel_globals(monkeypatch):
+    """Isolate the singleton and shared connection pools per test."""
+    monkeypatch.setattr(zitadel_client, "_zitadel_client", None)
+    monkeypatch.setattr(zitadel_client, "_shared_connector", None)
+    monkeypatch.setattr(zitadel_client, "_introspection_connector", None)
+
+
+class FakeZitadel:
+    """Minimal Zitadel API recording the requests it receives."""
+
+    def __init__(self):
+        self.hits = {}
+        self.requests = []
+        self.grants = []
+        self.grant_status = 200
+        self.apply_role_filter = True
+        self.jwks = {"keys": []}
+        self.app = web.Application()
+        self.app.router.add_post("/oauth/v2/token", self.token)
+        self.app.router.add_post("/oauth/v2/introspect", self.introspect)
+        self.app.router.add_get("/oauth/v2/keys", self.keys)
+        self.app.router.add_post(
+            "/management/v1/users/{user_id}/grants/_search", self.grant_search
+        )
+
+    def _hit(self, name):
+        self.hits[name] = self.hits.get(name, 0) + 1
+
+    async def token(self, request):
+        self._hit("token")
+        return web.json_response({"access_token": "service-token", "expires_in": 3600})
+
+    async def introspect(self, request):
+        self._hit("introspect")
+        form = await request.post()
+        return web.json_response({"active": form["token"] != "revoked", "sub": "u1"})
+
+    async def keys(self, request):
+        self._hit("keys")
+        return web.json_response(self.jwks)
+
+    async def grant_search(self, request):
+        self._hit("grant_search")
+        body = await request.json()
+        self.requests.append(body)
+        if self.grant_status != 200:
+            return web.json_response({"message": "unavailable"}, status=503)
+
+        grants = self.grants
+        if self.apply_role_filter:
+            for query in body.get("queries", []):
+                role_key = query["roleKeyQuery"]["roleKey"]
+                grants = [g for g in grants if role_key in g["roleKeys"]]
+        return web.json_response({"result": grants})
+
+
+@pytest.fixture
+async def fake_zitadel():
+    """Run a fake Zitadel server and a client pointed at it."""
+    fake = FakeZitadel()
+    server = TestServer(fake.app)
+    await server.start_server()
+    issuer = str(server.make_url("")).rstrip("/")
+    fake.client = ZitadelClient(
+        issuer=issuer, client_id="pipe-client", client_secret="secret", project_id="p1"
+    )
+    yield fake
+    await fake.client.close()
+    for connector in (
+        zitadel_client._shared_connector,
+        zitadel_client._introspection_connector,
+    ):
+        if connector is not None:
+            await connector.close()
+    await server.close()
+
+
+async def test_get_zitadel_client_concurrent_calls_share_instance():
+    """Test concurrent first calls create a single client."""
+    first, second = await asyncio.gather(
+        zitadel_client.get_zitadel_client(issuer="https://zitadel.test"),
+        zitadel_client.get_zitadel_client(issuer="https://zitadel.test"),
+    )
+
+    assert first is second
+
+
+async def test_close_zitadel_client_closes_shared_connectors():
+    """Test closing the singleton also closes both shared pools."""
+    client = await zitadel_client.get_zitadel_client(issuer="https://zitadel.test")
+    session = await client._ensure_session()
+    introspect_session = await client._ensure_introspect_session()
+    connectors = (session.connector, introspect_session.connector)
+
+    await zitadel_client.close_zitadel_client()
+
+    assert session.closed and introspect_session.closed
+    assert all(connector.closed for connector in connectors)
+    assert zitadel_client._zitadel_client is None
+    assert zitadel_client._shared_connector is None
+    assert zitadel_client._introspection_connector is None
+
+
+async def test_check_permission_finds_grant_beyond_first_result(fake_zitadel):
+    """Test a matching grant later in the results is not a false deny."""
+    fake_zitadel.apply_role_filter = False
+    fake_zitadel.grants = [{"roleKeys": ["viewer"]}, {"roleKeys": ["admin"]}]
+
+    assert await fake_zitadel.client.check_permission("u1", "admin") is True
+
+    (body,) = fake_zitadel.requests
+    assert body["queries"] == [
+        {
+            "roleKeyQuery": {
+                "roleKey": "admin",
+                "method": "TEXT_QUERY_METHOD_EQUALS",
+            }
+        }
+    ]
+    assert "limit" not in body.get("query", {})
+
+
+async def test_check_permission_denies_without_matching_grant(fake_zitadel):
+    """Test users without the role are denied."""
+    fake_zitadel.grants = [{"roleKeys": ["viewer"]}]
+
+    assert await fake_zitadel.client.check_permission("u1", "admin") is False
+
+
+async def test_check_permission_caches_decisions(fake_zitadel):
+    """Test repeated permission checks are answered from the cache."""
+    fake_zitadel.grants = [{"roleKeys": ["admin"]}]
+    client = fake_zitadel.client
+
+    assert await client.check_permission("u1", "admin") is True
+    assert await client.check_permission("u1", "admin") is True
+    assert await client.check_permission("u1", "viewer") is False
+
+    assert fake_zitadel.hits["grant_search"] == 2
+
+
+async def test_check_permission_errors_not_cached(fake_zitadel):
+    """Test failed permission lookups are retried on the next check."""
+    fake_zitadel.grants = [{"roleKeys": ["admin"]}]
+    fake_zitadel.grant_status = 503
+    client = fake_zitadel.client
+
+    assert await client.check_permission("u1", "admin") is False
+    fake_zitadel.grant_status = 200
+    assert await client.check_permission("u1", "admin") is True
+
+    assert fake_zitadel.hits["grant_search"] == 2
+
+
+async def test_get_access_token_coalesces_and_schedules_refresh(fake_zitadel):
+    """Test concurrent token requests share one fetch and a refresh is set."""
+    client = fake_zitadel.client
+
+    tokens = await asyncio.gather(*(client.get_access_token() for _ in range(5)))
+
+    assert set(tokens) == {"service-token"}
+    assert fake_zitadel.hits["token"] == 1
+    assert client._refresh_handle is not None
+    assert await client.get_access_token() == "service-token"
+    assert fake_zitadel.hits["token"] == 1
+
+
+async def test_verify_token_caches_active_introspection(fake_zitadel):
+    """Test active introspection results are cached and inactive ones not."""
+    client = fake_zitadel.client
+
+    assert (await client.verify_token("opaque-token"))["sub"] == "u1"
+    assert (await client.verify_token("opaque-token"))["sub"] == "u1"
+    assert await client.verify_token("revoked") is None
+    assert await client.verify_token("revoked") is None
+
+    assert fake_zitadel.hits["introspect"] == 3
+
+
+@pytest.fixture
+def signing_key(fake_zitadel):
+    """Publish an RSA signing key in the fake server's JWKS."""
+    jwt = pytest.importorskip("jwt")
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(key.public_key()))
+    jwk.update(kid="k1", alg="RS256", use="sig")
+    fake_zitadel.jwks = {"keys": [jwk]}
+    return key
+
+
+def _make_token(fake_zitadel, key, kid="k1", **claims):
+    """Sign a JWT for the fake issuer."""
+    import jwt
+
+    payload = {
+        "iss": fake_zitadel.client.issuer,
+        "aud": ["p1"],
+        "sub": "u1",
+        "exp": int(time.time()) + 300,
+        **claims,
+    }
+    return jwt.encode(payload, key, algorithm="RS256", headers={"kid": kid})
+
+
+async def test_verify_token_locally_with_jwks(fake_zitadel, signing_key):
+    """Test valid JWTs are verified locally without introspection."""
+    client = fake_zitadel.client
+    token = _make_token(fake_zitadel, signing_key)
+
+    claims = await client.verify_token(token)
+
+    assert claims["sub"] == "u1"
+    assert claims["active"] is True
+    assert await client.verify_token(token) == claims
+    assert fake_zitadel.hits["keys"] == 1
+    assert "introspect" not in fake_zitadel.hits
+
+
+@pytest.mark.parametrize(
+    "claims",
+    [
+        {"exp": int(time.time()) - 10},
+        {"aud": ["other-project"]},
+        {"iss": "https://evil.example"},
+    ],
+    ids=["expired", "wrong-audience", "wrong-issuer"],
+)
+async def test_verify_token_rejects_invalid_claims(fake_zitadel, signing_key, claims):
+    """Test JWTs failing claim checks are rejected without introspection."""
+    token = _make_token(fake_zitadel, signing_key, **claims)
+
+    assert await fake_zitadel.client.verify_token(token) is None
+    assert "introspect" not in fake_zitadel.hits
+
+
+async def test_verify_token_rejects_bad_signature(fake_zitadel, signing_key):
+    """Test JWTs signed by another key under a known kid are rejected."""
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+    other_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    token = _make_token(fake_zitadel, other_key)
+
+    assert await fake_zitadel.client.verify_token(token) is None
+
+
+async def test_verify_token_unknown_kid_falls_back_to_introspection(
+    fake_zitadel, signing_key
+):
+    """Test JWTs signed with an unknown key id are introspected remotely."""
+    client = fake_zitadel.client
+    token = _make_token(fake_zitadel, signing_key, kid="unknown")
+
+    assert (await client.verify_token(token))["sub"] == "u1"
+    assert fake_zitadel.hits["introspect"] == 1
+
+    # The key set is not refetched again within the refetch interval
+    await client.verify_token(_make_token(fake_zitadel, signing_key, kid="other"))
+    assert fake_zitadel.hits["keys"] == 1
+
+
+async def test_verify_token_picks_up_rotated_key(
+    fake_zitadel, signing_key, monkeypatch
+):
+    """Test a key id added by rotation is fetched and used locally."""
+    monkeypatch.setattr(zitadel_client, "_JWKS_REFETCH_INTERVAL", 0.0)
+    client = fake_zitadel.client
+
+    await client.verify_token(_make_token(fake_zitadel, signing_key))
+    fake_zitadel.jwks["keys"][0]["kid"] = "k2"
+
+    claims = await client.verify_token(_make_token(fake_zitadel, signing_key, kid="k2"))
+
+    assert claims["sub"] == "u1"
+    assert fake_zitadel.hits["keys"] == 2
+    assert "introspect" not in fake_zitadel.hits